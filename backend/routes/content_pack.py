@@ -194,6 +194,7 @@ async def generate_content_pack_endpoint(request: GenerateContentPackRequest):
             sheet=sheet,
             tone=request.tone,
             proceed_with_assumptions=request.proceed_with_assumptions,
+            retrieval_cache_path=project_dir / "content_pack_retrieval_cache.json",
         )
         bundle.project_id = request.project_id
     except (RateLimitError, APIStatusError) as e:
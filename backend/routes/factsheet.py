@@ -16,7 +16,7 @@ from pydantic import BaseModel
 
 from pda.classify import classify_document, tag_chunks
 from pda.config import get_settings
-from pda.extract.factsheet_extractor import extract_product_fact_sheet
+from pda.extract.factsheet_extractor import extract_product_fact_sheet_async
 from pda.ingest.pdf_parser import PDFParseError, parse_pdf
 from pda.ingest.chunker import chunk_document
 from pda.llm import get_provider
@@ -138,7 +138,7 @@ async def extract_factsheet(request: FactsheetRequest):
         request.llm_model or "default",
     )
     try:
-        sheet, provenance = extract_product_fact_sheet(store, llm)
+        sheet, provenance = await extract_product_fact_sheet_async(store, llm)
     except (RateLimitError, APIStatusError) as e:
         status_code = getattr(e, "status_code", None)
         err_msg = str(e)
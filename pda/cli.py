@@ -497,6 +497,10 @@ def eval_harness(
     out: str = typer.Option(None, "--out", help="Output directory (default: <project>/eval_output/)"),
     store_backend: str = typer.Option(None, "--store", help="Vector store backend: chroma | pgvector"),
     provider: str = typer.Option(None, help="LLM provider: openai | anthropic"),
+    llm_cache: bool = typer.Option(
+        False, "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM completions from <out>/.llm_cache instead of re-running them",
+    ),
 ):
     """Run the RAG evaluation harness: YAML prompts -> answers with citations -> scored dashboard + CSV."""
     from pda.eval.harness import run_eval_harness
@@ -542,14 +546,20 @@ def eval_harness(
         store.add_chunks(chunks_list)
 
     provider_name = (provider or settings.pda_llm_provider).lower()
+    model = settings.pda_openai_model if provider_name == "openai" else settings.pda_anthropic_model
     llm = get_provider(
         provider_name,
         api_key=settings.openai_api_key if provider_name == "openai" else settings.anthropic_api_key,
-        model=settings.pda_openai_model if provider_name == "openai" else settings.pda_anthropic_model,
+        model=model,
     )
 
     console.print(f"Running eval harness with {prompts}...")
-    results = run_eval_harness(prompts, store, llm, out_dir)
+    results = run_eval_harness(
+        prompts, store, llm, out_dir,
+        max_workers=settings.pda_eval_parallelism,
+        use_llm_cache=llm_cache,
+        llm_model=f"{provider_name}:{model}",
+    )
     console.print(f"Evaluated {len(results)} prompts")
     console.print(f"Results: {out_dir / 'results.csv'}")
     console.print(f"Dashboard: {out_dir / 'dashboard.html'}")
@@ -55,6 +55,9 @@ class Settings(BaseSettings):
     # Max upload size in bytes (default 50 MB)
     max_upload_bytes: int = 50 * 1024 * 1024
 
+    # Eval prompts processed concurrently (each prompt is two LLM round-trips)
+    pda_eval_parallelism: int = 8
+
     @property
     def data_dir(self) -> Path:
         """Get data directory as Path (OS-agnostic).
@@ -0,0 +1,183 @@
+"""Incremental JSON parsing for streamed or truncated LLM output.
+
+``IncrementalJsonParser`` scans input once, in O(n) over all deltas fed to it,
+tracking string/escape state and the stack of open containers.  It can
+
+* hand back each element of a top-level JSON array as soon as that element
+  closes (so a streaming caller can build items before the model finishes), and
+* recover a truncated document by keeping every complete top-level element
+  (array item or object member) and dropping the one that was cut off.
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_right
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
+
+# Characters that can appear in numbers and the literals true / false / null.
+_SCALAR_CHARS = frozenset("+-.0123456789eEtrufalsn")
+_WHITESPACE = frozenset(" \t\r\n")
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class IncrementalJsonParser:
+    """Stateful single-pass JSON scanner; see module docstring."""
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._chunk_starts: list[int] = []
+        self._size = 0
+        # Open containers and, per container, what comes next:
+        # "key" / "colon" / "value" / "comma".
+        self._stack: list[str] = []
+        self._state: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._scalar_start: int | None = None
+        self._item_start: int | None = None
+        self._done = False
+        self._end: int | None = None
+        # Prefix ending at the last complete top-level element, plus the closer it needs.
+        self._safe_end = 0
+        self._safe_closers = ""
+
+    @property
+    def complete(self) -> bool:
+        """True once a full top-level value has been scanned."""
+        return self._done
+
+    @property
+    def end(self) -> int | None:
+        """Offset just past the top-level value once ``complete``, else None."""
+        return self._end
+
+    def feed(self, delta: str) -> list[Any]:
+        """Consume ``delta`` and return top-level array items completed by it."""
+        if not delta:
+            return []
+        base = self._size
+        self._chunk_starts.append(base)
+        self._chunks.append(delta)
+        self._size += len(delta)
+
+        items: list[Any] = []
+        for offset, ch in enumerate(delta):
+            pos = base + offset
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._string_is_key:
+                        self._state[-1] = "colon"
+                    else:
+                        self._end_value(pos + 1, items)
+                continue
+            if self._scalar_start is not None:
+                if ch in _SCALAR_CHARS:
+                    continue
+                self._scalar_start = None
+                self._end_value(pos, items)
+            if ch in _WHITESPACE:
+                continue
+            if ch == '"':
+                self._in_string = True
+                self._string_is_key = bool(self._state) and self._state[-1] == "key"
+                if not self._string_is_key:
+                    self._begin_value(pos)
+            elif ch == "{" or ch == "[":
+                self._begin_value(pos)
+                self._stack.append(ch)
+                self._state.append("key" if ch == "{" else "value")
+                if len(self._stack) == 1:
+                    self._mark_safe(pos + 1)
+            elif ch == "}" or ch == "]":
+                if not self._stack:
+                    continue
+                self._stack.pop()
+                self._state.pop()
+                self._end_value(pos + 1, items)
+            elif ch == ":":
+                if self._state:
+                    self._state[-1] = "value"
+            elif ch == ",":
+                if self._state:
+                    self._state[-1] = "key" if self._stack[-1] == "{" else "value"
+            elif ch in _SCALAR_CHARS:
+                self._begin_value(pos)
+                self._scalar_start = pos
+        return items
+
+    def value(self) -> Any:
+        """Best-effort parse of everything fed so far, or None if nothing is recoverable.
+
+        A trailing number or literal is only included once a delimiter follows it,
+        since ``12`` may be the start of ``123``.
+        """
+        if self._safe_end == 0:
+            return None
+        text = self._slice(0, self._safe_end) + self._safe_closers
+        try:
+            return _loads(text)
+        except ValueError:
+            return None
+
+    # -- internals ---------------------------------------------------------
+
+    def _begin_value(self, pos: int) -> None:
+        if len(self._stack) == 1 and self._stack[0] == "[":
+            self._item_start = pos
+
+    def _end_value(self, end: int, items: list[Any]) -> None:
+        if not self._stack:
+            self._done = True
+            self._end = end
+            self._mark_safe(end)
+            return
+        self._state[-1] = "comma"
+        if len(self._stack) == 1:
+            # Cut only between top-level elements so a truncated element is dropped
+            # whole instead of surfacing half-filled.
+            self._mark_safe(end)
+        if len(self._stack) == 1 and self._stack[0] == "[" and self._item_start is not None:
+            try:
+                items.append(_loads(self._slice(self._item_start, end)))
+            except ValueError:
+                pass
+            self._item_start = None
+
+    def _mark_safe(self, end: int) -> None:
+        self._safe_end = end
+        self._safe_closers = _CLOSERS[self._stack[0]] if self._stack else ""
+
+    def _slice(self, start: int, end: int) -> str:
+        # Join only the chunks overlapping [start, end).
+        parts: list[str] = []
+        for i in range(bisect_right(self._chunk_starts, start) - 1, len(self._chunks)):
+            chunk_start = self._chunk_starts[i]
+            if chunk_start >= end:
+                break
+            parts.append(self._chunks[i][max(start - chunk_start, 0):end - chunk_start])
+        return "".join(parts)
+
+
+def parse_partial(raw: str) -> Any:
+    """Parse ``raw``, recovering the leading complete values if it is truncated."""
+    parser = IncrementalJsonParser()
+    parser.feed(raw)
+    return parser.value()
@@ -0,0 +1,16 @@
+"""Retrieval helpers shared by the content-pack generators."""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Iterable
+
+
+def query_all(store: object, queries: list[str], n_results: int) -> list[list[dict[str, Any]]]:
+    """Run all queries in one ``query_batch`` call; one result list per query, in order."""
+    return store.query_batch(list(queries), n_results=n_results)
+
+
+def ordered_union(*seqs: Iterable[str]) -> list[str]:
+    """Deduplicate ids across sequences, keeping first-seen order, without concatenating them."""
+    return list(dict.fromkeys(chain.from_iterable(seqs)))
@@ -6,7 +6,7 @@ import io
 import json
 import re
 import zipfile
-from typing import Any
+from typing import Any, Iterator
 
 from pda.schemas.web_content_schemas import (
     ComparisonDraft,
@@ -50,122 +50,134 @@ def _format_evidence_section(refs: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def _evidence_for_landing(d: LandingPageDraft) -> list[dict]:
-    refs: list[dict] = []
-    for b in d.benefits:
-        refs.extend(e.model_dump() if hasattr(e, "model_dump") else e for e in b.evidence)
-    for s in d.specs_explained:
-        refs.extend(e.model_dump() if hasattr(e, "model_dump") else e for e in s.evidence)
-    return refs
+def _collect_evidence(dumped: dict[str, Any]) -> dict[str, Any]:
+    """Gather evidence refs for every section in one pass over the dumped drafts.
 
+    Use-case and comparison refs are lists aligned with the draft order.
+    """
+    landing = dumped.get("landing_page") or {}
+    landing_refs: list[dict] = []
+    for b in landing.get("benefits") or []:
+        landing_refs.extend(b.get("evidence") or [])
+    for s in landing.get("specs_explained") or []:
+        landing_refs.extend(s.get("evidence") or [])
 
-def _evidence_for_faq(d: list) -> list[dict]:
-    refs: list[dict] = []
-    for f in d:
-        for e in getattr(f, "evidence", []):
-            refs.append(e.model_dump() if hasattr(e, "model_dump") else e)
-    return refs
+    faq_refs: list[dict] = []
+    for f in dumped.get("faq") or []:
+        faq_refs.extend(f.get("evidence") or [])
 
+    use_case_refs = [list(u.get("evidence") or []) for u in dumped.get("use_case_pages") or []]
 
-def _evidence_for_use_case(u: UseCasePageDraft) -> list[dict]:
-    return [e.model_dump() if hasattr(e, "model_dump") else e for e in u.evidence]
+    comparison_refs: list[list[dict]] = []
+    for c in dumped.get("comparisons") or []:
+        refs: list[dict] = []
+        for d in c.get("dimensions") or []:
+            refs.extend(d.get("evidence") or [])
+        comparison_refs.append(refs)
 
-
-def _evidence_for_comparison(c: ComparisonDraft) -> list[dict]:
-    refs: list[dict] = []
-    for d in c.dimensions:
-        refs.extend(e.model_dump() if hasattr(e, "model_dump") else e for e in d.evidence)
-    return refs
+    return {
+        "landing": landing_refs,
+        "faq": faq_refs,
+        "use_cases": use_case_refs,
+        "comparisons": comparison_refs,
+    }
 
 
-def _landing_page_md(d: LandingPageDraft) -> str:
-    lines: list[str] = []
-    evidence = _evidence_for_landing(d)
-    lines.append(_format_evidence_section(evidence))
-    lines.append("# Landing Page\n\n")
+def _landing_page_md(d: LandingPageDraft, evidence: list[dict]) -> bytes:
+    out = bytearray()
+    out += _format_evidence_section(evidence).encode("utf-8")
+    out += b"# Landing Page\n\n"
     if d.problem_statement:
-        lines.append("## Problem Statement\n\n")
-        lines.append(d.problem_statement + "\n\n")
+        out += b"## Problem Statement\n\n"
+        out += d.problem_statement.encode("utf-8")
+        out += b"\n\n"
     if d.solution_overview:
-        lines.append("## Solution Overview\n\n")
-        lines.append(d.solution_overview + "\n\n")
+        out += b"## Solution Overview\n\n"
+        out += d.solution_overview.encode("utf-8")
+        out += b"\n\n"
     if d.benefits:
-        lines.append("## Benefits\n\n")
+        out += b"## Benefits\n\n"
         for b in d.benefits:
-            lines.append(f"### {b.headline}\n\n")
-            lines.append(b.description + "\n\n")
+            out += f"### {b.headline}\n\n".encode("utf-8")
+            out += b.description.encode("utf-8")
+            out += b"\n\n"
     if d.how_it_works:
-        lines.append("## How It Works\n\n")
-        lines.append(d.how_it_works + "\n\n")
+        out += b"## How It Works\n\n"
+        out += d.how_it_works.encode("utf-8")
+        out += b"\n\n"
     if d.specs_explained:
-        lines.append("## Specifications Explained\n\n")
+        out += b"## Specifications Explained\n\n"
         for s in d.specs_explained:
-            lines.append(f"**{s.spec_name}:** {s.spec_value} {s.unit}\n\n")
-            lines.append(s.plain_language + "\n\n")
+            out += f"**{s.spec_name}:** {s.spec_value} {s.unit}\n\n".encode("utf-8")
+            out += s.plain_language.encode("utf-8")
+            out += b"\n\n"
     if d.call_to_action:
-        lines.append("## Call to Action\n\n")
-        lines.append(d.call_to_action + "\n\n")
-    return "".join(lines)
+        out += b"## Call to Action\n\n"
+        out += d.call_to_action.encode("utf-8")
+        out += b"\n\n"
+    return bytes(out)
 
 
-def _faq_md(d: list) -> str:
-    lines: list[str] = []
-    evidence = _evidence_for_faq(d)
-    lines.append(_format_evidence_section(evidence))
-    lines.append("# FAQ\n\n")
+def _faq_md(d: list, evidence: list[dict]) -> bytes:
+    out = bytearray()
+    out += _format_evidence_section(evidence).encode("utf-8")
+    out += b"# FAQ\n\n"
     for item in d:
         q = getattr(item, "question", "")
         a = getattr(item, "answer", "")
-        lines.append(f"## {q}\n\n")
-        lines.append(a + "\n\n")
-    return "".join(lines)
+        out += f"## {q}\n\n".encode("utf-8")
+        out += a.encode("utf-8")
+        out += b"\n\n"
+    return bytes(out)
 
 
-def _use_case_md(u: UseCasePageDraft) -> str:
-    lines: list[str] = []
-    evidence = _evidence_for_use_case(u)
-    lines.append(_format_evidence_section(evidence))
+def _use_case_md(u: UseCasePageDraft, evidence: list[dict]) -> bytes:
+    out = bytearray()
+    out += _format_evidence_section(evidence).encode("utf-8")
     tag = "[Suggested] " if u.is_suggested else ""
-    lines.append(f"# {tag}{u.title}\n\n")
+    out += f"# {tag}{u.title}\n\n".encode("utf-8")
     if u.problem_context:
-        lines.append("## Problem Context\n\n")
-        lines.append(u.problem_context + "\n\n")
+        out += b"## Problem Context\n\n"
+        out += u.problem_context.encode("utf-8")
+        out += b"\n\n"
     if u.solution_fit:
-        lines.append("## Solution Fit\n\n")
-        lines.append(u.solution_fit + "\n\n")
+        out += b"## Solution Fit\n\n"
+        out += u.solution_fit.encode("utf-8")
+        out += b"\n\n"
     if u.benefits:
-        lines.append("## Benefits\n\n")
+        out += b"## Benefits\n\n"
         for b in u.benefits:
-            lines.append(f"- {b}\n")
-        lines.append("\n")
+            out += f"- {b}\n".encode("utf-8")
+        out += b"\n"
     if u.implementation_notes:
-        lines.append("## Implementation Notes\n\n")
-        lines.append(u.implementation_notes + "\n\n")
-    return "".join(lines)
+        out += b"## Implementation Notes\n\n"
+        out += u.implementation_notes.encode("utf-8")
+        out += b"\n\n"
+    return bytes(out)
 
 
-def _comparison_md(c: ComparisonDraft) -> str:
-    lines: list[str] = []
-    evidence = _evidence_for_comparison(c)
-    lines.append(_format_evidence_section(evidence))
-    lines.append(f"# {c.title}\n\n")
+def _comparison_md(c: ComparisonDraft, evidence: list[dict]) -> bytes:
+    out = bytearray()
+    out += _format_evidence_section(evidence).encode("utf-8")
+    out += f"# {c.title}\n\n".encode("utf-8")
     if c.best_for:
-        lines.append("## Best For\n\n")
+        out += b"## Best For\n\n"
         for b in c.best_for:
-            lines.append(f"- {b}\n")
-        lines.append("\n")
+            out += f"- {b}\n".encode("utf-8")
+        out += b"\n"
     if c.not_ideal_for:
-        lines.append("## Not Ideal For\n\n")
+        out += b"## Not Ideal For\n\n"
         for n in c.not_ideal_for:
-            lines.append(f"- {n}\n")
-        lines.append("\n")
+            out += f"- {n}\n".encode("utf-8")
+        out += b"\n"
     if c.dimensions:
-        lines.append("## Comparison Dimensions\n\n")
-        lines.append("| Dimension | This Product | Generic Alternative |\n")
-        lines.append("|-----------|--------------|---------------------|\n")
+        out += b"## Comparison Dimensions\n\n"
+        out += b"| Dimension | This Product | Generic Alternative |\n"
+        out += b"|-----------|--------------|---------------------|\n"
         for d in c.dimensions:
-            lines.append(f"| {d.dimension} | {d.this_product} | {d.generic_alternative} |\n")
-    return "".join(lines)
+            row = f"| {d.dimension} | {d.this_product} | {d.generic_alternative} |\n"
+            out += row.encode("utf-8")
+    return bytes(out)
 
 
 def _seo_json(d: SEODraft) -> dict[str, Any]:
@@ -177,37 +189,41 @@ def _seo_json(d: SEODraft) -> dict[str, Any]:
     }
 
 
-def build_content_zip(drafts: WebContentDrafts) -> bytes:
-    """Build zip bytes from drafts with Evidence sections in each .md."""
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        drafts_json = json.dumps(
-            drafts.model_dump(mode="json") if hasattr(drafts, "model_dump") else drafts,
-            indent=2,
-            ensure_ascii=False,
-        )
-        zf.writestr("drafts.json", drafts_json.encode("utf-8"))
-
-        zf.writestr(
-            "landing-page.md",
-            _landing_page_md(drafts.landing_page).encode("utf-8"),
-        )
-        zf.writestr("faq.md", _faq_md(drafts.faq).encode("utf-8"))
-
-        for u in drafts.use_case_pages:
-            slug = u.slug or _slugify(u.title)
-            path = f"use-cases/{slug}.md"
-            zf.writestr(path, _use_case_md(u).encode("utf-8"))
-
-        for c in drafts.comparisons:
-            slug = _slugify(c.title)
-            path = f"comparisons/{slug}.md"
-            zf.writestr(path, _comparison_md(c).encode("utf-8"))
-
-        seo_data = _seo_json(drafts.seo)
-        zf.writestr(
-            "seo.json",
-            json.dumps(seo_data, indent=2, ensure_ascii=False).encode("utf-8"),
-        )
+def iter_content_files(drafts: WebContentDrafts) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(archive_path, payload)`` pairs for every file in the content export.
+
+    Files are produced lazily so callers can stream them (e.g. into a streaming
+    zip writer or object-storage upload) without materialising the whole archive.
+    """
+    dumped = drafts.model_dump(mode="json") if hasattr(drafts, "model_dump") else drafts
+    drafts_json = json.dumps(dumped, indent=2, ensure_ascii=False)
+    yield "drafts.json", drafts_json.encode("utf-8")
+    evidence = _collect_evidence(dumped)
+
+    yield "landing-page.md", _landing_page_md(drafts.landing_page, evidence["landing"])
+    yield "faq.md", _faq_md(drafts.faq, evidence["faq"])
 
+    for u, refs in zip(drafts.use_case_pages, evidence["use_cases"]):
+        slug = u.slug or _slugify(u.title)
+        yield f"use-cases/{slug}.md", _use_case_md(u, refs)
+
+    for c, refs in zip(drafts.comparisons, evidence["comparisons"]):
+        slug = _slugify(c.title)
+        yield f"comparisons/{slug}.md", _comparison_md(c, refs)
+
+    seo_data = _seo_json(drafts.seo)
+    yield "seo.json", json.dumps(seo_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def build_content_zip(drafts: WebContentDrafts, compress: bool = True) -> bytes:
+    """Build zip bytes from drafts with Evidence sections in each .md.
+
+    Pass ``compress=False`` to store entries uncompressed (ZIP_STORED) when the
+    archive is re-compressed downstream anyway, e.g. served with gzip encoding.
+    """
+    buf = io.BytesIO()
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(buf, "w", compression) as zf:
+        for path, payload in iter_content_files(drafts):
+            zf.writestr(path, payload)
     return buf.getvalue()
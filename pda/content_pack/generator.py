@@ -1,12 +1,35 @@
 """Generate LLM-friendly content pack: FAQ, outline, comparison bullets, constraints, schema.org JSON-LD."""
 
-import json
+from itertools import islice
 from typing import Any
 
 from pda.schemas.models import ProductFactSheet
 
 NOT_FOUND = "NOT_FOUND"
 
+_PAGE_OUTLINE = (
+    "Product name and tagline",
+    "Short description",
+    "Key features",
+    "Specifications",
+    "Use cases / applications",
+    "Target audience",
+    "Pricing and offers",
+    "Certifications and compliance",
+    "Compatibility",
+    "Warranty and support",
+)
+
+# (question, fact sheet field, answer length cap or None)
+_FAQ_SPEC = (
+    ("What is this product?", "product_name", None),
+    ("What does it do?", "short_description", 500),
+    ("Who is it for?", "target_audience", None),
+    ("What does it cost?", "pricing", None),
+    ("What warranty is included?", "warranty", None),
+    ("How do I get support?", "support_info", None),
+)
+
 
 def _val(fv: Any) -> Any:
     if fv is None:
@@ -22,44 +45,18 @@ def generate_content_pack(fact_sheet: ProductFactSheet) -> dict[str, Any]:
     Return a dict with: faq_pack, page_outline, comparison_bullets, constraints, schema_org_skeleton.
     """
     faq_pack: list[dict[str, str]] = []
-    name = _val(fact_sheet.product_name)
-    if name:
-        faq_pack.append({"q": "What is this product?", "a": str(name)})
-    desc = _val(fact_sheet.short_description)
-    if desc:
-        faq_pack.append({"q": "What does it do?", "a": str(desc)[:500]})
-    audience = _val(fact_sheet.target_audience)
-    if audience:
-        faq_pack.append({"q": "Who is it for?", "a": str(audience)})
-    price = _val(fact_sheet.pricing)
-    if price:
-        faq_pack.append({"q": "What does it cost?", "a": str(price)})
-    warranty = _val(fact_sheet.warranty)
-    if warranty:
-        faq_pack.append({"q": "What warranty is included?", "a": str(warranty)})
-    support = _val(fact_sheet.support_info)
-    if support:
-        faq_pack.append({"q": "How do I get support?", "a": str(support)})
+    for question, field, max_len in _FAQ_SPEC:
+        v = _val(getattr(fact_sheet, field))
+        if v:
+            faq_pack.append({"q": question, "a": str(v)[:max_len]})
     for fv in fact_sheet.key_features or []:
         v = _val(fv)
         if v:
             faq_pack.append({"q": "What are the key features?", "a": str(v)[:300]})
             break
 
-    page_outline = [
-        "Product name and tagline",
-        "Short description",
-        "Key features",
-        "Specifications",
-        "Use cases / applications",
-        "Target audience",
-        "Pricing and offers",
-        "Certifications and compliance",
-        "Compatibility",
-        "Warranty and support",
-    ]
-
     comparison_bullets: list[str] = []
+    name = _val(fact_sheet.product_name)
     if name:
         comparison_bullets.append(f"Product: {name}")
     if fact_sheet.key_features:
@@ -68,7 +65,7 @@ def generate_content_pack(fact_sheet: ProductFactSheet) -> dict[str, Any]:
             if v:
                 comparison_bullets.append(f"• {v}" if not str(v).startswith("•") else str(v))
     if fact_sheet.specifications:
-        for k, fv in list(fact_sheet.specifications.items())[:5]:
+        for k, fv in islice(fact_sheet.specifications.items(), 5):
             v = _val(fv)
             if v:
                 comparison_bullets.append(f"{k}: {v}")
@@ -97,9 +94,8 @@ def generate_content_pack(fact_sheet: ProductFactSheet) -> dict[str, Any]:
 
     return {
         "faq_pack": faq_pack,
-        "page_outline": page_outline,
+        "page_outline": list(_PAGE_OUTLINE),
         "comparison_bullets": comparison_bullets,
         "constraints": constraints,
         "schema_org_skeleton": schema_org_skeleton,
-        "schema_org_json": json.dumps(schema_org_skeleton, indent=2),
     }
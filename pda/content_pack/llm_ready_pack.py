@@ -3,14 +3,26 @@ four grounded output types, citation resolution, and Markdown+JSON export."""
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
-from jinja2 import Environment, FileSystemLoader
+from pydantic_core import to_json
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
+
+from pda.content_pack._retrieval import ordered_union, query_all
+from pda.prompt_env import PROMPT_ENV
 from pda.schemas.content_pack_schemas import Citation, Tone
 from pda.schemas.factsheet_schema import ProductFactSheet
 from pda.schemas.llm_ready_pack import (
@@ -29,13 +41,22 @@ from pda.schemas.llm_ready_pack import (
 )
 
 logger = logging.getLogger(__name__)
-PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
 MAX_CONTEXT_CHARS = 18_000
 
+_TEMPLATES = {
+    name: PROMPT_ENV.get_template(name)
+    for name in (
+        "llm_ready_canonical.j2",
+        "llm_ready_faq.j2",
+        "llm_ready_selection.j2",
+        "llm_ready_usecases.j2",
+    )
+}
+
 # ── Retrieval queries by section ──────────────────────────────────────────
 
-_SECTION_QUERIES: dict[str, list[str]] = {
-    "canonical": [
+_SECTION_QUERIES: dict[str, tuple[str, ...]] = {
+    "canonical": (
         "product overview and description",
         "key specifications accuracy range",
         "operating environment conditions",
@@ -45,8 +66,8 @@ _SECTION_QUERIES: dict[str, list[str]] = {
         "integration connectivity outputs protocols",
         "troubleshooting common issues",
         "applications use cases industries",
-    ],
-    "faq": [
+    ),
+    "faq": (
         "product selection guide which model",
         "installation wiring mounting",
         "accuracy specifications precision",
@@ -55,16 +76,16 @@ _SECTION_QUERIES: dict[str, list[str]] = {
         "maintenance calibration intervals",
         "troubleshooting error codes diagnostics",
         "accessories optional parts",
-    ],
-    "selection": [
+    ),
+    "selection": (
         "product variants models configurations",
         "selection criteria decision factors",
         "specifications comparison table",
         "application requirements constraints",
         "compatibility interfaces",
         "operating range limits",
-    ],
-    "usecases": [
+    ),
+    "usecases": (
         "use cases applications industries",
         "process monitoring quality control",
         "target users buyer personas",
@@ -72,77 +93,147 @@ _SECTION_QUERIES: dict[str, list[str]] = {
         "measurement requirements constraints",
         "environmental conditions operating ranges",
         "performance accuracy specifications",
-    ],
+    ),
 }
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────
 
-def _build_context(
+_CODE_FENCE_OPEN_RE = re.compile(r"^```\w*\n?")
+_CODE_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
+_INLINE_CITE_RE = re.compile(r"\[(pdf-[^\]]+|url-[^\]]+)\]")
+_SAFE_ID_RE = re.compile(r"[^a-zA-Z0-9_-]")
+
+
+def _retrieve_all_sections(
     store: object,
-    queries: list[str],
     n_results: int = 15,
+    cache_path: Path | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Run every section's queries once (deduplicated) and return {query: results}.
+
+    When ``cache_path`` is given and the store exposes ``fingerprint()``, results are
+    persisted there and reused on later runs until the store contents change.
+    """
+    queries = ordered_union(*_SECTION_QUERIES.values())
+    fingerprint_fn = getattr(store, "fingerprint", None)
+    fingerprint = fingerprint_fn() if cache_path is not None and callable(fingerprint_fn) else None
+
+    if fingerprint is not None and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+        results = cached.get("results") or {}
+        if (
+            cached.get("fingerprint") == fingerprint
+            and cached.get("n_results") == n_results
+            and all(q in results for q in queries)
+        ):
+            logger.info("Reusing cached retrieval results from %s", cache_path)
+            return {q: results[q] for q in queries}
+
+    retrieved = dict(zip(queries, query_all(store, queries, n_results)))
+    if fingerprint is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"fingerprint": fingerprint, "n_results": n_results, "results": retrieved}),
+                encoding="utf-8",
+            )
+        except (OSError, TypeError) as e:
+            logger.warning("Could not write retrieval cache %s: %s", cache_path, e)
+    return retrieved
+
+
+def _build_context(
+    retrieved: dict[str, list[dict[str, Any]]],
+    queries: Iterable[str],
     max_chars: int = MAX_CONTEXT_CHARS,
 ) -> tuple[str, dict[str, dict[str, Any]]]:
-    """Retrieve chunks and return (context_text, chunk_metadata_map)."""
+    """Build a section context from pre-retrieved results; return (context_text, chunk_metadata_map)."""
     seen: set[str] = set()
     parts: list[str] = []
     meta_map: dict[str, dict[str, Any]] = {}
     total = 0
     for q in queries:
-        results = store.query(q, n_results=n_results)
+        if total >= max_chars:
+            break
+        results = retrieved.get(q, [])
         for r in results:
             cid = r.get("chunk_id", "")
             if cid in seen:
                 continue
             seen.add(cid)
             text = r.get("text", "")
-            snippet = f"[{cid}] {text[:1500]}"
-            if total + len(snippet) > max_chars:
+            # "[cid] " prefix + text capped at 1500 chars; check the budget before building it.
+            snippet_len = len(cid) + 3 + min(len(text), 1500)
+            if total + snippet_len > max_chars:
                 break
-            parts.append(snippet)
+            parts.append(f"[{cid}] {text[:1500]}")
             meta_map[cid] = r.get("metadata", {})
-            total += len(snippet)
+            total += snippet_len
     return "\n\n".join(parts), meta_map
 
 
 def _strip_code_fence(raw: str) -> str:
+    if "```" not in raw:
+        # Common case: bare JSON. str.strip() returns raw itself when there is nothing to trim.
+        return raw.strip()
     s = raw.strip()
     if s.startswith("```"):
-        s = re.sub(r"^```\w*\n?", "", s)
-        s = re.sub(r"\n?```\s*$", "", s)
+        s = _CODE_FENCE_OPEN_RE.sub("", s)
+        s = _CODE_FENCE_CLOSE_RE.sub("", s)
     return s.strip()
 
 
 def _parse_json(raw: str) -> Any:
-    return json.loads(_strip_code_fence(raw))
+    text = _strip_code_fence(raw)
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 def _resolve_citations(
     cited_ids: list[str],
     meta_map: dict[str, dict[str, Any]],
+    cache: dict[str, Citation] | None = None,
 ) -> list[Citation]:
+    """Map chunk ids to Citations; ``cache`` reuses Citations already built for ``meta_map``."""
     citations: list[Citation] = []
     for cid in cited_ids:
         if not cid:
             continue
-        meta = meta_map.get(cid, {})
-        citations.append(
-            Citation(
+        citation = cache.get(cid) if cache is not None else None
+        if citation is None:
+            meta = meta_map.get(cid, {})
+            pn = meta.get("page_number")
+            # Metadata comes from our own vector store, so skip re-validation.
+            cid = sys.intern(cid)
+            citation = Citation.model_construct(
                 chunk_id=cid,
                 source_ref=meta.get("source_file", ""),
-                page_num=meta.get("page_number") if meta.get("page_number", -1) != -1 else None,
+                page_num=pn if pn not in (None, -1) else None,
                 heading_path=meta.get("heading_path"),
                 section_title=meta.get("section_heading", ""),
                 excerpt="",
             )
-        )
+            if cache is not None:
+                cache[cid] = citation
+        citations.append(citation)
     return citations
 
 
+def _str_dict(value: Any) -> dict[str, str]:
+    """Coerce an LLM-provided mapping to dict[str, str]; anything else becomes {}."""
+    if not isinstance(value, dict):
+        return {}
+    return {str(k): "" if v is None else str(v) for k, v in value.items()}
+
+
 def _extract_inline_cites(text: str) -> list[str]:
     """Extract [chunk-id] references from text."""
-    return re.findall(r"\[(pdf-[^\]]+|url-[^\]]+)\]", text)
+    return _INLINE_CITE_RE.findall(text)
 
 
 def _factsheet_summary(sheet: ProductFactSheet) -> str:
@@ -177,6 +268,26 @@ IMPORTANT_FIELDS = {
     "integrations_interfaces",
     "maintenance_calibration",
 }
+# Fixed check order (critical first) so missing_fields and questions are deterministic.
+_PREFLIGHT_FIELDS = (
+    "product_name",
+    "product_category",
+    "key_specs",
+    "primary_use_cases",
+    "target_buyer_roles",
+    "constraints",
+    "certifications_standards",
+    "integrations_interfaces",
+    "maintenance_calibration",
+)
+
+
+def _is_missing(val: Any) -> bool:
+    if val is None:
+        return True
+    if isinstance(val, str):
+        return val == "NOT_FOUND" or not val.strip()
+    return isinstance(val, list) and not val
 
 
 def run_preflight(
@@ -184,21 +295,11 @@ def run_preflight(
     llm_provider: object | None = None,
 ) -> PreflightResult:
     """Lightweight preflight: detect missing/ambiguous facts."""
-    missing: list[str] = []
-    all_fields = list(CRITICAL_FIELDS | IMPORTANT_FIELDS)
-
-    for field in all_fields:
-        val = getattr(sheet, field, None)
-        if val is None:
-            missing.append(field)
-        elif isinstance(val, str) and (val == "NOT_FOUND" or not val.strip()):
-            missing.append(field)
-        elif isinstance(val, list) and len(val) == 0:
-            missing.append(field)
+    missing = [f for f in _PREFLIGHT_FIELDS if _is_missing(getattr(sheet, f, None))]
 
     # Determine if we can generate
-    critical_missing = [f for f in missing if f in CRITICAL_FIELDS]
-    can_generate = len(critical_missing) <= 1  # allow one critical miss (e.g. category)
+    critical_missing = sum(1 for f in missing if f in CRITICAL_FIELDS)
+    can_generate = critical_missing <= 1  # allow one critical miss (e.g. category)
     if sheet.product_name == "NOT_FOUND":
         can_generate = False
     if isinstance(sheet.key_specs, list) and len(sheet.key_specs) < 2:
@@ -224,8 +325,8 @@ def run_preflight(
 
     return PreflightResult(
         product_name=sheet.product_name,
-        facts_found=len(all_fields) - len(missing),
-        facts_expected=len(all_fields),
+        facts_found=len(_PREFLIGHT_FIELDS) - len(missing),
+        facts_expected=len(_PREFLIGHT_FIELDS),
         missing_fields=missing,
         questions=questions,
         can_generate=can_generate,
@@ -235,19 +336,17 @@ def run_preflight(
 # ── Generators per output type ────────────────────────────────────────────
 
 def _generate_canonical_answers(
-    store: object,
+    retrieved: dict[str, list[dict[str, Any]]],
     llm_provider: object,
-    sheet: ProductFactSheet,
+    factsheet_summary: str,
     tone: Tone,
-    meta_map_out: dict[str, dict[str, Any]],
 ) -> list[CanonicalAnswerBlock]:
-    context_text, meta_map = _build_context(store, _SECTION_QUERIES["canonical"])
-    meta_map_out.update(meta_map)
+    context_text, meta_map = _build_context(retrieved, _SECTION_QUERIES["canonical"])
+    citation_cache: dict[str, Citation] = {}
 
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    prompt = env.get_template("llm_ready_canonical.j2").render(
+    prompt = _TEMPLATES["llm_ready_canonical.j2"].render(
         tone=tone.value,
-        factsheet_summary=_factsheet_summary(sheet),
+        factsheet_summary=factsheet_summary,
         chunk_text=context_text,
     )
     raw = llm_provider.complete(prompt)
@@ -261,32 +360,30 @@ def _generate_canonical_answers(
             continue
         cited_ids = [str(c) for c in (item.get("cited_chunk_ids") or [])]
         inline = _extract_inline_cites(str(item.get("answer", "")))
-        all_ids = list(dict.fromkeys(cited_ids + inline))
-        blocks.append(CanonicalAnswerBlock(
+        all_ids = ordered_union(cited_ids, inline)
+        blocks.append(CanonicalAnswerBlock.model_construct(
             block_id=str(item.get("block_id", f"cab-{len(blocks)}")),
             question=str(item.get("question", "")),
             answer=str(item.get("answer", "")),
             best_for=str(item.get("best_for", "")),
             not_suitable_when=str(item.get("not_suitable_when", "")),
-            citations=_resolve_citations(all_ids, meta_map),
+            citations=_resolve_citations(all_ids, meta_map, citation_cache),
         ))
     return blocks
 
 
 def _generate_faq(
-    store: object,
+    retrieved: dict[str, list[dict[str, Any]]],
     llm_provider: object,
-    sheet: ProductFactSheet,
+    factsheet_summary: str,
     tone: Tone,
-    meta_map_out: dict[str, dict[str, Any]],
 ) -> list[FAQEntry]:
-    context_text, meta_map = _build_context(store, _SECTION_QUERIES["faq"])
-    meta_map_out.update(meta_map)
+    context_text, meta_map = _build_context(retrieved, _SECTION_QUERIES["faq"])
+    citation_cache: dict[str, Citation] = {}
 
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    prompt = env.get_template("llm_ready_faq.j2").render(
+    prompt = _TEMPLATES["llm_ready_faq.j2"].render(
         tone=tone.value,
-        factsheet_summary=_factsheet_summary(sheet),
+        factsheet_summary=factsheet_summary,
         chunk_text=context_text,
     )
     raw = llm_provider.complete(prompt)
@@ -300,31 +397,29 @@ def _generate_faq(
             continue
         cited_ids = [str(c) for c in (item.get("cited_chunk_ids") or [])]
         inline = _extract_inline_cites(str(item.get("answer", "")))
-        all_ids = list(dict.fromkeys(cited_ids + inline))
-        entries.append(FAQEntry(
+        all_ids = ordered_union(cited_ids, inline)
+        entries.append(FAQEntry.model_construct(
             faq_id=str(item.get("faq_id", f"faq-{len(entries)}")),
             theme=str(item.get("theme", "general")),
             question=str(item.get("question", "")),
             answer=str(item.get("answer", "")),
-            citations=_resolve_citations(all_ids, meta_map),
+            citations=_resolve_citations(all_ids, meta_map, citation_cache),
         ))
     return entries
 
 
 def _generate_selection_guidance(
-    store: object,
+    retrieved: dict[str, list[dict[str, Any]]],
     llm_provider: object,
-    sheet: ProductFactSheet,
+    factsheet_summary: str,
     tone: Tone,
-    meta_map_out: dict[str, dict[str, Any]],
 ) -> SelectionGuidance:
-    context_text, meta_map = _build_context(store, _SECTION_QUERIES["selection"])
-    meta_map_out.update(meta_map)
+    context_text, meta_map = _build_context(retrieved, _SECTION_QUERIES["selection"])
+    citation_cache: dict[str, Citation] = {}
 
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    prompt = env.get_template("llm_ready_selection.j2").render(
+    prompt = _TEMPLATES["llm_ready_selection.j2"].render(
         tone=tone.value,
-        factsheet_summary=_factsheet_summary(sheet),
+        factsheet_summary=factsheet_summary,
         chunk_text=context_text,
     )
     raw = llm_provider.complete(prompt)
@@ -339,11 +434,11 @@ def _generate_selection_guidance(
             continue
         cited_ids = [str(c) for c in (dc.get("cited_chunk_ids") or [])]
         inline = _extract_inline_cites(str(dc.get("statement", "")))
-        all_ids = list(dict.fromkeys(cited_ids + inline))
-        criteria.append(DecisionCriterion(
+        all_ids = ordered_union(cited_ids, inline)
+        criteria.append(DecisionCriterion.model_construct(
             criterion_id=str(dc.get("criterion_id", f"dc-{len(criteria)}")),
             statement=str(dc.get("statement", "")),
-            citations=_resolve_citations(all_ids, meta_map),
+            citations=_resolve_citations(all_ids, meta_map, citation_cache),
         ))
 
     # Comparison table
@@ -352,10 +447,10 @@ def _generate_selection_guidance(
         if not isinstance(row, dict):
             continue
         cited_ids = [str(c) for c in (row.get("cited_chunk_ids") or [])]
-        rows.append(ComparisonRow(
+        rows.append(ComparisonRow.model_construct(
             variant=str(row.get("variant", "")),
-            attributes=row.get("attributes", {}),
-            citations=_resolve_citations(cited_ids, meta_map),
+            attributes=_str_dict(row.get("attributes")),
+            citations=_resolve_citations(cited_ids, meta_map, citation_cache),
         ))
 
     missing_info = [str(m) for m in (data.get("missing_info") or [])]
@@ -367,24 +462,22 @@ def _generate_selection_guidance(
         comparison_table=rows,
         decision_tree_md=str(data.get("decision_tree_md", "")),
         missing_info=missing_info,
-        citations=_resolve_citations(top_cited, meta_map),
+        citations=_resolve_citations(top_cited, meta_map, citation_cache),
     )
 
 
 def _generate_use_case_pages(
-    store: object,
+    retrieved: dict[str, list[dict[str, Any]]],
     llm_provider: object,
-    sheet: ProductFactSheet,
+    factsheet_summary: str,
     tone: Tone,
-    meta_map_out: dict[str, dict[str, Any]],
 ) -> list[UseCasePage]:
-    context_text, meta_map = _build_context(store, _SECTION_QUERIES["usecases"])
-    meta_map_out.update(meta_map)
+    context_text, meta_map = _build_context(retrieved, _SECTION_QUERIES["usecases"])
+    citation_cache: dict[str, Citation] = {}
 
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    prompt = env.get_template("llm_ready_usecases.j2").render(
+    prompt = _TEMPLATES["llm_ready_usecases.j2"].render(
         tone=tone.value,
-        factsheet_summary=_factsheet_summary(sheet),
+        factsheet_summary=factsheet_summary,
         chunk_text=context_text,
     )
     raw = llm_provider.complete(prompt)
@@ -403,20 +496,21 @@ def _generate_use_case_pages(
                 continue
             faq_cited = [str(c) for c in (faq_item.get("cited_chunk_ids") or [])]
             inline = _extract_inline_cites(str(faq_item.get("answer", "")))
-            faq_all = list(dict.fromkeys(faq_cited + inline))
-            faqs.append(UseCaseFAQ(
+            faq_all = ordered_union(faq_cited, inline)
+            faqs.append(UseCaseFAQ.model_construct(
                 question=str(faq_item.get("question", "")),
                 answer=str(faq_item.get("answer", "")),
-                citations=_resolve_citations(faq_all, meta_map),
+                citations=_resolve_citations(faq_all, meta_map, citation_cache),
             ))
 
         cited_ids = [str(c) for c in (item.get("cited_chunk_ids") or [])]
         # Gather inline cites from all text fields
-        for field in ("problem_context", "requirements", "why_this_product_fits", "implementation_notes"):
-            cited_ids.extend(_extract_inline_cites(str(item.get(field, ""))))
-        all_ids = list(dict.fromkeys(cited_ids))
+        all_ids = ordered_union(cited_ids, *(
+            _extract_inline_cites(str(item.get(field, "")))
+            for field in ("problem_context", "requirements", "why_this_product_fits", "implementation_notes")
+        ))
 
-        pages.append(UseCasePage(
+        pages.append(UseCasePage.model_construct(
             page_id=str(item.get("page_id", f"uc-{len(pages)}")),
             title=str(item.get("title", "")),
             problem_context=str(item.get("problem_context", "")),
@@ -424,7 +518,7 @@ def _generate_use_case_pages(
             why_this_product_fits=str(item.get("why_this_product_fits", "")),
             implementation_notes=str(item.get("implementation_notes", "")),
             faqs=faqs,
-            citations=_resolve_citations(all_ids, meta_map),
+            citations=_resolve_citations(all_ids, meta_map, citation_cache),
         ))
     return pages
 
@@ -437,6 +531,7 @@ def generate_content_pack(
     sheet: ProductFactSheet,
     tone: str = "technical",
     proceed_with_assumptions: bool = False,
+    retrieval_cache_path: Path | None = None,
 ) -> ContentPackBundle:
     """
     Generate the full LLM-ready content pack.
@@ -444,6 +539,9 @@ def generate_content_pack(
     Returns a ContentPackBundle. If preflight detects critical missing fields
     and proceed_with_assumptions is False, the bundle will have empty outputs
     and preflight.can_generate == False.
+
+    retrieval_cache_path: optional JSON file used to reuse retrieval results
+    across regenerations while the vector store contents are unchanged.
     """
     tone_enum = Tone(tone.lower()) if tone.lower() in [t.value for t in Tone] else Tone.TECHNICAL
 
@@ -463,21 +561,21 @@ def generate_content_pack(
         for mf in preflight.missing_fields:
             assumptions.append(f"Field '{mf}' is missing or NOT_FOUND.")
 
-    # Shared meta map for citation resolution across sections
-    meta_map_all: dict[str, dict[str, Any]] = {}
-
-    # --- Generate all four outputs ---
-    logger.info("Generating canonical answer blocks (tone=%s)", tone_enum.value)
-    canonical = _generate_canonical_answers(store, llm_provider, sheet, tone_enum, meta_map_all)
-
-    logger.info("Generating FAQ entries")
-    faq = _generate_faq(store, llm_provider, sheet, tone_enum, meta_map_all)
-
-    logger.info("Generating selection guidance")
-    selection = _generate_selection_guidance(store, llm_provider, sheet, tone_enum, meta_map_all)
-
-    logger.info("Generating use-case pages")
-    usecases = _generate_use_case_pages(store, llm_provider, sheet, tone_enum, meta_map_all)
+    # The four sections are independent LLM round-trips, so run them concurrently.
+    logger.info("Generating content pack sections concurrently (tone=%s)", tone_enum.value)
+    # Retrieve once for all sections; each section then builds its context from the cache.
+    retrieved = _retrieve_all_sections(store, cache_path=retrieval_cache_path)
+    # Every section prompt embeds the same fact sheet summary; build it once.
+    args = (retrieved, llm_provider, _factsheet_summary(sheet), tone_enum)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        canonical_f = pool.submit(_generate_canonical_answers, *args)
+        faq_f = pool.submit(_generate_faq, *args)
+        selection_f = pool.submit(_generate_selection_guidance, *args)
+        usecases_f = pool.submit(_generate_use_case_pages, *args)
+        canonical = canonical_f.result()
+        faq = faq_f.result()
+        selection = selection_f.result()
+        usecases = usecases_f.result()
 
     return ContentPackBundle(
         project_id="",
@@ -506,161 +604,179 @@ def _cite_str(citations: list[Citation]) -> str:
     return " | ".join(parts)
 
 
+def _write_file(path: Path, payload: str | bytes) -> None:
+    if isinstance(payload, bytes):
+        path.write_bytes(payload)
+    else:
+        path.write_text(payload, encoding="utf-8")
+
+
+def _write_files(out_dir: Path, files: dict[str, str | bytes], max_workers: int = 8) -> dict[str, Path]:
+    """Write rendered files concurrently; returns {filename: path} in input order."""
+    written = {name: out_dir / name for name in files}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Consuming the iterator re-raises the first write error, if any.
+        list(pool.map(_write_file, written.values(), files.values()))
+    return written
+
+
+def _buffer_text(buf: io.StringIO) -> str:
+    """Buffered Markdown minus the newline after its last line, as if the lines were newline-joined."""
+    return buf.getvalue()[:-1]
+
+
 def write_content_pack_bundle(bundle: ContentPackBundle, out_dir: Path) -> dict[str, Path]:
     """Write the full bundle to Markdown files + JSON manifest. Returns {filename: path}."""
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
-    written: dict[str, Path] = {}
-    total_citations = 0
+    # Content is rendered first and written in one concurrent batch at the end.
+    files: dict[str, str | bytes] = {}
+    # Citations per written file, tallied while rendering so the manifest needs no second pass.
+    citation_counts: dict[str, int] = {}
 
     # --- 1. Canonical Answer Blocks ---
-    lines: list[str] = [f"# Canonical Answer Blocks (tone: {bundle.tone.value})\n"]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Canonical Answer Blocks (tone: {bundle.tone.value})\n\n")
+    n_cites = 0
     for b in bundle.canonical_answers:
-        lines.append(f"## {b.question}\n")
-        lines.append(f"{b.answer}\n")
-        lines.append(f"**Best for:** {b.best_for}\n")
-        lines.append(f"**Not suitable when:** {b.not_suitable_when}\n")
+        w(f"## {b.question}\n\n")
+        w(f"{b.answer}\n\n")
+        w(f"**Best for:** {b.best_for}\n\n")
+        w(f"**Not suitable when:** {b.not_suitable_when}\n\n")
         if b.citations:
-            lines.append(f"**Sources:** {_cite_str(b.citations)}\n")
-            total_citations += len(b.citations)
-        lines.append("")
-    md_path = out_dir / "canonical_answers.md"
-    md_path.write_text("\n".join(lines), encoding="utf-8")
-    written["canonical_answers.md"] = md_path
+            w(f"**Sources:** {_cite_str(b.citations)}\n\n")
+            n_cites += len(b.citations)
+        w("\n")
+    files["canonical_answers.md"] = _buffer_text(buf)
+    citation_counts["canonical_answers.md"] = n_cites
 
     # --- 2. FAQ ---
-    lines = [f"# Product FAQ (tone: {bundle.tone.value})\n"]
-    current_theme = ""
-    for entry in sorted(bundle.faq, key=lambda e: e.theme):
-        if entry.theme != current_theme:
-            current_theme = entry.theme
-            lines.append(f"\n## {current_theme.replace('_', ' ').title()}\n")
-        lines.append(f"### Q: {entry.question}\n")
-        lines.append(f"{entry.answer}\n")
-        if entry.citations:
-            lines.append(f"**Sources:** {_cite_str(entry.citations)}\n")
-            total_citations += len(entry.citations)
-        lines.append("")
-    md_path = out_dir / "faq.md"
-    md_path.write_text("\n".join(lines), encoding="utf-8")
-    written["faq.md"] = md_path
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Product FAQ (tone: {bundle.tone.value})\n\n")
+    n_cites = 0
+    by_theme = attrgetter("theme")
+    for theme, entries in groupby(sorted(bundle.faq, key=by_theme), key=by_theme):
+        if theme:
+            w(f"\n## {theme.replace('_', ' ').title()}\n\n")
+        for entry in entries:
+            w(f"### Q: {entry.question}\n\n")
+            w(f"{entry.answer}\n\n")
+            if entry.citations:
+                w(f"**Sources:** {_cite_str(entry.citations)}\n\n")
+                n_cites += len(entry.citations)
+            w("\n")
+    files["faq.md"] = _buffer_text(buf)
+    citation_counts["faq.md"] = n_cites
 
     # --- 3. Selection Guidance ---
     sg = bundle.selection_guidance
-    lines = [f"# Selection Guidance (tone: {bundle.tone.value})\n"]
-    lines.append("## Decision Criteria\n")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Selection Guidance (tone: {bundle.tone.value})\n\n")
+    n_cites = len(sg.citations)
+    w("## Decision Criteria\n\n")
     for dc in sg.decision_criteria:
-        lines.append(f"- {dc.statement}")
+        w(f"- {dc.statement}\n")
         if dc.citations:
-            lines.append(f"  **Sources:** {_cite_str(dc.citations)}")
-            total_citations += len(dc.citations)
-    lines.append("")
+            w(f"  **Sources:** {_cite_str(dc.citations)}\n")
+            n_cites += len(dc.citations)
+    w("\n")
     if sg.comparison_table:
-        lines.append("## Comparison Table\n")
+        w("## Comparison Table\n\n")
         # Build header from first row's attributes
-        if sg.comparison_table:
-            attrs = list(sg.comparison_table[0].attributes.keys())
-            header = "| Variant | " + " | ".join(a.replace("_", " ").title() for a in attrs) + " |"
-            sep = "|" + "|".join(["---"] * (len(attrs) + 1)) + "|"
-            lines.append(header)
-            lines.append(sep)
-            for row in sg.comparison_table:
-                vals = [row.attributes.get(a, "") for a in attrs]
-                lines.append(f"| {row.variant} | " + " | ".join(vals) + " |")
-                total_citations += len(row.citations)
-        lines.append("")
+        attrs = list(sg.comparison_table[0].attributes.keys())
+        w("| Variant | " + " | ".join(a.replace("_", " ").title() for a in attrs) + " |\n")
+        w("|" + "|".join(["---"] * (len(attrs) + 1)) + "|\n")
+        for row in sg.comparison_table:
+            vals = [row.attributes.get(a, "") for a in attrs]
+            w(f"| {row.variant} | " + " | ".join(vals) + " |\n")
+            n_cites += len(row.citations)
+        w("\n")
     if sg.decision_tree_md:
-        lines.append("## Decision Tree\n")
-        lines.append(sg.decision_tree_md)
-        lines.append("")
+        w("## Decision Tree\n\n")
+        w(sg.decision_tree_md)
+        w("\n\n")
     if sg.missing_info:
-        lines.append("## Missing Information\n")
+        w("## Missing Information\n\n")
         for mi in sg.missing_info:
-            lines.append(f"- {mi}")
-        lines.append("")
-    total_citations += len(sg.citations)
-    md_path = out_dir / "selection_guidance.md"
-    md_path.write_text("\n".join(lines), encoding="utf-8")
-    written["selection_guidance.md"] = md_path
+            w(f"- {mi}\n")
+        w("\n")
+    files["selection_guidance.md"] = _buffer_text(buf)
+    citation_counts["selection_guidance.md"] = n_cites
 
     # --- 4. Use-case Pages ---
+    page_files: list[tuple[UseCasePage, str]] = []
     for page in bundle.use_case_pages:
-        lines = [f"# {page.title}\n"]
-        lines.append("## Problem Context\n")
-        lines.append(f"{page.problem_context}\n")
-        lines.append("## Requirements\n")
-        lines.append(f"{page.requirements}\n")
-        lines.append("## Why This Product Fits\n")
-        lines.append(f"{page.why_this_product_fits}\n")
-        lines.append("## Implementation Notes\n")
-        lines.append(f"{page.implementation_notes}\n")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# {page.title}\n\n")
+        n_cites = 0
+        w("## Problem Context\n\n")
+        w(f"{page.problem_context}\n\n")
+        w("## Requirements\n\n")
+        w(f"{page.requirements}\n\n")
+        w("## Why This Product Fits\n\n")
+        w(f"{page.why_this_product_fits}\n\n")
+        w("## Implementation Notes\n\n")
+        w(f"{page.implementation_notes}\n\n")
         if page.faqs:
-            lines.append("## FAQs\n")
+            w("## FAQs\n\n")
             for faq in page.faqs:
-                lines.append(f"### Q: {faq.question}\n")
-                lines.append(f"{faq.answer}\n")
+                w(f"### Q: {faq.question}\n\n")
+                w(f"{faq.answer}\n\n")
                 if faq.citations:
-                    lines.append(f"**Sources:** {_cite_str(faq.citations)}\n")
-                    total_citations += len(faq.citations)
+                    w(f"**Sources:** {_cite_str(faq.citations)}\n\n")
+                    n_cites += len(faq.citations)
         if page.citations:
-            lines.append(f"\n**Page sources:** {_cite_str(page.citations)}\n")
-            total_citations += len(page.citations)
+            w(f"\n**Page sources:** {_cite_str(page.citations)}\n\n")
+            n_cites += len(page.citations)
 
-        safe_id = re.sub(r"[^a-zA-Z0-9_-]", "_", page.page_id)
-        md_path = out_dir / f"usecase_{safe_id}.md"
-        md_path.write_text("\n".join(lines), encoding="utf-8")
-        written[f"usecase_{safe_id}.md"] = md_path
+        page_filename = f"usecase_{_SAFE_ID_RE.sub('_', page.page_id)}.md"
+        files[page_filename] = _buffer_text(buf)
+        citation_counts[page_filename] = n_cites
+        page_files.append((page, page_filename))
 
     # --- 5. Full bundle JSON ---
-    json_path = out_dir / "content_pack.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(bundle.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
-    written["content_pack.json"] = json_path
+    files["content_pack.json"] = to_json(bundle, indent=2)
 
     # --- 6. Manifest ---
     manifest_files: list[ManifestFileEntry] = []
-    manifest_files.append(ManifestFileEntry(
+    manifest_files.append(ManifestFileEntry.model_construct(
         filename="canonical_answers.md",
         section="canonical_answers",
         item_count=len(bundle.canonical_answers),
-        citation_count=sum(len(b.citations) for b in bundle.canonical_answers),
+        citation_count=citation_counts["canonical_answers.md"],
     ))
-    manifest_files.append(ManifestFileEntry(
+    manifest_files.append(ManifestFileEntry.model_construct(
         filename="faq.md",
         section="faq",
         item_count=len(bundle.faq),
-        citation_count=sum(len(e.citations) for e in bundle.faq),
+        citation_count=citation_counts["faq.md"],
     ))
-    manifest_files.append(ManifestFileEntry(
+    manifest_files.append(ManifestFileEntry.model_construct(
         filename="selection_guidance.md",
         section="selection_guidance",
         item_count=len(sg.decision_criteria) + len(sg.comparison_table),
-        citation_count=(
-            sum(len(dc.citations) for dc in sg.decision_criteria)
-            + sum(len(r.citations) for r in sg.comparison_table)
-            + len(sg.citations)
-        ),
+        citation_count=citation_counts["selection_guidance.md"],
     ))
-    for page in bundle.use_case_pages:
-        safe_id = re.sub(r"[^a-zA-Z0-9_-]", "_", page.page_id)
-        manifest_files.append(ManifestFileEntry(
-            filename=f"usecase_{safe_id}.md",
+    for page, page_filename in page_files:
+        manifest_files.append(ManifestFileEntry.model_construct(
+            filename=page_filename,
             section="use_case_page",
             item_count=1 + len(page.faqs),
-            citation_count=len(page.citations) + sum(len(faq.citations) for faq in page.faqs),
+            citation_count=citation_counts[page_filename],
         ))
 
     manifest = ExportManifest(
         project_id=bundle.project_id,
         tone=bundle.tone.value,
         files=manifest_files,
-        total_citations=total_citations,
+        total_citations=sum(citation_counts.values()),
         assumptions=bundle.assumptions,
         preflight_questions=bundle.preflight.questions if not bundle.preflight.can_generate else [],
     )
-    manifest_path = out_dir / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
-    written["manifest.json"] = manifest_path
+    files["manifest.json"] = to_json(manifest, indent=2)
 
-    return written
+    return _write_files(out_dir, files)
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import re
 from pathlib import Path
 from typing import Any, Literal
 
-from jinja2 import Environment, FileSystemLoader
+from pydantic_core import to_json
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
+
+from pda.content_pack._json_stream import parse_partial
+from pda.content_pack._retrieval import ordered_union, query_all
+from pda.prompt_env import PROMPT_ENV
 from pda.schemas.content_pack_schemas import (
     Citation,
     ContentPack,
@@ -18,11 +27,16 @@ from pda.schemas.content_pack_schemas import (
 )
 
 logger = logging.getLogger(__name__)
-PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
 MAX_CONTEXT_CHARS = 14_000
 
+_TEMPLATE = PROMPT_ENV.get_template("content_pack_rag.j2")
+
 PackType = Literal["faq", "how_to_choose", "applications", "snippets"]
 
+_CODE_FENCE_OPEN_RE = re.compile(r"^```\w*\n?")
+_CODE_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
+_INLINE_CITE_RE = re.compile(r"\[(pdf-[^\]]+|url-[^\]]+)\]")
+
 
 def _build_context(
     store: object,
@@ -39,20 +53,23 @@ def _build_context(
     meta_map: dict[str, dict[str, Any]] = {}
     total = 0
 
-    for q in queries:
-        results = store.query(q, n_results=n_results)
+    queries = [q for q in queries if q.strip()]
+    for results in query_all(store, queries, n_results):
+        if total >= max_chars:
+            break  # budget exhausted; no later snippet can fit
         for r in results:
             cid = r.get("chunk_id", "")
             if cid in seen:
                 continue
             seen.add(cid)
             text = r.get("text", "")
-            snippet = f"[{cid}] {text[:1500]}"
-            if total + len(snippet) > max_chars:
+            # "[cid] " prefix + text capped at 1500 chars; check the budget before building it.
+            snippet_len = len(cid) + 3 + min(len(text), 1500)
+            if total + snippet_len > max_chars:
                 break
-            parts.append(snippet)
+            parts.append(f"[{cid}] {text[:1500]}")
             meta_map[cid] = r.get("metadata", {})
-            total += len(snippet)
+            total += snippet_len
 
     return "\n\n".join(parts), meta_map
 
@@ -61,14 +78,17 @@ def _parse_items(raw: str) -> list[dict]:
     """Parse LLM output into a list of dicts."""
     s = raw.strip()
     if s.startswith("```"):
-        s = re.sub(r"^```\w*\n?", "", s)
-        s = re.sub(r"\n?```\s*$", "", s)
+        s = _CODE_FENCE_OPEN_RE.sub("", s)
+        s = _CODE_FENCE_CLOSE_RE.sub("", s)
     try:
-        data = json.loads(s)
+        data = orjson.loads(s) if orjson is not None else json.loads(s)
         if isinstance(data, list):
             return data
     except json.JSONDecodeError:
-        pass
+        # Keep the complete leading items of a response cut off mid-way.
+        data = parse_partial(s)
+        if isinstance(data, list):
+            return data
     return []
 
 
@@ -149,9 +169,7 @@ def generate_content_pack_rag(
 
     context_text, meta_map = _build_context(store, queries)
 
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    template = env.get_template("content_pack_rag.j2")
-    prompt = template.render(
+    prompt = _TEMPLATE.render(
         pack_type=pack_type,
         tone=tone_enum.value,
         chunk_text=context_text,
@@ -169,8 +187,8 @@ def generate_content_pack_rag(
 
         # Also extract inline [chunk-id] references from body
         body = str(item_dict.get("body", ""))
-        inline_cites = re.findall(r"\[(pdf-[^\]]+|url-[^\]]+)\]", body)
-        all_cite_ids = list(dict.fromkeys(cited_ids + inline_cites))
+        inline_cites = _INLINE_CITE_RE.findall(body)
+        all_cite_ids = ordered_union(cited_ids, inline_cites)
 
         citations = _resolve_citations(all_cite_ids, meta_map)
 
@@ -200,20 +218,20 @@ def write_content_pack(pack: ContentPack, out_dir: Path) -> dict[str, Path]:
 
     # JSON export
     json_path = out_dir / f"{pack.pack_type}.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(pack.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
+    json_path.write_bytes(to_json(pack, indent=2))
     written[f"{pack.pack_type}.json"] = json_path
 
     # Markdown export
     md_path = out_dir / f"{pack.pack_type}.md"
-    lines: list[str] = []
-    lines.append(f"# {pack.pack_type.replace('_', ' ').title()} (tone: {pack.tone.value})\n")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {pack.pack_type.replace('_', ' ').title()} (tone: {pack.tone.value})\n")
     for item in pack.items:
         if item.question:
-            lines.append(f"## Q: {item.question}\n")
+            w(f"\n## Q: {item.question}\n")
         elif item.title:
-            lines.append(f"## {item.title}\n")
-        lines.append(f"{item.body}\n")
+            w(f"\n## {item.title}\n")
+        w(f"\n{item.body}\n")
         if item.citations:
             cite_strs = []
             for c in item.citations:
@@ -223,9 +241,9 @@ def write_content_pack(pack: ContentPack, out_dir: Path) -> dict[str, Path]:
                 if c.page_num is not None:
                     parts.append(f"p.{c.page_num}")
                 cite_strs.append(", ".join(parts))
-            lines.append("**Sources:** " + " | ".join(cite_strs) + "\n")
-        lines.append("")
-    md_path.write_text("\n".join(lines), encoding="utf-8")
+            w("\n**Sources:** " + " | ".join(cite_strs) + "\n")
+        w("\n")
+    md_path.write_text(buf.getvalue(), encoding="utf-8")
     written[f"{pack.pack_type}.md"] = md_path
 
     return written
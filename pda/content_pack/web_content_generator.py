@@ -12,12 +12,20 @@ import json
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
-from jinja2 import Environment, FileSystemLoader
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
 
+from pda.content_pack._json_stream import parse_partial
+from pda.content_pack._retrieval import ordered_union, query_all
 from pda.guardrails import run_draft_guardrails
+from pda.prompt_env import PROMPT_ENV
 from pda.schemas.factsheet_schema import ProductFactSheet
 from pda.schemas.models import AuditFinding, Scorecard
 from pda.schemas.web_content_schemas import (
@@ -37,9 +45,19 @@ from pda.schemas.web_content_schemas import (
 
 logger = logging.getLogger(__name__)
 
-PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
 MAX_CONTEXT_CHARS = 18_000
 
+_TEMPLATES = {
+    name: PROMPT_ENV.get_template(name)
+    for name in (
+        "web_content_landing_and_seo.j2",
+        "web_content_faq.j2",
+        "web_content_faq_batch.j2",
+        "web_content_usecases.j2",
+        "web_content_comparisons.j2",
+    )
+}
+
 # Retrieval queries (tailored for web-content sections)
 _SECTION_QUERIES: dict[str, list[str]] = {
     "landing": [
@@ -83,76 +101,150 @@ _SECTION_QUERIES: dict[str, list[str]] = {
     ],
 }
 
+# Many queries overlap between sections, so they are retrieved once up front.
+_ALL_SECTION_QUERIES: list[str] = list(dict.fromkeys(
+    q for queries in _SECTION_QUERIES.values() for q in queries
+))
+
 
 # ---------------------------------------------------------------------------
 # Helpers (re-usable across sections)
 # ---------------------------------------------------------------------------
 
-def _build_context(
+_CODE_FENCE_OPEN_RE = re.compile(r"^```\w*\n?")
+_CODE_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
+# _FIELD_SEP joins several text fields for a single cite scan; ids never contain it,
+# so it is excluded from the id pattern to stop matches spanning two fields.
+_FIELD_SEP = "\x1f"
+_INLINE_CITE_RE = re.compile(r"\[(pdf-[^\]\x1f]+|url-[^\]\x1f]+)\]")
+# Shared empty iterable for missing list fields; avoids a fresh [] per lookup.
+_EMPTY: tuple = ()
+
+
+def _iter_field(d: dict[str, Any], key: str) -> Any:
+    """Return ``d[key]`` when present and non-empty, else the shared empty tuple."""
+    return d.get(key) or _EMPTY
+
+
+def _retrieve(
     store: object,
     queries: list[str],
     n_results: int = 15,
+) -> dict[str, list[dict[str, Any]]]:
+    """Run each distinct, non-blank query once against the store and return {query: results}."""
+    unique = [q for q in dict.fromkeys(queries) if q.strip()]
+    return dict(zip(unique, query_all(store, unique, n_results)))
+
+
+def _retrieve_all_sections(
+    store: object,
+    n_results: int = 15,
+) -> dict[str, list[dict[str, Any]]]:
+    """Retrieve the union of every section's queries in a single deduplicated pass."""
+    return _retrieve(store, _ALL_SECTION_QUERIES, n_results=n_results)
+
+
+def _build_context(
+    retrieved: dict[str, list[dict[str, Any]]],
+    queries: list[str],
     max_chars: int = MAX_CONTEXT_CHARS,
 ) -> tuple[str, dict[str, dict[str, Any]]]:
-    """Retrieve chunks from the vector store and return (text, meta_map)."""
+    """Assemble a section context from pre-retrieved results and return (text, meta_map)."""
     seen: set[str] = set()
     parts: list[str] = []
     meta_map: dict[str, dict[str, Any]] = {}
     total = 0
     for q in queries:
-        results = store.query(q, n_results=n_results)
+        if total >= max_chars:
+            break  # budget exhausted; no later snippet can fit
+        results = retrieved.get(q, [])
         for r in results:
             cid = r.get("chunk_id", "")
             if cid in seen:
                 continue
             seen.add(cid)
             text = r.get("text", "")
-            snippet = f"[{cid}] {text[:1500]}"
-            if total + len(snippet) > max_chars:
+            # "[cid] " prefix + text capped at 1500 chars; check the budget before building it.
+            snippet_len = len(cid) + 3 + min(len(text), 1500)
+            if total + snippet_len > max_chars:
                 break
-            parts.append(snippet)
+            parts.append(f"[{cid}] {text[:1500]}")
             meta_map[cid] = r.get("metadata", {})
-            total += len(snippet)
+            total += snippet_len
     return "\n\n".join(parts), meta_map
 
 
 def _strip_code_fence(raw: str) -> str:
     s = raw.strip()
     if s.startswith("```"):
-        s = re.sub(r"^```\w*\n?", "", s)
-        s = re.sub(r"\n?```\s*$", "", s)
+        s = _CODE_FENCE_OPEN_RE.sub("", s)
+        s = _CODE_FENCE_CLOSE_RE.sub("", s)
     return s.strip()
 
 
 def _parse_json(raw: str) -> Any:
-    return json.loads(_strip_code_fence(raw))
+    text = _strip_code_fence(raw)
+    try:
+        if orjson is not None:
+            return orjson.loads(text)
+        return json.loads(text)
+    except ValueError:
+        # A response cut off mid-way (e.g. at the token limit) still carries its complete leading items.
+        recovered = parse_partial(text)
+        if recovered is None:
+            raise
+        logger.warning("LLM returned truncated JSON; keeping the complete leading items")
+        return recovered
 
 
 def _extract_inline_cites(text: str) -> list[str]:
     """Extract [chunk-id] references from text."""
-    return re.findall(r"\[(pdf-[^\]]+|url-[^\]]+)\]", text)
+    return _INLINE_CITE_RE.findall(text)
+
+
+def _no_inline_cites(text: str) -> list[str]:
+    return []
+
+
+def _inline_cite_extractor(raw: str) -> Callable[[str], list[str]]:
+    """Return the inline-cite extractor to use on fields parsed from ``raw``.
+
+    Inline cites survive JSON encoding verbatim, so a response without any
+    ``[pdf-`` / ``[url-`` text cannot contain one and its fields need no regex scan.
+    """
+    if "[pdf-" in raw or "[url-" in raw:
+        return _extract_inline_cites
+    return _no_inline_cites
 
 
 def _to_evidence_refs(
     cited_ids: list[str],
     meta_map: dict[str, dict[str, Any]],
+    cache: dict[str, EvidenceRef] | None = None,
 ) -> list[EvidenceRef]:
-    """Convert chunk IDs → EvidenceRef objects using the metadata map."""
+    """Convert chunk IDs → EvidenceRef objects using the metadata map.
+
+    ``cache`` reuses refs already built for ``meta_map``; refs are never mutated
+    after construction, so items citing the same chunk can share one instance.
+    """
     refs: list[EvidenceRef] = []
     for cid in cited_ids:
         if not cid:
             continue
-        meta = meta_map.get(cid, {})
-        page = meta.get("page_number")
-        pages = [page] if page and page != -1 else []
-        refs.append(
-            EvidenceRef(
+        ref = cache.get(cid) if cache is not None else None
+        if ref is None:
+            meta = meta_map.get(cid, {})
+            page = meta.get("page_number")
+            pages = [page] if page and page != -1 else []
+            ref = EvidenceRef(
                 chunk_ids=[cid],
                 source_file=meta.get("source_file", ""),
                 page_numbers=pages,
                 verbatim_excerpt="",
             )
-        )
+            if cache is not None:
+                cache[cid] = ref
+        refs.append(ref)
     return refs
 
 
@@ -183,92 +275,120 @@ def _factsheet_summary(sheet: ProductFactSheet) -> str:
 
 
 def _render_prompt(template_name: str, **kwargs: Any) -> str:
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    return env.get_template(template_name).render(**kwargs)
+    return _TEMPLATES[template_name].render(**kwargs)
 
 
 # ---------------------------------------------------------------------------
 # Valid-spec set for post-processing enforcement
 # ---------------------------------------------------------------------------
 
-def _build_valid_spec_set(sheet: ProductFactSheet) -> set[str]:
+def _build_valid_spec_set(sheet: ProductFactSheet) -> frozenset[tuple[str, str]]:
     """Build a set of normalised (name, value) pairs from the fact sheet."""
-    specs: set[str] = set()
-    for s in sheet.key_specs:
-        key = f"{s.name.strip().lower()}|{s.value.strip().lower()}"
-        specs.add(key)
-    return specs
-
-
-def _spec_is_grounded(name: str, value: str, valid: set[str]) -> bool:
-    key = f"{name.strip().lower()}|{value.strip().lower()}"
-    return key in valid
+    return frozenset(
+        (s.name.strip().casefold(), s.value.strip().casefold()) for s in sheet.key_specs
+    )
 
 
 # ---------------------------------------------------------------------------
 # Section generators
 # ---------------------------------------------------------------------------
 
-def _generate_landing_page(
-    store: object,
+def _complete_section(
+    retrieved: dict[str, list[dict[str, Any]]],
     llm: object,
-    sheet: ProductFactSheet,
+    template_name: str,
+    queries: list[str],
+    expect: type,
+    **render_kwargs: Any,
+) -> tuple[Any, dict[str, dict[str, Any]], Callable[[str], list[str]]]:
+    """Shared section scaffold: build context, render, call the LLM and parse.
+
+    Returns ``(data, meta_map, extract_cites)`` where ``data`` is an ``expect``
+    instance (empty when the response is missing or has the wrong shape).
+    """
+    context_text, meta_map = _build_context(retrieved, queries)
+    prompt = _render_prompt(template_name, chunk_text=context_text, **render_kwargs)
+    raw = llm.complete(prompt)
+    data = _parse_json(raw) if raw else None
+    if not isinstance(data, expect):
+        data = expect()
+    return data, meta_map, _inline_cite_extractor(raw or "")
+
+
+def _generate_landing_and_seo(
+    retrieved: dict[str, list[dict[str, Any]]],
+    llm: object,
+    factsheet_summary: str,
     tone: str,
     length: str,
     audience: str,
-    meta_map_out: dict[str, dict[str, Any]],
-    valid_specs: set[str],
-) -> LandingPageDraft:
-    context_text, meta_map = _build_context(store, _SECTION_QUERIES["landing"])
-    meta_map_out.update(meta_map)
+    valid_specs: frozenset[tuple[str, str]],
+) -> tuple[LandingPageDraft, SEODraft]:
+    """Generate the landing page and SEO drafts with one LLM call.
 
-    prompt = _render_prompt(
-        "web_content_landing.j2",
-        tone=tone,
-        length=length,
-        audience=audience,
-        factsheet_summary=_factsheet_summary(sheet),
-        chunk_text=context_text,
+    Both sections share the fact-sheet preamble, so one prompt returning
+    ``{"landing": {...}, "seo": {...}}`` pays for those tokens once.
+    """
+    data, meta_map, extract_cites = _complete_section(
+        retrieved, llm, "web_content_landing_and_seo.j2",
+        _SECTION_QUERIES["landing"] + _SECTION_QUERIES["seo"], dict,
+        tone=tone, length=length, audience=audience, factsheet_summary=factsheet_summary,
     )
-    raw = llm.complete(prompt)
-    data = _parse_json(raw) if raw else {}
-    if not isinstance(data, dict):
-        data = {}
+    landing_data = data.get("landing")
+    seo_data = data.get("seo")
+    return (
+        _build_landing_page(
+            landing_data if isinstance(landing_data, dict) else {},
+            meta_map,
+            valid_specs,
+            extract_cites,
+        ),
+        _build_seo(seo_data if isinstance(seo_data, dict) else {}),
+    )
+
+
+def _build_landing_page(
+    data: dict[str, Any],
+    meta_map: dict[str, dict[str, Any]],
+    valid_specs: frozenset[tuple[str, str]],
+    extract_cites: Callable[[str], list[str]] = _extract_inline_cites,
+) -> LandingPageDraft:
+    evidence_cache: dict[str, EvidenceRef] = {}
 
     # Benefits
     benefits: list[BenefitItem] = []
-    for b in (data.get("benefits") or []):
+    for b in _iter_field(data, "benefits"):
         if not isinstance(b, dict):
             continue
-        cited = [str(c) for c in (b.get("cited_chunk_ids") or [])]
-        inline = _extract_inline_cites(str(b.get("description", "")))
-        all_ids = list(dict.fromkeys(cited + inline))
+        description = str(b.get("description", ""))
+        cited = [str(c) for c in _iter_field(b, "cited_chunk_ids")]
+        all_ids = ordered_union(cited, extract_cites(description))
         benefits.append(BenefitItem(
             headline=str(b.get("headline", "")),
-            description=str(b.get("description", "")),
+            description=description,
             is_factual=bool(b.get("is_factual", True)),
-            evidence=_to_evidence_refs(all_ids, meta_map),
+            evidence=_to_evidence_refs(all_ids, meta_map, evidence_cache),
         ))
 
     # Specs explained — enforce grounding
     specs_explained: list[SpecExplained] = []
-    for s in (data.get("specs_explained") or []):
+    for s in _iter_field(data, "specs_explained"):
         if not isinstance(s, dict):
             continue
         name = str(s.get("spec_name", ""))
         value = str(s.get("spec_value", ""))
-        if not _spec_is_grounded(name, value, valid_specs):
+        if (name.strip().casefold(), value.strip().casefold()) not in valid_specs:
             logger.warning("Dropping ungrounded spec: %s = %s", name, value)
             continue
-        cited = [str(c) for c in (s.get("cited_chunk_ids") or [])]
-        inline = _extract_inline_cites(str(s.get("plain_language", "")))
-        all_ids = list(dict.fromkeys(cited + inline))
+        plain_language = str(s.get("plain_language", ""))
+        cited = [str(c) for c in _iter_field(s, "cited_chunk_ids")]
+        all_ids = ordered_union(cited, extract_cites(plain_language))
         specs_explained.append(SpecExplained(
             spec_name=name,
             spec_value=value,
             unit=str(s.get("unit", "")),
-            plain_language=str(s.get("plain_language", "")),
-            evidence=_to_evidence_refs(all_ids, meta_map),
+            plain_language=plain_language,
+            evidence=_to_evidence_refs(all_ids, meta_map, evidence_cache),
         ))
 
     # Problem / solution / how it works
@@ -287,139 +407,172 @@ def _generate_landing_page(
 
 
 def _generate_faq(
-    store: object,
+    retrieved: dict[str, list[dict[str, Any]]],
     llm: object,
-    sheet: ProductFactSheet,
+    factsheet_summary: str,
     tone: str,
     length: str,
     audience: str,
-    meta_map_out: dict[str, dict[str, Any]],
 ) -> list[FAQItem]:
-    context_text, meta_map = _build_context(store, _SECTION_QUERIES["faq"])
-    meta_map_out.update(meta_map)
-
-    prompt = _render_prompt(
-        "web_content_faq.j2",
-        tone=tone,
-        length=length,
-        audience=audience,
-        factsheet_summary=_factsheet_summary(sheet),
-        chunk_text=context_text,
+    items, meta_map, extract_cites = _complete_section(
+        retrieved, llm, "web_content_faq.j2", _SECTION_QUERIES["faq"], list,
+        tone=tone, length=length, audience=audience, factsheet_summary=factsheet_summary,
     )
-    raw = llm.complete(prompt)
-    items = _parse_json(raw) if raw else []
-    if not isinstance(items, list):
-        items = []
+    return _build_faq(items, meta_map, extract_cites)
+
+
+def _build_faq(
+    items: Iterable[Any],
+    meta_map: dict[str, dict[str, Any]],
+    extract_cites: Callable[[str], list[str]] = _extract_inline_cites,
+) -> list[FAQItem]:
+    evidence_cache: dict[str, EvidenceRef] = {}
 
     faq_items: list[FAQItem] = []
     for item in items:
         if not isinstance(item, dict):
             continue
-        cited = [str(c) for c in (item.get("cited_chunk_ids") or [])]
-        inline = _extract_inline_cites(str(item.get("answer", "")))
-        all_ids = list(dict.fromkeys(cited + inline))
+        answer = str(item.get("answer", ""))
+        cited = [str(c) for c in _iter_field(item, "cited_chunk_ids")]
+        all_ids = ordered_union(cited, extract_cites(answer))
         faq_items.append(FAQItem(
             question=str(item.get("question", "")),
-            answer=str(item.get("answer", "")),
+            answer=answer,
             is_factual=bool(item.get("is_factual", True)),
-            evidence=_to_evidence_refs(all_ids, meta_map),
+            evidence=_to_evidence_refs(all_ids, meta_map, evidence_cache),
         ))
     return faq_items
 
 
-def _generate_use_case_pages(
-    store: object,
+def _generate_faq_batch(
+    jobs: list[tuple[str, dict[str, list[dict[str, Any]]], str]],
     llm: object,
-    sheet: ProductFactSheet,
     tone: str,
     length: str,
     audience: str,
-    meta_map_out: dict[str, dict[str, Any]],
-) -> list[UseCasePageDraft]:
-    context_text, meta_map = _build_context(store, _SECTION_QUERIES["usecases"])
-    meta_map_out.update(meta_map)
+) -> dict[str, list[FAQItem]]:
+    """Generate the FAQ for several products with one LLM call.
+
+    ``jobs`` holds ``(product_id, retrieved, factsheet_summary)`` per product.  The response is routed back by ``product_id``; a product the
+    model left out (or a batch of one) falls back to its own ``_generate_faq``
+    call, so every job gets an answer.
+    """
+    if len(jobs) == 1:
+        product_id, retrieved, factsheet_summary = jobs[0]
+        return {product_id: _generate_faq(retrieved, llm, factsheet_summary, tone, length, audience)}
+
+    products: list[dict[str, str]] = []
+    meta_maps: dict[str, dict[str, dict[str, Any]]] = {}
+    for product_id, retrieved, factsheet_summary in jobs:
+        context_text, meta_maps[product_id] = _build_context(retrieved, _SECTION_QUERIES["faq"])
+        products.append({
+            "product_id": product_id,
+            "factsheet_summary": factsheet_summary,
+            "chunk_text": context_text,
+        })
 
     prompt = _render_prompt(
-        "web_content_usecases.j2",
+        "web_content_faq_batch.j2",
         tone=tone,
         length=length,
         audience=audience,
-        factsheet_summary=_factsheet_summary(sheet),
-        chunk_text=context_text,
+        products=products,
     )
     raw = llm.complete(prompt)
-    items = _parse_json(raw) if raw else []
-    if not isinstance(items, list):
-        items = []
+    entries = _parse_json(raw) if raw else None
+    extract_cites = _inline_cite_extractor(raw or "")
+
+    by_product: dict[str, Any] = {}
+    for entry in entries if isinstance(entries, list) else _EMPTY:
+        if isinstance(entry, dict) and isinstance(entry.get("faq"), list):
+            by_product.setdefault(str(entry.get("product_id", "")), entry["faq"])
+
+    results: dict[str, list[FAQItem]] = {}
+    for product_id, retrieved, factsheet_summary in jobs:
+        items = by_product.get(product_id)
+        if items is None:
+            logger.warning("Batched FAQ response missing product %s; generating it alone", product_id)
+            results[product_id] = _generate_faq(retrieved, llm, factsheet_summary, tone, length, audience)
+            continue
+        results[product_id] = _build_faq(items, meta_maps[product_id], extract_cites)
+    return results
+
+
+def _generate_use_case_pages(
+    retrieved: dict[str, list[dict[str, Any]]],
+    llm: object,
+    factsheet_summary: str,
+    tone: str,
+    length: str,
+    audience: str,
+) -> list[UseCasePageDraft]:
+    items, meta_map, extract_cites = _complete_section(
+        retrieved, llm, "web_content_usecases.j2", _SECTION_QUERIES["usecases"], list,
+        tone=tone, length=length, audience=audience, factsheet_summary=factsheet_summary,
+    )
+    evidence_cache: dict[str, EvidenceRef] = {}
 
     pages: list[UseCasePageDraft] = []
     for item in items:
         if not isinstance(item, dict):
             continue
-        cited = [str(c) for c in (item.get("cited_chunk_ids") or [])]
-        for field in ("problem_context", "solution_fit", "implementation_notes"):
-            cited.extend(_extract_inline_cites(str(item.get(field, ""))))
-        for b in (item.get("benefits") or []):
-            cited.extend(_extract_inline_cites(str(b)))
-        all_ids = list(dict.fromkeys(cited))
+        problem_context = str(item.get("problem_context", ""))
+        solution_fit = str(item.get("solution_fit", ""))
+        implementation_notes = str(item.get("implementation_notes", ""))
+        benefits = [str(b) for b in _iter_field(item, "benefits")]
+        cited = [str(c) for c in _iter_field(item, "cited_chunk_ids")]
+        # One regex pass over every text field instead of one per field.
+        inline = extract_cites(
+            _FIELD_SEP.join((problem_context, solution_fit, implementation_notes, *benefits))
+        )
+        all_ids = ordered_union(cited, inline)
 
         pages.append(UseCasePageDraft(
             title=str(item.get("title", "")),
             slug=str(item.get("slug", "")),
             is_suggested=bool(item.get("is_suggested", False)),
-            problem_context=str(item.get("problem_context", "")),
-            solution_fit=str(item.get("solution_fit", "")),
-            benefits=[str(b) for b in (item.get("benefits") or [])],
-            implementation_notes=str(item.get("implementation_notes", "")),
-            evidence=_to_evidence_refs(all_ids, meta_map),
+            problem_context=problem_context,
+            solution_fit=solution_fit,
+            benefits=benefits,
+            implementation_notes=implementation_notes,
+            evidence=_to_evidence_refs(all_ids, meta_map, evidence_cache),
         ))
     return pages
 
 
 def _generate_comparisons(
-    store: object,
+    retrieved: dict[str, list[dict[str, Any]]],
     llm: object,
-    sheet: ProductFactSheet,
+    factsheet_summary: str,
     tone: str,
     length: str,
     audience: str,
-    meta_map_out: dict[str, dict[str, Any]],
-    valid_specs: set[str],
+    valid_specs: frozenset[tuple[str, str]],
 ) -> list[ComparisonDraft]:
-    context_text, meta_map = _build_context(store, _SECTION_QUERIES["comparisons"])
-    meta_map_out.update(meta_map)
-
-    prompt = _render_prompt(
-        "web_content_comparisons.j2",
-        tone=tone,
-        length=length,
-        audience=audience,
-        factsheet_summary=_factsheet_summary(sheet),
-        chunk_text=context_text,
+    items, meta_map, extract_cites = _complete_section(
+        retrieved, llm, "web_content_comparisons.j2", _SECTION_QUERIES["comparisons"], list,
+        tone=tone, length=length, audience=audience, factsheet_summary=factsheet_summary,
     )
-    raw = llm.complete(prompt)
-    items = _parse_json(raw) if raw else []
-    if not isinstance(items, list):
-        items = []
+    evidence_cache: dict[str, EvidenceRef] = {}
 
     comparisons: list[ComparisonDraft] = []
     for item in items:
         if not isinstance(item, dict):
             continue
         dimensions: list[ComparisonDimension] = []
-        for d in (item.get("dimensions") or []):
+        for d in _iter_field(item, "dimensions"):
             if not isinstance(d, dict):
                 continue
-            inline = _extract_inline_cites(str(d.get("this_product", "")))
+            this_product = str(d.get("this_product", ""))
             dimensions.append(ComparisonDimension(
                 dimension=str(d.get("dimension", "")),
-                this_product=str(d.get("this_product", "")),
+                this_product=this_product,
                 generic_alternative=str(d.get("generic_alternative", "")),
-                evidence=_to_evidence_refs(inline, meta_map),
+                evidence=_to_evidence_refs(extract_cites(this_product), meta_map, evidence_cache),
             ))
 
-        best_for_raw = [str(b) for b in (item.get("best_for") or [])]
-        not_ideal_raw = [str(n) for n in (item.get("not_ideal_for") or [])]
+        best_for_raw = [str(b) for b in _iter_field(item, "best_for")]
+        not_ideal_raw = [str(n) for n in _iter_field(item, "not_ideal_for")]
 
         comparisons.append(ComparisonDraft(
             title=str(item.get("title", "")),
@@ -430,26 +583,9 @@ def _generate_comparisons(
     return comparisons
 
 
-def _generate_seo(
-    llm: object,
-    sheet: ProductFactSheet,
-    tone: str,
-    audience: str,
-    valid_specs: set[str],
-) -> SEODraft:
-    prompt = _render_prompt(
-        "web_content_seo.j2",
-        tone=tone,
-        audience=audience,
-        factsheet_summary=_factsheet_summary(sheet),
-    )
-    raw = llm.complete(prompt)
-    data = _parse_json(raw) if raw else {}
-    if not isinstance(data, dict):
-        data = {}
-
+def _build_seo(data: dict[str, Any]) -> SEODraft:
     headings: list[SEOHeading] = []
-    for h in (data.get("headings") or []):
+    for h in _iter_field(data, "headings"):
         if not isinstance(h, dict):
             continue
         tag = h.get("tag", "h2")
@@ -473,17 +609,20 @@ def _generate_seo(
 # Data loading helpers
 # ---------------------------------------------------------------------------
 
+def _load_json_file(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
 def load_factsheet(path: Path) -> ProductFactSheet:
     """Load strict ProductFactSheet from factsheet.json."""
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-    return ProductFactSheet.model_validate(data)
+    return ProductFactSheet.model_validate(_load_json_file(path))
 
 
 def load_audit(path: Path) -> tuple[Scorecard | None, list[AuditFinding]]:
     """Load audit.json → (scorecard | None, findings)."""
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json_file(path)
     scorecard = None
     if "scorecard" in data and data["scorecard"]:
         scorecard = Scorecard.model_validate(data["scorecard"])
@@ -514,9 +653,8 @@ def _build_source_text_sample(
     that appear in the generated drafts.
     """
     text, _ = _build_context(
-        store,
+        _retrieve(store, _GUARDRAIL_QUERIES, n_results=25),
         _GUARDRAIL_QUERIES,
-        n_results=25,
         max_chars=max_chars,
     )
     return text
@@ -553,32 +691,75 @@ def generate_web_content(
     factsheet_path, audit_path : for metadata recording
     """
     t0 = time.time()
-    meta_map_all: dict[str, dict[str, Any]] = {}
-    valid_specs = _build_valid_spec_set(sheet)
-
-    # 1. Landing page
-    logger.info("Generating landing page draft (tone=%s, length=%s, audience=%s)", tone, length, audience)
-    landing = _generate_landing_page(store, llm, sheet, tone, length, audience, meta_map_all, valid_specs)
+    logger.info("Retrieving source chunks for %d unique section queries", len(_ALL_SECTION_QUERIES))
+    retrieved = _retrieve_all_sections(store)
+    return _generate_sections(
+        store=store,
+        llm=llm,
+        sheet=sheet,
+        product_id=product_id,
+        retrieved=retrieved,
+        faq=None,
+        started_at=t0,
+        tone=tone,
+        length=length,
+        audience=audience,
+        llm_provider_name=llm_provider_name,
+        llm_model_name=llm_model_name,
+        factsheet_path=factsheet_path,
+        audit_path=audit_path,
+    )
 
-    # 2. FAQ
-    logger.info("Generating FAQ items")
-    faq = _generate_faq(store, llm, sheet, tone, length, audience, meta_map_all)
 
-    # 3. Use-case pages
-    logger.info("Generating use-case pages")
-    usecases = _generate_use_case_pages(store, llm, sheet, tone, length, audience, meta_map_all)
+def _generate_sections(
+    *,
+    store: object,
+    llm: object,
+    sheet: ProductFactSheet,
+    product_id: str,
+    retrieved: dict[str, list[dict[str, Any]]],
+    faq: list[FAQItem] | None,
+    started_at: float,
+    tone: str,
+    length: str,
+    audience: str,
+    llm_provider_name: str,
+    llm_model_name: str,
+    factsheet_path: str,
+    audit_path: str,
+) -> tuple[WebContentDrafts, GenerationMetadata]:
+    """Generate the sections from pre-retrieved chunks, run guardrails and build metadata.
 
-    # 4. Comparisons
-    logger.info("Generating comparison drafts")
-    comparisons = _generate_comparisons(store, llm, sheet, tone, length, audience, meta_map_all, valid_specs)
+    ``faq`` carries the FAQ items when they were already generated in a
+    cross-product batch; otherwise the FAQ is generated here with the other sections.
+    """
+    valid_specs = _build_valid_spec_set(sheet)
 
-    # 5. SEO
-    logger.info("Generating SEO draft")
-    seo = _generate_seo(llm, sheet, tone, audience, valid_specs)
+    # The sections are independent LLM round-trips, so run them concurrently.
+    # Landing page and SEO share one prompt (see _generate_landing_and_seo).
+    logger.info(
+        "Generating web-content sections concurrently (tone=%s, length=%s, audience=%s)",
+        tone, length, audience,
+    )
+    # Every section prompt embeds the same fact sheet summary; build it once.
+    args = (retrieved, llm, _factsheet_summary(sheet), tone, length, audience)
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        # The guardrail source sample only reads the store, so fetch it while the LLM works.
+        source_text_f = pool.submit(_build_source_text_sample, store)
+        landing_seo_f = pool.submit(_generate_landing_and_seo, *args, valid_specs)
+        if faq is None:
+            faq_f = pool.submit(_generate_faq, *args)
+        usecases_f = pool.submit(_generate_use_case_pages, *args)
+        comparisons_f = pool.submit(_generate_comparisons, *args, valid_specs)
+        landing, seo = landing_seo_f.result()
+        faq_items = faq_f.result() if faq is None else faq
+        usecases = usecases_f.result()
+        comparisons = comparisons_f.result()
+        source_text = source_text_f.result()
 
     drafts = WebContentDrafts(
         landing_page=landing,
-        faq=faq,
+        faq=faq_items,
         use_case_pages=usecases,
         comparisons=comparisons,
         seo=seo,
@@ -588,10 +769,9 @@ def generate_web_content(
     # 6. Guardrail pass — validate all draft text fields before returning
     # ------------------------------------------------------------------
     logger.info("Running post-generation guardrail pass")
-    source_text = _build_source_text_sample(store)
     guardrail_warnings = run_draft_guardrails(drafts, sheet, source_text=source_text)
 
-    elapsed = time.time() - t0
+    elapsed = time.time() - started_at
 
     metadata = GenerationMetadata(
         product_id=product_id,
@@ -600,7 +780,7 @@ def generate_web_content(
         audience=audience,
         llm_provider=llm_provider_name,
         llm_model=llm_model_name,
-        generated_at=__import__("datetime").datetime.utcnow(),
+        generated_at=datetime.now(timezone.utc),
         generation_duration_s=round(elapsed, 2),
         factsheet_path=factsheet_path,
         audit_path=audit_path,
@@ -608,3 +788,77 @@ def generate_web_content(
     )
 
     return drafts, metadata
+
+
+def generate_web_content_batch(
+    items: list[tuple[object, ProductFactSheet, str]],
+    *,
+    llm: object,
+    batch_size: int = 4,
+    max_workers: int = 4,
+    tone: str = "neutral",
+    length: str = "medium",
+    audience: str = "ops_manager",
+    llm_provider_name: str = "",
+    llm_model_name: str = "",
+) -> dict[str, tuple[WebContentDrafts, GenerationMetadata]]:
+    """Generate web content for many products, batching FAQ prompts across them.
+
+    Parameters
+    ----------
+    items : ``(store, sheet, product_id)`` per product; product ids must be unique
+    llm : LLM provider instance (has .complete), shared by every product
+    batch_size : products whose FAQ prompts are combined into one LLM call
+    max_workers : products (and FAQ batches) processed concurrently
+    tone, length, audience : generation parameters, shared so prompts can be batched
+    llm_provider_name, llm_model_name : for metadata recording
+
+    Returns ``{product_id: (drafts, metadata)}`` in input order.  The remaining
+    sections are generated per product exactly as in ``generate_web_content``.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    product_ids = [product_id for _, _, product_id in items]
+    if len(set(product_ids)) != len(product_ids):
+        raise ValueError("generate_web_content_batch requires unique product ids")
+
+    t0 = time.time()
+    logger.info("Retrieving source chunks for %d products", len(items))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        retrieved_all = list(pool.map(lambda item: _retrieve_all_sections(item[0]), items))
+
+    jobs = [
+        (product_id, retrieved, _factsheet_summary(sheet))
+        for (_, sheet, product_id), retrieved in zip(items, retrieved_all)
+    ]
+    batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+    logger.info("Generating FAQs for %d products in %d batched calls", len(jobs), len(batches))
+    faqs: dict[str, list[FAQItem]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for batch_result in pool.map(
+            lambda batch: _generate_faq_batch(batch, llm, tone, length, audience), batches,
+        ):
+            faqs.update(batch_result)
+
+    def _finish(index: int) -> tuple[WebContentDrafts, GenerationMetadata]:
+        store, sheet, product_id = items[index]
+        return _generate_sections(
+            store=store,
+            llm=llm,
+            sheet=sheet,
+            product_id=product_id,
+            retrieved=retrieved_all[index],
+            faq=faqs[product_id],
+            started_at=t0,
+            tone=tone,
+            length=length,
+            audience=audience,
+            llm_provider_name=llm_provider_name,
+            llm_model_name=llm_model_name,
+            factsheet_path="",
+            audit_path="",
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_finish, range(len(items))))
+    return dict(zip(product_ids, results))
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
 import logging
+import os
+import tempfile
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -11,9 +15,56 @@ from typing import Any, Protocol
 
 from pda.config import get_settings
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Pretty-printed UTF-8 JSON; values json cannot encode (e.g. datetimes) go through str()."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a uniquely named sibling temp file and swap it in, so readers never see a torn file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# (product_id, params_hash, tone, length, audience, drafts_json) — the arguments of save().
+DraftRow = tuple[str, str, str, str, str, dict[str, Any]]
+
+
+def _new_draft_id() -> str:
+    return f"draft_{uuid.uuid4().hex[:16]}"
+
+
 class DraftsStore(Protocol):
     def save(
         self,
@@ -24,6 +75,7 @@ class DraftsStore(Protocol):
         audience: str,
         drafts_json: dict[str, Any],
     ) -> str: ...
+    def save_many(self, rows: list[DraftRow]) -> list[str]: ...
     def get_latest(self, product_id: str) -> dict[str, Any] | None: ...
 
 
@@ -31,17 +83,67 @@ class DraftsStore(Protocol):
 # Postgres implementation
 # ---------------------------------------------------------------------------
 
+# The id ("draft_" + 16 hex chars, as in _new_draft_id) is generated server-side
+# (gen_random_uuid, PostgreSQL 13+) and handed back by RETURNING.
+_INSERT_DRAFT_SQL = """
+    INSERT INTO product_content_drafts
+    (id, product_id, params_hash, tone, length, audience, drafts_json, created_at)
+    VALUES (
+        'draft_' || left(replace(gen_random_uuid()::text, '-', ''), 16),
+        %s, %s, %s, %s, %s, %s::jsonb, NOW()
+    )
+    RETURNING id
+"""
+# created_at is left to its NOW() column default.
+_COPY_DRAFTS_SQL = """
+    COPY product_content_drafts
+    (id, product_id, params_hash, tone, length, audience, drafts_json)
+    FROM STDIN
+"""
+
+
+# Seconds to wait for the pool's first connection before giving up.
+_POOL_OPEN_TIMEOUT_SECONDS = 5.0
+
+
 class PostgresDraftsStore:
-    """Persist drafts in product_content_drafts table."""
+    """Persist drafts in product_content_drafts table.
+
+    Connections come from a pool (up to ``max_size``), so concurrent callers
+    do not queue on one connection and dropped connections are replaced.
+    """
 
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, max_size: int = 8):
         self._url = database_url
-        self._conn = self._connect()
+        self._pool = self._connect(max_size)
 
-    def _connect(self):
+    def _connect(self, max_size: int):
         try:
-            import psycopg
-            conn = psycopg.connect(self._url, autocommit=True)
+            from psycopg_pool import ConnectionPool
+        except ImportError:
+            raise ImportError(
+                "psycopg and psycopg_pool required for Postgres drafts store. "
+                "pip install 'psycopg[binary,pool]'"
+            )
+        pool = ConnectionPool(
+            self._url,
+            min_size=1,
+            max_size=max_size,
+            kwargs={"autocommit": True},
+            open=False,
+        )
+        try:
+            # Fail fast on an unreachable database so get_drafts_store can fall back.
+            pool.open(wait=True, timeout=_POOL_OPEN_TIMEOUT_SECONDS)
+            self._create_schema(pool)
+        except Exception:
+            pool.close()  # stop the pool's background reconnect workers
+            raise
+        return pool
+
+    @staticmethod
+    def _create_schema(pool) -> None:
+        with pool.connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS product_content_drafts (
                     id TEXT PRIMARY KEY,
@@ -58,11 +160,6 @@ class PostgresDraftsStore:
                 CREATE INDEX IF NOT EXISTS idx_product_content_drafts_product
                 ON product_content_drafts (product_id, created_at DESC)
             """)
-            return conn
-        except ImportError:
-            raise ImportError(
-                "psycopg required for Postgres drafts store. pip install 'psycopg[binary]'"
-            )
 
     def save(
         self,
@@ -73,30 +170,52 @@ class PostgresDraftsStore:
         audience: str,
         drafts_json: dict[str, Any],
     ) -> str:
-        draft_id = f"draft_{uuid.uuid4().hex[:16]}"
-        self._conn.execute(
-            """
-            INSERT INTO product_content_drafts
-            (id, product_id, params_hash, tone, length, audience, drafts_json, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb, NOW())
-            """,
-            (draft_id, product_id, params_hash, tone, length, audience, json.dumps(drafts_json)),
-        )
-        return draft_id
+        # prepare=True keeps a server-side plan for the insert on each pooled connection.
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                _INSERT_DRAFT_SQL,
+                (product_id, params_hash, tone, length, audience, _dumps(drafts_json)),
+                prepare=True,
+            ).fetchone()
+        return row[0]
+
+    def save_many(self, rows: list[DraftRow]) -> list[str]:
+        """Insert many drafts with a single COPY; returns their ids in order.
+
+        All rows get the same ``created_at`` (the statement's ``NOW()``), so pass
+        at most one draft per product to keep ``get_latest`` unambiguous.
+        """
+        from psycopg.types.json import Jsonb
+
+        draft_ids = [_new_draft_id() for _ in rows]
+        with (
+            self._pool.connection() as conn,
+            conn.cursor() as cur,
+            cur.copy(_COPY_DRAFTS_SQL) as copy,
+        ):
+            for draft_id, (product_id, params_hash, tone, length, audience, drafts_json) in zip(
+                draft_ids, rows,
+            ):
+                copy.write_row((
+                    draft_id, product_id, params_hash, tone, length, audience,
+                    Jsonb(drafts_json, dumps=_dumps),
+                ))
+        return draft_ids
 
     def get_latest(self, product_id: str) -> dict[str, Any] | None:
-        row = self._conn.execute(
-            """
-            SELECT drafts_json FROM product_content_drafts
-            WHERE product_id = %s
-            ORDER BY created_at DESC LIMIT 1
-            """,
-            (product_id,),
-        ).fetchone()
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT drafts_json FROM product_content_drafts
+                WHERE product_id = %s
+                ORDER BY created_at DESC LIMIT 1
+                """,
+                (product_id,),
+            ).fetchone()
         if not row:
             return None
         data = row[0]
-        return data if isinstance(data, dict) else json.loads(data)
+        return data if isinstance(data, dict) else _loads(data)
 
 
 # ---------------------------------------------------------------------------
@@ -104,13 +223,22 @@ class PostgresDraftsStore:
 # ---------------------------------------------------------------------------
 
 class FileDraftsStore:
-    """Persist drafts as JSON files. One file per product (latest overwrites)."""
+    """Persist drafts as JSON files. One file per product (latest overwrites).
+
+    ``index.json`` is rewritten after every ``flush_every`` saves (and at the end
+    of ``save_many``); call ``flush()`` to write pending index updates sooner.
+    Pending updates are also flushed at interpreter exit.
+    """
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, flush_every: int = 1):
         self._dir = Path(data_dir) / "drafts"
         self._dir.mkdir(parents=True, exist_ok=True)
         self._index_path = self._dir / "index.json"
         self._index: dict[str, str] = self._load_index()
+        self._flush_every = max(1, flush_every)
+        self._pending = 0
+        if self._flush_every > 1:
+            atexit.register(self.flush)
 
     def _load_index(self) -> dict[str, str]:
         if self._index_path.exists():
@@ -122,13 +250,18 @@ class FileDraftsStore:
         return {}
 
     def _save_index(self) -> None:
-        with open(self._index_path, "w", encoding="utf-8") as f:
-            json.dump(self._index, f, indent=2)
+        _atomic_write_bytes(self._index_path, _dumps_indented(self._index))
+
+    def flush(self) -> None:
+        """Write pending index updates to disk."""
+        if self._pending:
+            self._save_index()
+            self._pending = 0
 
     def _draft_path(self, product_id: str) -> Path:
         return self._dir / f"{product_id}.json"
 
-    def save(
+    def _write_draft(
         self,
         product_id: str,
         params_hash: str,
@@ -137,7 +270,7 @@ class FileDraftsStore:
         audience: str,
         drafts_json: dict[str, Any],
     ) -> str:
-        draft_id = f"draft_{uuid.uuid4().hex[:16]}"
+        draft_id = _new_draft_id()
         payload = {
             "id": draft_id,
             "product_id": product_id,
@@ -148,19 +281,35 @@ class FileDraftsStore:
             "drafts_json": drafts_json,
             "created_at": datetime.utcnow().isoformat(),
         }
-        path = self._draft_path(product_id)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, default=str)
+        _atomic_write_bytes(self._draft_path(product_id), _dumps_indented(payload))
         self._index[product_id] = draft_id
-        self._save_index()
+        self._pending += 1
         return draft_id
 
+    def save(
+        self,
+        product_id: str,
+        params_hash: str,
+        tone: str,
+        length: str,
+        audience: str,
+        drafts_json: dict[str, Any],
+    ) -> str:
+        draft_id = self._write_draft(product_id, params_hash, tone, length, audience, drafts_json)
+        if self._pending >= self._flush_every:
+            self.flush()
+        return draft_id
+
+    def save_many(self, rows: list[DraftRow]) -> list[str]:
+        draft_ids = [self._write_draft(*row) for row in rows]
+        self.flush()
+        return draft_ids
+
     def get_latest(self, product_id: str) -> dict[str, Any] | None:
         path = self._draft_path(product_id)
         if not path.exists():
             return None
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _loads(path.read_bytes())
         return data.get("drafts_json")
 
 
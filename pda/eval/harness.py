@@ -3,18 +3,44 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
-from jinja2 import Environment, FileSystemLoader
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+from pda.prompt_env import PROMPT_ENV
 
 logger = logging.getLogger(__name__)
-PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
 MAX_CONTEXT_CHARS = 12_000
+# Output files are written in many small pieces (csv rows, json.dump tokens).
+_WRITE_BUFFER_SIZE = 1 << 20
+
+_ANSWER_TEMPLATE = PROMPT_ENV.get_template("eval_rag_answer.j2")
+_JUDGE_TEMPLATE = PROMPT_ENV.get_template("eval_judge.j2")
+
+_CODE_FENCE_OPEN_RE = re.compile(r"^```\w*\n?")
+_CODE_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
+_INLINE_CITE_RE = re.compile(r"\[(pdf-[^\]]+|url-[^\]]+)\]")
+# Sentence boundaries (". ", "! ", "? ") but not the point in "2.5".
+_SENTENCE_SPLIT_RE = re.compile(r"(?<!\d)[.!?]+(?:\s|$)")
 
 
 # ── Data structures ──────────────────────────────────────────────────────
@@ -22,6 +48,8 @@ MAX_CONTEXT_CHARS = 12_000
 class EvalPrompt:
     """A single evaluation prompt loaded from YAML."""
 
+    __slots__ = ("id", "category", "prompt", "must_cover")
+
     def __init__(self, data: dict):
         self.id: str = str(data.get("id", ""))
         self.category: str = str(data.get("category", ""))
@@ -29,19 +57,19 @@ class EvalPrompt:
         self.must_cover: list[str] = data.get("must_cover", []) or []
 
 
+@dataclass(slots=True)
 class EvalResult:
     """Result for one prompt: answer, citations, and scores."""
 
-    def __init__(self):
-        self.prompt_id: str = ""
-        self.category: str = ""
-        self.prompt_text: str = ""
-        self.answer: str = ""
-        self.cited_chunk_ids: list[str] = []
-        self.completeness: int = 0
-        self.correctness: int = 0
-        self.citation_coverage: int = 0
-        self.rationale: str = ""
+    prompt_id: str = ""
+    category: str = ""
+    prompt_text: str = ""
+    answer: str = ""
+    cited_chunk_ids: list[str] = field(default_factory=list)
+    completeness: int = 0
+    correctness: int = 0
+    citation_coverage: int = 0
+    rationale: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -57,6 +85,56 @@ class EvalResult:
         }
 
 
+# ── LLM completion cache ─────────────────────────────────────────────────
+
+class _CachedLLM:
+    """Wrap an LLM provider so identical prompts are completed only once.
+
+    Completions are keyed by a BLAKE2b hash of the provider class, the
+    caller-supplied ``model`` identifier and the prompt, kept in memory and, when ``cache_dir`` is given, one file per key so
+    a re-run of the same suite skips prompts it has already answered.  Empty
+    completions and calls with extra kwargs are never cached.
+    """
+
+    def __init__(self, llm: object, model: str, cache_dir: Path | None = None):
+        self._llm = llm
+        self._dir = cache_dir
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._namespace = f"{type(llm).__name__}\0{model}\0"
+
+    def _key(self, prompt: str) -> str:
+        return hashlib.blake2b(
+            (self._namespace + prompt).encode("utf-8"), digest_size=16,
+        ).hexdigest()
+
+    def complete(self, prompt: str, **kwargs: Any) -> str:
+        if kwargs:
+            return self._llm.complete(prompt, **kwargs)
+        key = self._key(prompt)
+        with self._lock:
+            cached = self._memory.get(key)
+        if cached is not None:
+            return cached
+        path = self._dir / f"{key}.txt" if self._dir is not None else None
+        if path is not None and path.exists():
+            text = path.read_text(encoding="utf-8")
+        else:
+            text = self._llm.complete(prompt)
+            if not text:
+                return text
+            if path is not None:
+                # Unique temp name per thread, then an atomic swap into place.
+                tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+                tmp.write_text(text, encoding="utf-8")
+                os.replace(tmp, path)
+        with self._lock:
+            self._memory[key] = text
+        return text
+
+
 # ── YAML loading ─────────────────────────────────────────────────────────
 
 def load_prompts(yaml_path: str | Path) -> list[EvalPrompt]:
@@ -65,7 +143,7 @@ def load_prompts(yaml_path: str | Path) -> list[EvalPrompt]:
     if not path.exists():
         raise FileNotFoundError(f"Prompt YAML not found: {path}")
     with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
     if isinstance(data, list):
         prompts_data = data
     elif isinstance(data, dict):
@@ -86,12 +164,13 @@ def _retrieve_context(store: object, query: str, n_results: int = 10) -> tuple[s
     for r in results:
         cid = r.get("chunk_id", "")
         text = r.get("text", "")
-        snippet = f"[{cid}] {text[:1500]}"
-        if total + len(snippet) > MAX_CONTEXT_CHARS:
+        # "[cid] " prefix + text capped at 1500 chars; check the budget before building it.
+        snippet_len = len(cid) + 3 + min(len(text), 1500)
+        if total + snippet_len > MAX_CONTEXT_CHARS:
             break
-        parts.append(snippet)
+        parts.append(f"[{cid}] {text[:1500]}")
         ids.append(cid)
-        total += len(snippet)
+        total += snippet_len
     return "\n\n".join(parts), ids
 
 
@@ -100,15 +179,13 @@ def _generate_answer(
     buyer_prompt: str,
     llm_provider: object,
 ) -> str:
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    template = env.get_template("eval_rag_answer.j2")
-    prompt = template.render(chunk_text=context, buyer_prompt=buyer_prompt)
+    prompt = _ANSWER_TEMPLATE.render(chunk_text=context, buyer_prompt=buyer_prompt)
     return llm_provider.complete(prompt) or ""
 
 
 def _extract_cited_ids(answer: str) -> list[str]:
     """Extract [chunk-id] citations from the answer text."""
-    return list(dict.fromkeys(re.findall(r"\[(pdf-[^\]]+|url-[^\]]+)\]", answer)))
+    return list(dict.fromkeys(_INLINE_CITE_RE.findall(answer)))
 
 
 # ── Scoring ──────────────────────────────────────────────────────────────
@@ -121,9 +198,7 @@ def _score_answer(
     llm_provider: object,
 ) -> dict:
     """Use an LLM judge to score completeness, correctness, citation coverage."""
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    template = env.get_template("eval_judge.j2")
-    prompt = template.render(
+    prompt = _JUDGE_TEMPLATE.render(
         buyer_prompt=buyer_prompt,
         answer=answer[:4000],
         chunk_text=context,
@@ -132,10 +207,10 @@ def _score_answer(
     raw = llm_provider.complete(prompt) or "{}"
     s = raw.strip()
     if s.startswith("```"):
-        s = re.sub(r"^```\w*\n?", "", s)
-        s = re.sub(r"\n?```\s*$", "", s)
+        s = _CODE_FENCE_OPEN_RE.sub("", s)
+        s = _CODE_FENCE_CLOSE_RE.sub("", s)
     try:
-        data = json.loads(s)
+        data = orjson.loads(s) if orjson is not None else json.loads(s)
     except json.JSONDecodeError:
         data = {}
 
@@ -154,30 +229,85 @@ def _deterministic_citation_coverage(answer: str, available_chunk_ids: list[str]
     Splits on sentence-ending punctuation followed by whitespace or end-of-string,
     avoiding splits on decimal points (e.g. "2.5").
     """
-    # Split on ". " or "! " or "? " (sentence boundaries) but not on "2.5"
-    sentences = [s.strip() for s in re.split(r"(?<!\d)[.!?]+(?:\s|$)", answer) if s.strip()]
-    if not sentences:
-        return 0.0
-    cited = sum(
-        1 for s in sentences if re.search(r"\[(pdf-|url-)", s)
-    )
-    return cited / len(sentences)
+    return _analyze_citations(answer)[1]
+
+
+def _analyze_citations(answer: str) -> tuple[list[str], float]:
+    """Return (cited chunk ids, deterministic citation coverage) for an answer.
+
+    Answers without any "[pdf-" / "[url-" marker short-circuit to ``([], 0.0)``;
+    otherwise the answer is scanned once for ids and split once into sentences,
+    each checked for a marker by substring search.
+    """
+    if "[pdf-" not in answer and "[url-" not in answer:
+        return [], 0.0
+    cited_ids = _extract_cited_ids(answer)
+    # Count in one loop without building stripped copies: a piece is a sentence
+    # when it is not all whitespace, and stripping cannot affect a marker match.
+    n_sentences = cited = 0
+    for piece in _SENTENCE_SPLIT_RE.split(answer):
+        if not piece or piece.isspace():
+            continue
+        n_sentences += 1
+        if "[pdf-" in piece or "[url-" in piece:
+            cited += 1
+    if not n_sentences:
+        return cited_ids, 0.0
+    return cited_ids, cited / n_sentences
 
 
 # ── Main harness ─────────────────────────────────────────────────────────
 
+def _evaluate_prompt(ep: EvalPrompt, store: object, llm_provider: object) -> EvalResult:
+    """Retrieve, answer and score a single prompt."""
+    logger.info("Eval prompt: %s", ep.id or ep.prompt[:60])
+    context, _ = _retrieve_context(store, ep.prompt)
+    answer = _generate_answer(context, ep.prompt, llm_provider)
+    cited_ids, det_cov = _analyze_citations(answer)
+    scores = _score_answer(answer, ep.prompt, context, ep.must_cover, llm_provider)
+
+    # Blend deterministic citation coverage with LLM judge
+    blended_citation = int(
+        0.5 * scores["citation_coverage"] + 0.5 * (det_cov * 10)
+    )
+
+    return EvalResult(
+        prompt_id=ep.id,
+        category=ep.category,
+        prompt_text=ep.prompt,
+        answer=answer,
+        cited_chunk_ids=cited_ids,
+        completeness=scores["completeness"],
+        correctness=scores["correctness"],
+        citation_coverage=min(10, blended_citation),
+        rationale=scores["rationale"],
+    )
+
+
 def run_eval_harness(
     prompts_path: str | Path,
     store: object,
     llm_provider: object,
     out_dir: str | Path,
+    max_workers: int = 8,
+    use_llm_cache: bool = False,
+    llm_model: str | None = None,
 ) -> list[EvalResult]:
     """
     Run the full eval harness:
     1. Load YAML prompts
     2. For each prompt: retrieve chunks, generate answer, score
+       (up to ``max_workers`` prompts at a time)
     3. Write results.json, results.csv, dashboard.html
+
+    With ``use_llm_cache`` (opt-in), completions are cached under
+    ``out_dir/.llm_cache`` keyed by ``llm_model`` so repeated prompts, within a
+    run or across re-runs into the same directory, do not call the LLM again.
+    A cached re-run replays earlier generator and judge outputs instead of
+    re-measuring them.
     """
+    if use_llm_cache and not llm_model:
+        raise ValueError("llm_model is required when use_llm_cache is enabled")
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -186,31 +316,16 @@ def run_eval_harness(
         logger.warning("No prompts loaded from %s", prompts_path)
         return []
 
-    results: list[EvalResult] = []
-    for ep in prompts:
-        logger.info("Eval prompt: %s", ep.id or ep.prompt[:60])
-        context, available_ids = _retrieve_context(store, ep.prompt)
-        answer = _generate_answer(context, ep.prompt, llm_provider)
-        cited_ids = _extract_cited_ids(answer)
-        scores = _score_answer(answer, ep.prompt, context, ep.must_cover, llm_provider)
-
-        # Blend deterministic citation coverage with LLM judge
-        det_cov = _deterministic_citation_coverage(answer, available_ids)
-        blended_citation = int(
-            0.5 * scores["citation_coverage"] + 0.5 * (det_cov * 10)
-        )
+    if use_llm_cache:
+        llm_provider = _CachedLLM(llm_provider, llm_model, out_dir / ".llm_cache")
+
+    # Prompts are independent and dominated by LLM latency, so score them
+    # concurrently; map() keeps results in prompt order.
+    def _process(ep: EvalPrompt) -> EvalResult:
+        return _evaluate_prompt(ep, store, llm_provider)
 
-        r = EvalResult()
-        r.prompt_id = ep.id
-        r.category = ep.category
-        r.prompt_text = ep.prompt
-        r.answer = answer
-        r.cited_chunk_ids = cited_ids
-        r.completeness = scores["completeness"]
-        r.correctness = scores["correctness"]
-        r.citation_coverage = min(10, blended_citation)
-        r.rationale = scores["rationale"]
-        results.append(r)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        results = list(pool.map(_process, prompts))
 
     # ── Write outputs ────────────────────────────────────────────────
     _write_json(results, out_dir / "results.json")
@@ -224,8 +339,12 @@ def run_eval_harness(
 # ── Output writers ───────────────────────────────────────────────────────
 
 def _write_json(results: list[EvalResult], path: Path) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump([r.to_dict() for r in results], f, indent=2, ensure_ascii=False)
+    data = [r.to_dict() for r in results]
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 def _write_csv(results: list[EvalResult], path: Path) -> None:
@@ -233,20 +352,23 @@ def _write_csv(results: list[EvalResult], path: Path) -> None:
         "prompt_id", "category", "prompt", "completeness",
         "correctness", "citation_coverage", "cited_chunk_ids", "rationale",
     ]
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in results:
-            writer.writerow({
-                "prompt_id": r.prompt_id,
-                "category": r.category,
-                "prompt": r.prompt_text,
-                "completeness": r.completeness,
-                "correctness": r.correctness,
-                "citation_coverage": r.citation_coverage,
-                "cited_chunk_ids": ";".join(r.cited_chunk_ids),
-                "rationale": r.rationale[:300],
-            })
+    with open(path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        # Positional rows in fieldnames order; no per-row dict.
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                r.prompt_id,
+                r.category,
+                r.prompt_text,
+                r.completeness,
+                r.correctness,
+                r.citation_coverage,
+                ";".join(r.cited_chunk_ids),
+                r.rationale[:300],
+            )
+            for r in results
+        )
 
 
 def _write_dashboard(results: list[EvalResult], path: Path) -> None:
@@ -255,32 +377,38 @@ def _write_dashboard(results: list[EvalResult], path: Path) -> None:
         path.write_text("<html><body><h1>No results</h1></body></html>", encoding="utf-8")
         return
 
-    n = len(results)
-    avg_comp = sum(r.completeness for r in results) / n
-    avg_corr = sum(r.correctness for r in results) / n
-    avg_cite = sum(r.citation_coverage for r in results) / n
-
-    # Per-category aggregates
-    cats: dict[str, list[EvalResult]] = {}
+    # One pass for per-category sums: [count, completeness, correctness, citation];
+    # the overall averages then come from the (few) category totals.
+    cats: dict[str, list[int]] = {}
     for r in results:
-        cats.setdefault(r.category or "uncategorized", []).append(r)
+        key = r.category or "uncategorized"
+        agg = cats.get(key)
+        if agg is None:
+            agg = cats[key] = [0, 0, 0, 0]
+        agg[0] += 1
+        agg[1] += r.completeness
+        agg[2] += r.correctness
+        agg[3] += r.citation_coverage
+    n = len(results)
+    avg_comp = sum(agg[1] for agg in cats.values()) / n
+    avg_corr = sum(agg[2] for agg in cats.values()) / n
+    avg_cite = sum(agg[3] for agg in cats.values()) / n
 
-    cat_rows = ""
-    for cat, rs in sorted(cats.items()):
-        cn = len(rs)
-        cat_rows += f"""
+    cat_rows: list[str] = []
+    for cat, (cn, c_comp, c_corr, c_cite) in sorted(cats.items()):
+        cat_rows.append(f"""
         <tr>
             <td>{cat}</td>
             <td>{cn}</td>
-            <td>{sum(r.completeness for r in rs)/cn:.1f}</td>
-            <td>{sum(r.correctness for r in rs)/cn:.1f}</td>
-            <td>{sum(r.citation_coverage for r in rs)/cn:.1f}</td>
-        </tr>"""
+            <td>{c_comp/cn:.1f}</td>
+            <td>{c_corr/cn:.1f}</td>
+            <td>{c_cite/cn:.1f}</td>
+        </tr>""")
 
-    detail_rows = ""
+    detail_rows: list[str] = []
     for r in results:
         color = "#4caf50" if r.correctness >= 7 else ("#ff9800" if r.correctness >= 4 else "#f44336")
-        detail_rows += f"""
+        detail_rows.append(f"""
         <tr>
             <td>{r.prompt_id}</td>
             <td>{r.category}</td>
@@ -289,7 +417,7 @@ def _write_dashboard(results: list[EvalResult], path: Path) -> None:
             <td style="color:{color};font-weight:bold">{r.correctness}</td>
             <td>{r.citation_coverage}</td>
             <td>{len(r.cited_chunk_ids)}</td>
-        </tr>"""
+        </tr>""")
 
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -323,13 +451,13 @@ tr:hover {{ background: #fafafa; }}
 <h2>By Category</h2>
 <table>
 <tr><th>Category</th><th>Count</th><th>Completeness</th><th>Correctness</th><th>Citation Cov.</th></tr>
-{cat_rows}
+{"".join(cat_rows)}
 </table>
 
 <h2>Detail Results</h2>
 <table>
 <tr><th>ID</th><th>Category</th><th>Prompt</th><th>Comp.</th><th>Corr.</th><th>Cite.</th><th># Cites</th></tr>
-{detail_rows}
+{"".join(detail_rows)}
 </table>
 </body>
 </html>"""
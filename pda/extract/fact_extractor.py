@@ -2,10 +2,15 @@
 
 import json
 import re
-from pathlib import Path
+from bisect import bisect_right
+from itertools import accumulate
 
-from jinja2 import Environment, FileSystemLoader
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
 
+from pda.prompt_env import PROMPT_ENV
 from pda.schemas.models import (
     ContentRole,
     DocumentChunk,
@@ -14,12 +19,12 @@ from pda.schemas.models import (
     ProductFactSheet,
 )
 
-PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
 MAX_CHUNK_CHARS = 120000  # ~30k tokens
 
+_EXTRACT_TEMPLATE = PROMPT_ENV.get_template("extract_facts.j2")
 
-def _chunk_map(chunks: list[DocumentChunk]) -> dict[str, DocumentChunk]:
-    return {c.chunk_id: c for c in chunks}
+_CODE_FENCE_OPEN_RE = re.compile(r"^```\w*\n?")
+_CODE_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
 
 
 def _to_evidence_ref(
@@ -69,8 +74,10 @@ def _to_fact_value(raw: dict, chunk_by_id: dict[str, DocumentChunk]) -> FactValu
 def _parse_extraction(raw_text: str) -> dict:
     text = raw_text.strip()
     if text.startswith("```"):
-        text = re.sub(r"^```\w*\n?", "", text)
-        text = re.sub(r"\n?```\s*$", "", text)
+        text = _CODE_FENCE_OPEN_RE.sub("", text)
+        text = _CODE_FENCE_CLOSE_RE.sub("", text)
+    if orjson is not None:
+        return orjson.loads(text)
     return json.loads(text)
 
 
@@ -87,25 +94,25 @@ def extract_fact_sheet(
     chunks are appended only if space remains, so the LLM focuses on
     buyer-relevant content.
     """
-    chunk_by_id = _chunk_map(chunks)
-
-    # Prioritize buyer-tagged chunks, then fill with operational if space allows
-    buyer = [c for c in chunks if c.content_role == ContentRole.BUYER]
-    operational = [c for c in chunks if c.content_role == ContentRole.OPERATIONAL]
+    # Index by id and split by role in one pass; buyer-tagged chunks are
+    # prioritized, then operational ones fill any remaining space.
+    chunk_by_id: dict[str, DocumentChunk] = {}
+    buyer: list[DocumentChunk] = []
+    operational: list[DocumentChunk] = []
+    for c in chunks:
+        chunk_by_id[c.chunk_id] = c
+        if c.content_role == ContentRole.BUYER:
+            buyer.append(c)
+        elif c.content_role == ContentRole.OPERATIONAL:
+            operational.append(c)
     ordered = buyer + operational  # buyer first
 
-    total = 0
-    use: list[DocumentChunk] = []
-    for c in ordered:
-        if total + len(c.text) > max_chars:
-            break
-        use.append(c)
-        total += len(c.text)
+    # Greedy prefix: keep chunks until the running length would pass max_chars.
+    cutoff = bisect_right(list(accumulate(len(c.text) for c in ordered)), max_chars)
+    use = ordered[:cutoff]
     if not use:
         use = chunks[:50]
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    template = env.get_template("extract_facts.j2")
-    prompt = template.render(chunks=use)
+    prompt = _EXTRACT_TEMPLATE.render(chunks=use)
     raw = llm_provider.complete(prompt)
     data = _parse_extraction(raw)
 
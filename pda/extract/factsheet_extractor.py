@@ -1,19 +1,35 @@
 """Product Fact Sheet extraction via targeted retrieval and LLM on retrieved chunks only."""
 
+import asyncio
+import hashlib
 import json
+import logging
+import math
 import re
-from pathlib import Path
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from jinja2 import Environment, FileSystemLoader
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
 
+try:
+    import msgspec
+except ImportError:  # optional speed-up; fall back to the lenient validator
+    msgspec = None
+
+from pda.content_pack._json_stream import IncrementalJsonParser
+from pda.prompt_env import PROMPT_ENV
 from pda.schemas.factsheet_schema import (
-    ProductFactSheet,
-    KeySpec,
     Constraint,
     Differentiator,
+    KeySpec,
+    ProductFactSheet,
 )
 
-PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
+logger = logging.getLogger(__name__)
 
 # Targeted queries per section; retrieve() runs with these, then LLM sees only retrieved chunks.
 SECTION_QUERIES = [
@@ -31,119 +47,433 @@ SECTION_QUERIES = [
 
 MAX_RETRIES = 2  # max fix-JSON attempts after initial parse failure
 RETRIEVE_N_RESULTS = 10
+NEAR_DUPLICATE_COSINE = 0.95  # chunks at least this similar to an earlier one are not re-sent
+
+_WORD_RE = re.compile(r"\w+")
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+
+_EXTRACT_TEMPLATE = PROMPT_ENV.get_template("factsheet_extract.j2")
+_FIX_JSON_TEMPLATE = PROMPT_ENV.get_template("factsheet_fix_json.j2")
+_EXTRACT_BATCH_TEMPLATE = PROMPT_ENV.get_template("factsheet_extract_batch.j2")
+
+_CODE_FENCE_OPEN_RE = re.compile(r"^```\w*\n?")
+_CODE_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
+
+# Providers that accept ``response_format`` are asked for schema-shaped JSON up front,
+# so the fix-JSON retry loop below is only a fallback.
+_FACT_SHEET_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "product_fact_sheet",
+        "schema": ProductFactSheet.model_json_schema(),
+        "strict": False,
+    },
+}
+
+
+if msgspec is not None:
+    # Strict mirrors of the fact-sheet schema.  Well-formed responses (all strings
+    # where strings are expected) decode and type-check in one C pass; anything
+    # else fails here and goes through the lenient _validate_with_provenance.
+    class _KeySpecMsg(msgspec.Struct):
+        name: str = ""
+        value: str = ""
+        unit: str = ""
+        conditions: str = ""
+        evidence_chunk_ids: list[str] = []
+
+    class _StatementMsg(msgspec.Struct):
+        statement: str = ""
+        evidence_chunk_ids: list[str] = []
+
+    class _FactSheetMsg(msgspec.Struct):
+        product_name: str = "NOT_FOUND"
+        product_category: str = "NOT_FOUND"
+        primary_use_cases: list[str] = []
+        target_buyer_roles: list[str] = []
+        key_specs: list[_KeySpecMsg] = []
+        constraints: list[_StatementMsg] = []
+        differentiators: list[_StatementMsg] = []
+        certifications_standards: list[str] = []
+        integrations_interfaces: list[str] = []
+        maintenance_calibration: list[str] = []
+        source_coverage_summary: str = "NOT_FOUND"
+
+    _FACT_SHEET_DECODER = msgspec.json.Decoder(_FactSheetMsg)
+
+
+def _structured_output_kwargs(llm_provider) -> dict:
+    if getattr(llm_provider, "supports_response_format", False):
+        return {"response_format": _FACT_SHEET_RESPONSE_FORMAT}
+    return {}
+
+
+# Extracted sheets keyed by (provider, model, rendered prompt) fingerprint -> (expires_at, sheet JSON).
+# Opt-in: only used when a caller passes ``cache_ttl > 0`` together with ``llm_model``.
+_SHEET_CACHE: dict[str, tuple[float, str]] = {}
+_SHEET_CACHE_LOCK = threading.Lock()
+
+
+def clear_sheet_cache() -> None:
+    """Drop every cached fact sheet."""
+    with _SHEET_CACHE_LOCK:
+        _SHEET_CACHE.clear()
+
+
+def _check_cache_args(cache_ttl: float, llm_model: str | None) -> None:
+    if cache_ttl > 0 and not llm_model:
+        raise ValueError("llm_model is required when cache_ttl is positive")
+
+
+def _sheet_cache_key(llm_provider, llm_model: str, prompt: str) -> str:
+    # The rendered prompt already covers the template version and every retrieved chunk id/text.
+    namespace = f"{type(llm_provider).__name__}\0{llm_model}\0"
+    return hashlib.sha256((namespace + prompt).encode("utf-8")).hexdigest()
+
+
+def _sheet_cache_get(key: str) -> ProductFactSheet | None:
+    with _SHEET_CACHE_LOCK:
+        entry = _SHEET_CACHE.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return ProductFactSheet.model_validate_json(entry[1])
+
+
+def _sheet_cache_put(key: str, sheet: ProductFactSheet, ttl: float) -> None:
+    now = time.monotonic()
+    with _SHEET_CACHE_LOCK:
+        for stale in [k for k, (expires_at, _) in _SHEET_CACHE.items() if expires_at < now]:
+            del _SHEET_CACHE[stale]
+        _SHEET_CACHE[key] = (now + ttl, sheet.model_dump_json())
+
+
+def _prompt_cache_kwargs(llm_provider, chunks: list[dict]) -> dict:
+    # The template's "evidence" block (instructions + chunks) leads the prompt and is
+    # identical whenever the same store is extracted again, so providers can cache it.
+    if not getattr(llm_provider, "supports_prompt_cache", False):
+        return {}
+    context = _EXTRACT_TEMPLATE.new_context({"chunks": chunks})
+    return {"prompt_cache_prefix": "".join(_EXTRACT_TEMPLATE.blocks["evidence"](context))}
 
 
 def _chunks_from_store(store, queries: list[str], n_results: int = RETRIEVE_N_RESULTS) -> list[dict]:
-    """Run targeted queries and return deduplicated chunks (by chunk_id)."""
-    seen: set[str] = set()
-    out: list[dict] = []
-    for q in queries:
-        results = store.query(q, n_results=n_results)
+    """Run targeted queries and return deduplicated chunks (by chunk_id, then identical and near-duplicate text).
+
+    Uses the store's ``query_batch`` (one embedding pass) when available,
+    otherwise runs the queries concurrently.
+    """
+    query_batch = getattr(store, "query_batch", None)
+    if callable(query_batch):
+        results_per_query = query_batch(list(queries), n_results=n_results)
+    else:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results_per_query = list(pool.map(lambda q: store.query(q, n_results=n_results), queries))
+
+    # First-seen text per chunk id; dicts keep insertion order.
+    merged: dict[str, str] = {}
+    for results in results_per_query:
         for r in results:
             cid = r.get("chunk_id")
-            if cid and cid not in seen:
-                seen.add(cid)
-                out.append({"chunk_id": cid, "text": r.get("text", "")})
-    return out
+            if cid and cid not in merged:
+                merged[cid] = r.get("text", "")
+    # Identical texts under different ids (e.g. the same table re-chunked per page) go
+    # in one hashed pass, before the quadratic near-duplicate check.
+    unique_texts: dict[str, dict] = {}
+    for cid, text in merged.items():
+        unique_texts.setdefault(" ".join(text.split()), {"chunk_id": cid, "text": text})
+    return _drop_near_duplicates(list(unique_texts.values()))
+
+
+def _drop_near_duplicates(chunks: list[dict], threshold: float = NEAR_DUPLICATE_COSINE) -> list[dict]:
+    """Greedily keep chunks whose word-set cosine to every kept chunk is below ``threshold``.
+
+    Repeated boilerplate (headers, legal text, the same spec table on two pages)
+    otherwise costs prompt tokens without adding evidence.  A chunk is only ever
+    dropped against one with the same numbers in the same order: spec tables for
+    different variants share nearly every word, and the differing values are the
+    evidence.  Order is preserved; the first occurrence wins.
+    """
+    kept: list[dict] = []
+    kept_words: list[frozenset[str]] = []
+    kept_numbers: list[tuple[str, ...]] = []
+    # cos <= sqrt(min/max) for binary vectors, so pairs this far apart in size can't match.
+    min_ratio = threshold * threshold
+    for chunk in chunks:
+        words = frozenset(_WORD_RE.findall(chunk["text"].lower()))
+        numbers = tuple(_NUMBER_RE.findall(chunk["text"]))
+        if words:
+            n = len(words)
+            duplicate = False
+            for other, other_numbers in zip(kept_words, kept_numbers):
+                m = len(other)
+                if min(n, m) < min_ratio * max(n, m) or numbers != other_numbers:
+                    continue
+                if len(words & other) >= threshold * math.sqrt(n * m):
+                    duplicate = True
+                    break
+            if duplicate:
+                continue
+        kept.append(chunk)
+        kept_words.append(words)
+        kept_numbers.append(numbers)
+    return kept
+
+
+def _complete_streaming(stream, prompt: str, **kwargs) -> str:
+    """Collect a streamed completion, stopping as soon as the top-level JSON object closes.
+
+    A leading code fence is skipped.  If the response does not open with ``{`` the
+    stream is abandoned at once and the text so far returned for the fix-JSON retry.
+    """
+    deltas = stream(prompt, **kwargs)
+    parser = IncrementalJsonParser()
+    head = ""  # text seen before the JSON body starts
+    body: list[str] = []
+    try:
+        for delta in deltas:
+            if not body:
+                head += delta
+                text = head.lstrip()
+                if text.startswith("```"):
+                    newline = text.find("\n")
+                    if newline < 0:
+                        continue
+                    text = text[newline + 1:].lstrip()
+                elif "```".startswith(text):
+                    continue  # empty so far, or a fence still arriving
+                if not text:
+                    continue
+                if text[0] != "{":
+                    return head
+                delta = text
+            body.append(delta)
+            parser.feed(delta)
+            if parser.complete:
+                return "".join(body)[:parser.end]
+    finally:
+        close = getattr(deltas, "close", None)
+        if close is not None:
+            close()  # cancels the request if the model is still generating
+    return "".join(body) if body else head
+
+
+def _complete(llm_provider, prompt: str, **kwargs) -> str:
+    stream = getattr(llm_provider, "stream", None)
+    if callable(stream):
+        return _complete_streaming(stream, prompt, **kwargs)
+    return llm_provider.complete(prompt, **kwargs)
 
 
 def _strip_code_fence(raw: str) -> str:
     s = raw.strip()
     if s.startswith("```"):
-        s = re.sub(r"^```\w*\n?", "", s)
-        s = re.sub(r"\n?```\s*$", "", s)
+        s = _CODE_FENCE_OPEN_RE.sub("", s)
+        s = _CODE_FENCE_CLOSE_RE.sub("", s)
     return s.strip()
 
 
 def _parse_json(raw: str) -> dict:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    if orjson is not None:
+        return orjson.loads(_strip_code_fence(raw))
     return json.loads(_strip_code_fence(raw))
 
 
 def _validate_fact_sheet(data: dict) -> ProductFactSheet:
     """Build ProductFactSheet from dict; normalize so Pydantic accepts it."""
-    def norm_list_str(v):
-        if v is None:
-            return []
-        if isinstance(v, list):
-            return [str(x) for x in v]
+    return _validate_with_provenance(data)[0]
+
+
+# Normalizers for the fixed fact-sheet schema, defined once at module scope and
+# applied field by field in _validate_with_provenance.  They coerce to plain
+# dicts/lists; pydantic-core then validates the whole nested structure in one
+# model_validate call.
+
+def _norm_str(v) -> str:
+    return "NOT_FOUND" if v is None else str(v)
+
+
+def _norm_list_str(v) -> list:
+    if not isinstance(v, list):
         return []
+    # LLM output is almost always strings already; pydantic copies the list anyway.
+    if all(type(x) is str for x in v):
+        return v
+    return [str(x) for x in v]
 
-    def norm_key_specs(v):
-        if not isinstance(v, list):
-            return []
-        out = []
-        for item in v:
-            if not isinstance(item, dict):
-                continue
-            out.append(KeySpec(
-                name=str(item.get("name", "")),
-                value=str(item.get("value", "")),
-                unit=str(item.get("unit", "")),
-                conditions=str(item.get("conditions", "")),
-                evidence_chunk_ids=[str(x) for x in (item.get("evidence_chunk_ids") or [])],
-            ))
-        return out
-
-    def norm_constraints(v):
-        if not isinstance(v, list):
-            return []
-        return [
-            Constraint(
-                statement=str(item.get("statement", "")),
-                evidence_chunk_ids=[str(x) for x in (item.get("evidence_chunk_ids") or [])],
-            )
-            for item in v
-            if isinstance(item, dict)
-        ]
 
-    def norm_differentiators(v):
-        if not isinstance(v, list):
-            return []
-        return [
-            Differentiator(
-                statement=str(item.get("statement", "")),
-                evidence_chunk_ids=[str(x) for x in (item.get("evidence_chunk_ids") or [])],
-            )
-            for item in v
-            if isinstance(item, dict)
-        ]
+def _norm_key_specs(v, evidence: list[str]) -> list[dict]:
+    if not isinstance(v, list):
+        return []
+    out = []
+    for item in v:
+        if not isinstance(item, dict):
+            continue
+        ids = [str(x) for x in (item.get("evidence_chunk_ids") or [])]
+        evidence.extend(ids)
+        out.append({
+            "name": str(item.get("name", "")),
+            "value": str(item.get("value", "")),
+            "unit": str(item.get("unit", "")),
+            "conditions": str(item.get("conditions", "")),
+            "evidence_chunk_ids": ids,
+        })
+    return out
+
+
+def _norm_statements(v, evidence: list[str]) -> list[dict]:
+    # Constraint and Differentiator share the same shape.
+    if not isinstance(v, list):
+        return []
+    out = []
+    for item in v:
+        if not isinstance(item, dict):
+            continue
+        ids = [str(x) for x in (item.get("evidence_chunk_ids") or [])]
+        evidence.extend(ids)
+        out.append({"statement": str(item.get("statement", "")), "evidence_chunk_ids": ids})
+    return out
 
-    return ProductFactSheet(
-        product_name=str(data.get("product_name")) if data.get("product_name") is not None else "NOT_FOUND",
-        product_category=str(data.get("product_category")) if data.get("product_category") is not None else "NOT_FOUND",
-        primary_use_cases=norm_list_str(data.get("primary_use_cases")),
-        target_buyer_roles=norm_list_str(data.get("target_buyer_roles")),
-        key_specs=norm_key_specs(data.get("key_specs")),
-        constraints=norm_constraints(data.get("constraints")),
-        differentiators=norm_differentiators(data.get("differentiators")),
-        certifications_standards=norm_list_str(data.get("certifications_standards")),
-        integrations_interfaces=norm_list_str(data.get("integrations_interfaces")),
-        maintenance_calibration=norm_list_str(data.get("maintenance_calibration")),
-        source_coverage_summary=str(data.get("source_coverage_summary")) if data.get("source_coverage_summary") is not None else "NOT_FOUND",
-    )
 
+def _validate_with_provenance(data: dict) -> tuple[ProductFactSheet, dict]:
+    """``_validate_fact_sheet`` plus the provenance map, collected while normalizing.
 
-def extract_product_fact_sheet(store, llm_provider, max_retries: int = MAX_RETRIES) -> tuple[ProductFactSheet, dict]:
+    Same result as ``_build_provenance(sheet)`` without walking the nested lists again.
+    """
+    key_spec_ids: list[str] = []
+    constraint_ids: list[str] = []
+    differentiator_ids: list[str] = []
+    get = data.get
+    return ProductFactSheet.model_validate({
+        "product_name": _norm_str(get("product_name")),
+        "product_category": _norm_str(get("product_category")),
+        "primary_use_cases": _norm_list_str(get("primary_use_cases")),
+        "target_buyer_roles": _norm_list_str(get("target_buyer_roles")),
+        "key_specs": _norm_key_specs(get("key_specs"), key_spec_ids),
+        "constraints": _norm_statements(get("constraints"), constraint_ids),
+        "differentiators": _norm_statements(get("differentiators"), differentiator_ids),
+        "certifications_standards": _norm_list_str(get("certifications_standards")),
+        "integrations_interfaces": _norm_list_str(get("integrations_interfaces")),
+        "maintenance_calibration": _norm_list_str(get("maintenance_calibration")),
+        "source_coverage_summary": _norm_str(get("source_coverage_summary")),
+    }), _provenance_from_ids(key_spec_ids, constraint_ids, differentiator_ids)
+
+
+def _provenance_from_ids(key_spec_ids: list[str], constraint_ids: list[str], differentiator_ids: list[str]) -> dict:
+    # Scalar and list[str] fields carry no embedded evidence in the schema, so only
+    # the three nested lists need deduplicating (first-seen order, via dict.fromkeys).
+    return {
+        "product_name": [],
+        "product_category": [],
+        "primary_use_cases": [],
+        "target_buyer_roles": [],
+        "key_specs": list(dict.fromkeys(key_spec_ids)),
+        "constraints": list(dict.fromkeys(constraint_ids)),
+        "differentiators": list(dict.fromkeys(differentiator_ids)),
+        "certifications_standards": [],
+        "integrations_interfaces": [],
+        "maintenance_calibration": [],
+        "source_coverage_summary": [],
+    }
+
+
+def _decode_fact_sheet(raw: str) -> tuple[ProductFactSheet, dict]:
+    """Parse and validate an extraction response, returning (sheet, provenance).
+
+    With msgspec installed, a response that already matches the schema exactly is
+    decoded straight into typed structs and the sheet assembled with
+    ``model_construct`` (no second validation).  Otherwise, or if the strict
+    decode fails, fall back to json parsing plus ``_validate_with_provenance``.
+    """
+    if msgspec is not None:
+        try:
+            msg = _FACT_SHEET_DECODER.decode(_strip_code_fence(raw))
+        except (msgspec.DecodeError, msgspec.ValidationError):
+            pass
+        else:
+            key_specs = [
+                KeySpec.model_construct(
+                    name=s.name, value=s.value, unit=s.unit, conditions=s.conditions,
+                    evidence_chunk_ids=s.evidence_chunk_ids,
+                )
+                for s in msg.key_specs
+            ]
+            constraints = [
+                Constraint.model_construct(statement=c.statement, evidence_chunk_ids=c.evidence_chunk_ids)
+                for c in msg.constraints
+            ]
+            differentiators = [
+                Differentiator.model_construct(statement=d.statement, evidence_chunk_ids=d.evidence_chunk_ids)
+                for d in msg.differentiators
+            ]
+            sheet = ProductFactSheet.model_construct(
+                product_name=msg.product_name,
+                product_category=msg.product_category,
+                primary_use_cases=msg.primary_use_cases,
+                target_buyer_roles=msg.target_buyer_roles,
+                key_specs=key_specs,
+                constraints=constraints,
+                differentiators=differentiators,
+                certifications_standards=msg.certifications_standards,
+                integrations_interfaces=msg.integrations_interfaces,
+                maintenance_calibration=msg.maintenance_calibration,
+                source_coverage_summary=msg.source_coverage_summary,
+            )
+            return sheet, _provenance_from_ids(
+                [cid for s in msg.key_specs for cid in s.evidence_chunk_ids],
+                [cid for c in msg.constraints for cid in c.evidence_chunk_ids],
+                [cid for d in msg.differentiators for cid in d.evidence_chunk_ids],
+            )
+    return _validate_with_provenance(_parse_json(raw))
+
+
+def extract_product_fact_sheet(
+    store,
+    llm_provider,
+    max_retries: int = MAX_RETRIES,
+    cache_ttl: float = 0.0,
+    llm_model: str | None = None,
+) -> tuple[ProductFactSheet, dict]:
     """
     Run targeted retrieval, then LLM on retrieved chunks only. Return (ProductFactSheet, provenance).
     store must have .query(query_text, n_results=...) -> list[{chunk_id, text, ...}].
-    llm_provider must have .complete(prompt: str) -> str.
+    llm_provider must have .complete(prompt: str) -> str; if it also has .stream(prompt) yielding
+    text deltas, the response is read only until the JSON object closes.
     provenance: field name -> list of evidence chunk_ids used for that field.
+    Caching is opt-in: with ``cache_ttl > 0`` and an ``llm_model`` identifier, a sheet
+    extracted from the same chunks by the same provider class and model within
+    ``cache_ttl`` seconds is reused without calling the LLM (see ``clear_sheet_cache``).
     """
+    _check_cache_args(cache_ttl, llm_model)
     chunks = _chunks_from_store(store, SECTION_QUERIES)
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    extract_tpl = env.get_template("factsheet_extract.j2")
-    fix_tpl = env.get_template("factsheet_fix_json.j2")
+    return _extract_from_chunks(chunks, llm_provider, max_retries, cache_ttl, llm_model)
+
+
+def _extraction_steps(
+    chunks: list[dict], llm_provider, max_retries: int, cache_ttl: float, llm_model: str | None,
+):
+    """LLM extraction (with fix-JSON retries and the sheet cache) over already-retrieved chunks.
+
+    Written without I/O so the sync and async drivers share it: yields
+    ``(prompt, kwargs)`` for each completion it needs, receives the response
+    text via ``send`` and finally returns ``(sheet, provenance)``.
+    """
+    complete_kwargs = _structured_output_kwargs(llm_provider)
+    prompt = _EXTRACT_TEMPLATE.render(chunks=chunks)
+    extract_kwargs = {**complete_kwargs, **_prompt_cache_kwargs(llm_provider, chunks)}
+    cache_key = _sheet_cache_key(llm_provider, llm_model, prompt) if cache_ttl > 0 else None
+    if cache_key is not None:
+        cached = _sheet_cache_get(cache_key)
+        if cached is not None:
+            return cached, _build_provenance(cached)
 
-    prompt = extract_tpl.render(chunks=chunks)
-    raw = llm_provider.complete(prompt)
+    raw = yield prompt, extract_kwargs
     attempts = 0
     last_raw = raw
 
     while attempts <= max_retries:
         try:
-            data = _parse_json(last_raw)
-            sheet = _validate_fact_sheet(data)
+            sheet, provenance = _decode_fact_sheet(last_raw)
             break
         except (json.JSONDecodeError, TypeError, KeyError) as e:
             attempts += 1
@@ -151,14 +481,178 @@ def extract_product_fact_sheet(store, llm_provider, max_retries: int = MAX_RETRI
                 raise ValueError(
                     f"Could not produce valid ProductFactSheet JSON after {max_retries + 1} attempts. Last error: {e}"
                 ) from e
-            fix_prompt = fix_tpl.render(invalid_json=last_raw)
-            last_raw = llm_provider.complete(fix_prompt)
+            fix_prompt = _FIX_JSON_TEMPLATE.render(invalid_json=last_raw)
+            last_raw = yield fix_prompt, complete_kwargs
 
-    # Build provenance: each field -> list of evidence chunk_ids
-    provenance = _build_provenance(sheet)
+    if cache_key is not None:
+        _sheet_cache_put(cache_key, sheet, cache_ttl)
     return sheet, provenance
 
 
+def _extract_from_chunks(
+    chunks: list[dict], llm_provider, max_retries: int, cache_ttl: float, llm_model: str | None,
+) -> tuple[ProductFactSheet, dict]:
+    steps = _extraction_steps(chunks, llm_provider, max_retries, cache_ttl, llm_model)
+    try:
+        prompt, kwargs = next(steps)
+        while True:
+            prompt, kwargs = steps.send(_complete(llm_provider, prompt, **kwargs))
+    except StopIteration as done:
+        return done.value
+
+
+async def _acomplete(llm_provider, prompt: str, **kwargs) -> str:
+    acomplete = getattr(llm_provider, "acomplete", None)
+    if acomplete is not None:
+        return await acomplete(prompt, **kwargs)
+    return await asyncio.to_thread(_complete, llm_provider, prompt, **kwargs)
+
+
+async def _aextract_from_chunks(
+    chunks: list[dict], llm_provider, max_retries: int, cache_ttl: float, llm_model: str | None,
+) -> tuple[ProductFactSheet, dict]:
+    steps = _extraction_steps(chunks, llm_provider, max_retries, cache_ttl, llm_model)
+    try:
+        prompt, kwargs = next(steps)
+        while True:
+            prompt, kwargs = steps.send(await _acomplete(llm_provider, prompt, **kwargs))
+    except StopIteration as done:
+        return done.value
+
+
+def _extract_batch(
+    chunk_sets: list[list[dict]], llm_provider, max_retries: int, cache_ttl: float, llm_model: str | None,
+) -> list[tuple[ProductFactSheet, dict]]:
+    """Extract several documents' sheets with one LLM call.
+
+    Cached documents are answered from the sheet cache.  A document the model
+    left out or returned malformed (or a batch of one) falls back to its own
+    ``_extract_from_chunks`` call, so every document gets a sheet.
+    """
+    results: list[tuple[ProductFactSheet, dict] | None] = [None] * len(chunk_sets)
+    cache_keys: list[str | None] = [None] * len(chunk_sets)
+    if cache_ttl > 0:
+        for i, chunks in enumerate(chunk_sets):
+            cache_keys[i] = _sheet_cache_key(llm_provider, llm_model, _EXTRACT_TEMPLATE.render(chunks=chunks))
+            cached = _sheet_cache_get(cache_keys[i])
+            if cached is not None:
+                results[i] = (cached, _build_provenance(cached))
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    if len(pending) > 1:
+        documents = [{"doc_id": f"doc-{i + 1}", "chunks": chunk_sets[i]} for i in pending]
+        # No response_format here: structured-output schemas must be objects, not arrays.
+        raw = llm_provider.complete(_EXTRACT_BATCH_TEMPLATE.render(documents=documents))
+        try:
+            entries = _parse_json(raw)
+        except ValueError:
+            entries = None
+        by_doc: dict[str, object] = {}
+        for entry in entries if isinstance(entries, list) else ():
+            if isinstance(entry, dict) and isinstance(entry.get("fact_sheet"), dict):
+                by_doc.setdefault(str(entry.get("doc_id", "")), entry["fact_sheet"])
+        for i in pending:
+            data = by_doc.get(f"doc-{i + 1}")
+            if data is None:
+                continue
+            try:
+                results[i] = _validate_with_provenance(data)
+            except (TypeError, KeyError, ValueError):
+                continue
+            if cache_keys[i] is not None:
+                _sheet_cache_put(cache_keys[i], results[i][0], cache_ttl)
+
+    for i, result in enumerate(results):
+        if result is None:
+            if len(pending) > 1:
+                logger.warning("Batched fact-sheet response missing document %d; extracting it alone", i + 1)
+            results[i] = _extract_from_chunks(chunk_sets[i], llm_provider, max_retries, cache_ttl, llm_model)
+    return results
+
+
+def extract_product_fact_sheets_batch(
+    stores: list,
+    llm_provider,
+    batch_size: int = 8,
+    max_workers: int = 4,
+    max_retries: int = MAX_RETRIES,
+    cache_ttl: float = 0.0,
+    llm_model: str | None = None,
+) -> list[tuple[ProductFactSheet, dict]]:
+    """Extract fact sheets for many documents, packing several into each LLM call.
+
+    Parameters
+    ----------
+    stores : one vector store per document (same interface as ``extract_product_fact_sheet``)
+    llm_provider : LLM provider instance (has .complete), shared by every document
+    batch_size : documents whose chunks are packed into one extraction prompt
+    max_workers : retrievals (and batches) processed concurrently
+    max_retries, cache_ttl, llm_model : as for ``extract_product_fact_sheet``
+
+    Returns ``(sheet, provenance)`` per store, in input order.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    _check_cache_args(cache_ttl, llm_model)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        chunk_sets = list(pool.map(lambda s: _chunks_from_store(s, SECTION_QUERIES), stores))
+        batches = [chunk_sets[i:i + batch_size] for i in range(0, len(chunk_sets), batch_size)]
+        return [
+            result
+            for batch_results in pool.map(
+                lambda batch: _extract_batch(batch, llm_provider, max_retries, cache_ttl, llm_model),
+                batches,
+            )
+            for result in batch_results
+        ]
+
+
+async def extract_product_fact_sheet_async(
+    store,
+    llm_provider,
+    max_retries: int = MAX_RETRIES,
+    cache_ttl: float = 0.0,
+    llm_model: str | None = None,
+) -> tuple[ProductFactSheet, dict]:
+    """Async version of ``extract_product_fact_sheet``.
+
+    Retrieval (a blocking store) runs in a worker thread.  Completions use the
+    provider's ``acomplete`` when it has one, so many extractions can be in
+    flight on one event loop; otherwise ``complete`` runs in a worker thread.
+    """
+    _check_cache_args(cache_ttl, llm_model)
+    chunks = await asyncio.to_thread(_chunks_from_store, store, SECTION_QUERIES)
+    return await _aextract_from_chunks(chunks, llm_provider, max_retries, cache_ttl, llm_model)
+
+
+async def extract_product_fact_sheets_async(
+    stores: list,
+    llm_provider,
+    concurrency: int = 32,
+    max_retries: int = MAX_RETRIES,
+    cache_ttl: float = 0.0,
+    llm_model: str | None = None,
+) -> list[tuple[ProductFactSheet, dict]]:
+    """Extract one fact sheet per store with up to ``concurrency`` extractions in flight.
+
+    Keeping many requests open lets a serving backend batch them (continuous
+    batching) instead of seeing one request at a time.  Returns
+    ``(sheet, provenance)`` per store, in input order.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    _check_cache_args(cache_ttl, llm_model)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(store) -> tuple[ProductFactSheet, dict]:
+        async with semaphore:
+            return await extract_product_fact_sheet_async(
+                store, llm_provider, max_retries, cache_ttl, llm_model,
+            )
+
+    return list(await asyncio.gather(*(_one(store) for store in stores)))
+
+
 def require_evidence_for_non_not_found(sheet: ProductFactSheet) -> list[str]:
     """
     Validate that every non-NOT_FOUND item has non-empty evidence_chunk_ids.
@@ -179,21 +673,8 @@ def require_evidence_for_non_not_found(sheet: ProductFactSheet) -> list[str]:
 
 def _build_provenance(sheet: ProductFactSheet) -> dict:
     """Map each field to list of evidence chunk_ids (for scalar fields, from section-level retrieval we don't have per-field chunks here; we collect from nested evidence_chunk_ids)."""
-    provenance = {}
-
-    def add(field: str, chunk_ids: list[str]) -> None:
-        provenance[field] = list(dict.fromkeys(chunk_ids))
-
-    add("product_name", [])  # scalar; no embedded evidence in schema
-    add("product_category", [])
-    add("primary_use_cases", [])
-    add("target_buyer_roles", [])
-    add("key_specs", [cid for s in sheet.key_specs for cid in s.evidence_chunk_ids])
-    add("constraints", [cid for c in sheet.constraints for cid in c.evidence_chunk_ids])
-    add("differentiators", [cid for d in sheet.differentiators for cid in d.evidence_chunk_ids])
-    add("certifications_standards", [])
-    add("integrations_interfaces", [])
-    add("maintenance_calibration", [])
-    add("source_coverage_summary", [])
-
-    return provenance
+    return _provenance_from_ids(
+        [cid for s in sheet.key_specs for cid in s.evidence_chunk_ids],
+        [cid for c in sheet.constraints for cid in c.evidence_chunk_ids],
+        [cid for d in sheet.differentiators for cid in d.evidence_chunk_ids],
+    )
@@ -91,46 +91,73 @@ _NUMERIC_SPEC_RE = re.compile(
 # IP protection rating (e.g. IP67, IP65)
 _IP_RATING_RE = re.compile(r"\bIP\d{2}\b")
 
+# Lookahead that refuses to run into a numeric spec or IP rating.  Every
+# certification or price branch that takes digits checks it first, so a
+# standard number or price never swallows a measurement that follows it
+# ("IEC 61010-1 230 V", "UL 100 W").
+_NOT_NUMERIC_SPEC = (
+    rf"(?![\s-]*(?-i:{_NUMERIC_SPEC_RE.pattern}|{_IP_RATING_RE.pattern}))"
+)
+
 # Certification / standard patterns
 _CERT_RE = re.compile(
     r"\b(?:"
-    r"ISO\s*\d[\d:/ -]*"
-    r"|IEC\s*\d[\d:/ -]*"
+    rf"ISO\s*{_NOT_NUMERIC_SPEC}\d(?:{_NOT_NUMERIC_SPEC}[\d:/ -])*"
+    rf"|IEC\s*{_NOT_NUMERIC_SPEC}\d(?:{_NOT_NUMERIC_SPEC}[\d:/ -])*"
     r"|IECEx"
     r"|ATEX"
-    r"|UL\s*\d*"
+    rf"|UL(?:{_NOT_NUMERIC_SPEC}\s*\d*)?"
     r"|CSA"
     r"|FM\b"
     r"|CE\b"
-    r"|SIL\s*\d+"
+    rf"|SIL\s*{_NOT_NUMERIC_SPEC}\d+"
     r"|NEMA"
-    r"|EN\s*\d+"
+    rf"|EN\s*{_NOT_NUMERIC_SPEC}\d+"
     r"|RoHS"
     r"|REACH"
-    r"|MIL[- ]STD[- ]*\d+"
+    rf"|MIL[- ]STD[- ]*{_NOT_NUMERIC_SPEC}\d+"
     r"|FDA"
     r"|NAMUR"
     r"|3-A\b"
     r"|EHEDG"
-    r"|API\s*\d+"
+    rf"|API\s*{_NOT_NUMERIC_SPEC}\d+"
     r"|DNV"
     r"|TÜV|TUV"
     r"|PED"
     r"|CRN"
-    r")\b",
+    # A word boundary, or the start of a measurement that the numeric check
+    # replaces ("UL5 mA").
+    rf")(?:\b|(?=(?-i:{_NUMERIC_SPEC_RE.pattern})))",
     re.IGNORECASE,
 )
 
 # Pricing patterns
 _PRICE_RE = re.compile(
     r"(?:"
-    r"[$€£¥]\s*\d[\d,]*(?:\.\d{1,2})?"
+    rf"[$€£¥]\s*{_NOT_NUMERIC_SPEC}\d(?:{_NOT_NUMERIC_SPEC}[\d,])*(?:\.\d{{1,2}})?"
     r"|\d[\d,]*(?:\.\d{1,2})?\s*(?:USD|EUR|GBP|dollars?|euros?)"
-    r"|(?:priced\s+at|costs?\s+|MSRP|list\s+price|starting\s+(?:at|from))\s*[:$€£¥]?\s*\d"
+    r"|(?:priced\s+at|costs?\s+|MSRP|list\s+price|starting\s+(?:at|from))\s*[:$€£¥]?\s*"
+    rf"{_NOT_NUMERIC_SPEC}\d"
     r")",
     re.IGNORECASE,
 )
 
+# All four violation patterns as one alternation, so ``_clean_text_field``
+# scans each field once.  ``lastgroup`` names the branch that matched; case
+# folding stays scoped to the certification and pricing branches.  An IP
+# rating whose digits start a numeric spec ("IP67 %") is left to the numeric
+# branch, as the numeric check always ran first.
+_VIOLATION_RE = re.compile(
+    f"(?P<num>{_NUMERIC_SPEC_RE.pattern})"
+    rf"|(?P<ip>\bIP{_NOT_NUMERIC_SPEC}\d{{2}}\b)"
+    f"|(?P<cert>(?i:{_CERT_RE.pattern}))"
+    f"|(?P<price>(?i:{_PRICE_RE.pattern}))"
+)
+_VIOLATION_ORDER = {"num": 0, "ip": 1, "cert": 2, "price": 3}
+
+# Whitespace runs, collapsed (``_normalize``) or removed (``_numeric_is_grounded``).
+_WHITESPACE_RE = re.compile(r"\s+")
+
 # Proper-noun heuristic for competitor-brand detection.
 _PROPER_NOUN_RE = re.compile(r"\b[A-Z][a-zA-Z]+(?:[+&][A-Z][a-zA-Z]+)*\b")
 
@@ -170,7 +197,7 @@ _NON_BRAND_WORDS: frozenset[str] = frozenset(
 def _normalize(s: str) -> str:
     """Lowercase, collapse whitespace, normalise dashes & micro sign."""
     s = s.strip().lower()
-    s = re.sub(r"\s+", " ", s)
+    s = _WHITESPACE_RE.sub(" ", s)
     s = s.replace("–", "-").replace("—", "-")
     s = s.replace("μ", "µ")
     return s
@@ -180,12 +207,15 @@ def _normalize(s: str) -> str:
 # Allowed-set builders
 # ---------------------------------------------------------------------------
 
-def _build_allowed_numeric_set(sheet: ProductFactSheet) -> set[str]:
+def _build_allowed_numeric_set(sheet: ProductFactSheet) -> dict[str, str]:
     """Build normalised set of all numeric + unit strings from the fact sheet.
 
     Draws from ``key_specs``, ``constraints``, ``differentiators``,
     ``maintenance_calibration``, and ``integrations_interfaces`` so that any
     documented numeric claim is considered grounded.
+
+    Returned as a dict mapping each allowed string to its whitespace-free form,
+    computed once here rather than on every ``_numeric_is_grounded`` call.
     """
     allowed: set[str] = set()
 
@@ -216,7 +246,7 @@ def _build_allowed_numeric_set(sheet: ProductFactSheet) -> set[str]:
         for m in _IP_RATING_RE.finditer(text):
             allowed.add(_normalize(m.group()))
 
-    return allowed
+    return {a: _WHITESPACE_RE.sub("", a) for a in allowed}
 
 
 def _build_allowed_certs(sheet: ProductFactSheet) -> set[str]:
@@ -228,17 +258,16 @@ def _build_allowed_certs(sheet: ProductFactSheet) -> set[str]:
 # Grounding checks
 # ---------------------------------------------------------------------------
 
-def _numeric_is_grounded(match_text: str, allowed: set[str]) -> bool:
+def _numeric_is_grounded(match_text: str, allowed: dict[str, str]) -> bool:
     """Return *True* if *match_text* appears (possibly as a substring) in the
     allowed set built from the fact sheet."""
     norm = _normalize(match_text)
-    norm_nospace = re.sub(r"\s+", "", norm)
+    norm_nospace = _WHITESPACE_RE.sub("", norm)
 
     if norm in allowed or norm_nospace in allowed:
         return True
 
-    for a in allowed:
-        a_nospace = re.sub(r"\s+", "", a)
+    for a, a_nospace in allowed.items():
         # Either direction substring match (covers "±0.1 °c" inside
         # "±0.1 °c at 25 °c" or vice-versa).
         if norm_nospace in a_nospace or a_nospace in norm_nospace:
@@ -264,7 +293,7 @@ def _cert_is_grounded(cert_text: str, allowed: set[str]) -> bool:
 def _clean_text_field(
     text: str,
     field_path: str,
-    allowed_numerics: set[str],
+    allowed_numerics: dict[str, str],
     allowed_certs: set[str],
     product_name_lower: str,
     source_text_lower: str,
@@ -280,19 +309,18 @@ def _clean_text_field(
         if _numeric_is_grounded(original, allowed_numerics):
             return original
         replacement = "[refer to datasheet]"
-        warnings.append(
-            GuardrailWarning(
-                category="ungrounded_numeric_spec",
-                severity="replaced",
-                field_path=field_path,
-                original_snippet=original,
-                replacement=replacement,
-                detail=(
-                    f"Numeric spec '{original}' not found in fact sheet "
-                    f"key_specs or other documented fields."
-                ),
-            )
+        warning = GuardrailWarning(
+            category="ungrounded_numeric_spec",
+            severity="replaced",
+            field_path=field_path,
+            original_snippet=original,
+            replacement=replacement,
+            detail=(
+                f"Numeric spec '{original}' not found in fact sheet "
+                f"key_specs or other documented fields."
+            ),
         )
+        found.append(("num", warning))
         logger.warning(
             "Guardrail: ungrounded numeric '%s' in %s — replaced",
             original,
@@ -300,26 +328,23 @@ def _clean_text_field(
         )
         return replacement
 
-    result = _NUMERIC_SPEC_RE.sub(_numeric_replacer, text)
-
     def _ip_replacer(m: re.Match) -> str:
         original = m.group()
         if _numeric_is_grounded(original, allowed_numerics):
             return original
         replacement = "[refer to datasheet]"
-        warnings.append(
-            GuardrailWarning(
-                category="ungrounded_numeric_spec",
-                severity="replaced",
-                field_path=field_path,
-                original_snippet=original,
-                replacement=replacement,
-                detail=(
-                    f"IP rating '{original}' not found in fact sheet "
-                    f"key_specs or other documented fields."
-                ),
-            )
+        warning = GuardrailWarning(
+            category="ungrounded_numeric_spec",
+            severity="replaced",
+            field_path=field_path,
+            original_snippet=original,
+            replacement=replacement,
+            detail=(
+                f"IP rating '{original}' not found in fact sheet "
+                f"key_specs or other documented fields."
+            ),
         )
+        found.append(("ip", warning))
         logger.warning(
             "Guardrail: ungrounded IP rating '%s' in %s — replaced",
             original,
@@ -327,27 +352,24 @@ def _clean_text_field(
         )
         return replacement
 
-    result = _IP_RATING_RE.sub(_ip_replacer, result)
-
     # --- 2. Certifications ------------------------------------------------
     def _cert_replacer(m: re.Match) -> str:
         original = m.group()
         if _cert_is_grounded(original, allowed_certs):
             return original
         replacement = "[certification not verified]"
-        warnings.append(
-            GuardrailWarning(
-                category="ungrounded_certification",
-                severity="replaced",
-                field_path=field_path,
-                original_snippet=original,
-                replacement=replacement,
-                detail=(
-                    f"Certification '{original}' not in fact sheet "
-                    f"certifications_standards."
-                ),
-            )
+        warning = GuardrailWarning(
+            category="ungrounded_certification",
+            severity="replaced",
+            field_path=field_path,
+            original_snippet=original,
+            replacement=replacement,
+            detail=(
+                f"Certification '{original}' not in fact sheet "
+                f"certifications_standards."
+            ),
         )
+        found.append(("cert", warning))
         logger.warning(
             "Guardrail: ungrounded certification '%s' in %s — replaced",
             original,
@@ -355,27 +377,24 @@ def _clean_text_field(
         )
         return replacement
 
-    result = _CERT_RE.sub(_cert_replacer, result)
-
     # --- 3. Pricing -------------------------------------------------------
     def _price_replacer(m: re.Match) -> str:
         original = m.group()
         if source_text_lower and original.lower() in source_text_lower:
             return original  # present in source docs — allowed
         replacement = "[pricing not verified]"
-        warnings.append(
-            GuardrailWarning(
-                category="ungrounded_pricing",
-                severity="replaced",
-                field_path=field_path,
-                original_snippet=original,
-                replacement=replacement,
-                detail=(
-                    f"Pricing claim '{original}' not found in source "
-                    f"documents."
-                ),
-            )
+        warning = GuardrailWarning(
+            category="ungrounded_pricing",
+            severity="replaced",
+            field_path=field_path,
+            original_snippet=original,
+            replacement=replacement,
+            detail=(
+                f"Pricing claim '{original}' not found in source "
+                f"documents."
+            ),
         )
+        found.append(("price", warning))
         logger.warning(
             "Guardrail: ungrounded pricing '%s' in %s — replaced",
             original,
@@ -383,8 +402,18 @@ def _clean_text_field(
         )
         return replacement
 
-    result = _PRICE_RE.sub(_price_replacer, result)
-
+    replacers = {
+        "num": _numeric_replacer,
+        "ip": _ip_replacer,
+        "cert": _cert_replacer,
+        "price": _price_replacer,
+    }
+    found: list[tuple[str, GuardrailWarning]] = []
+    result = _VIOLATION_RE.sub(lambda m: replacers[m.lastgroup](m), text)
+    if found:
+        # Report by category (numeric, IP, certification, pricing), then position.
+        found.sort(key=lambda item: _VIOLATION_ORDER[item[0]])
+        warnings.extend(warning for _, warning in found)
     return result
 
 
@@ -452,7 +481,7 @@ def _scan_for_competitor_brands(
 
 def _clean_landing_page(
     drafts: WebContentDrafts,
-    allowed_numerics: set[str],
+    allowed_numerics: dict[str, str],
     allowed_certs: set[str],
     product_name_lower: str,
     source_text_lower: str,
@@ -507,7 +536,7 @@ def _clean_landing_page(
 
 def _clean_faq(
     drafts: WebContentDrafts,
-    allowed_numerics: set[str],
+    allowed_numerics: dict[str, str],
     allowed_certs: set[str],
     product_name_lower: str,
     source_text_lower: str,
@@ -527,7 +556,7 @@ def _clean_faq(
 
 def _clean_use_case_pages(
     drafts: WebContentDrafts,
-    allowed_numerics: set[str],
+    allowed_numerics: dict[str, str],
     allowed_certs: set[str],
     product_name_lower: str,
     source_text_lower: str,
@@ -556,7 +585,7 @@ def _clean_use_case_pages(
 
 def _clean_comparisons(
     drafts: WebContentDrafts,
-    allowed_numerics: set[str],
+    allowed_numerics: dict[str, str],
     allowed_certs: set[str],
     product_name_lower: str,
     source_text_lower: str,
@@ -602,7 +631,7 @@ def _clean_comparisons(
 
 def _clean_seo(
     drafts: WebContentDrafts,
-    allowed_numerics: set[str],
+    allowed_numerics: dict[str, str],
     allowed_certs: set[str],
     product_name_lower: str,
     source_text_lower: str,
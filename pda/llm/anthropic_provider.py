@@ -2,9 +2,10 @@
 
 import json
 import re
+from collections.abc import Iterator
 from typing import Any
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from pydantic import BaseModel
 
 from pda.llm.base import LLMProvider
@@ -13,22 +14,61 @@ from pda.llm.base import LLMProvider
 class AnthropicProvider:
     """Anthropic chat completion with optional structured (JSON) output."""
 
+    # complete()/stream() accept ``prompt_cache_prefix``: a leading part of the prompt
+    # that repeats across calls and should be served from the provider's prompt cache.
+    supports_prompt_cache = True
+
     def __init__(
         self,
         api_key: str | None = None,
         model: str = "claude-3-5-sonnet-20241022",
     ):
         self._client = Anthropic(api_key=api_key)
+        self._api_key = api_key
+        self._async_client: AsyncAnthropic | None = None
         self._model = model
 
+    @staticmethod
+    def _messages(prompt: str, kwargs: dict[str, Any]) -> list[dict[str, Any]]:
+        prefix = kwargs.get("prompt_cache_prefix")
+        if prefix and len(prefix) < len(prompt) and prompt.startswith(prefix):
+            # Cache breakpoint after the shared prefix; the remainder is billed normally.
+            content: Any = [
+                {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt[len(prefix):]},
+            ]
+        else:
+            content = prompt
+        return [{"role": "user", "content": content}]
+
     def complete(self, prompt: str, **kwargs: Any) -> str:
         response = self._client.messages.create(
             model=kwargs.get("model") or self._model,
             max_tokens=kwargs.get("max_tokens", 4096),
-            messages=[{"role": "user", "content": prompt}],
+            messages=self._messages(prompt, kwargs),
+        )
+        return response.content[0].text if response.content else ""
+
+    async def acomplete(self, prompt: str, **kwargs: Any) -> str:
+        """Async ``complete``, so callers can keep many requests in flight."""
+        if self._async_client is None:
+            self._async_client = AsyncAnthropic(api_key=self._api_key)
+        response = await self._async_client.messages.create(
+            model=kwargs.get("model") or self._model,
+            max_tokens=kwargs.get("max_tokens", 4096),
+            messages=self._messages(prompt, kwargs),
         )
         return response.content[0].text if response.content else ""
 
+    def stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        """Yield completion text as it is generated; closing the iterator cancels the request."""
+        with self._client.messages.stream(
+            model=kwargs.get("model") or self._model,
+            max_tokens=kwargs.get("max_tokens", 4096),
+            messages=self._messages(prompt, kwargs),
+        ) as response:
+            yield from response.text_stream
+
     def complete_structured(self, prompt: str, schema: type[BaseModel], **kwargs: Any) -> BaseModel:
         instruction = (
             "Respond with a single JSON object that conforms to the schema. "
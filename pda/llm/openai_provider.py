@@ -1,10 +1,12 @@
 """OpenAI LLM implementation with structured output via JSON in prompt."""
 
+import hashlib
 import json
 import re
+from collections.abc import Iterator
 from typing import Any
 
-from openai import APIError, APIStatusError, OpenAI, RateLimitError
+from openai import APIError, APIStatusError, AsyncOpenAI, OpenAI, RateLimitError
 from pydantic import BaseModel
 
 from pda.llm.base import LLMProvider
@@ -13,21 +15,40 @@ from pda.llm.base import LLMProvider
 class OpenAIProvider:
     """OpenAI chat completion with optional structured (JSON) output."""
 
+    # complete() forwards a ``response_format`` kwarg (e.g. a JSON schema) to the API.
+    supports_response_format = True
+    # complete()/stream() accept ``prompt_cache_prefix``: a leading part of the prompt
+    # that repeats across calls and should be served from the provider's prompt cache.
+    supports_prompt_cache = True
+
     def __init__(
         self,
         api_key: str | None = None,
         model: str = "gpt-5.2",
     ):
         self._client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+        self._async_client: AsyncOpenAI | None = None
         self._model = model
 
+    def _request(self, prompt: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        request = {
+            "model": kwargs.get("model") or self._model,
+            "messages": [{"role": "user", "content": prompt}],
+            **{k: v for k, v in kwargs.items() if k not in ("model", "prompt_cache_prefix")},
+        }
+        prefix = kwargs.get("prompt_cache_prefix")
+        if prefix:
+            # OpenAI caches long prompt prefixes automatically; a stable key routes
+            # calls sharing this prefix to the same cache.  Sent via extra_body so
+            # older SDKs without a prompt_cache_key parameter still work.
+            key = "pda-" + hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:32]
+            request["extra_body"] = {**request.get("extra_body", {}), "prompt_cache_key": key}
+        return request
+
     def complete(self, prompt: str, **kwargs: Any) -> str:
         try:
-            response = self._client.chat.completions.create(
-                model=kwargs.get("model") or self._model,
-                messages=[{"role": "user", "content": prompt}],
-                **{k: v for k, v in kwargs.items() if k not in ("model",)},
-            )
+            response = self._client.chat.completions.create(**self._request(prompt, kwargs))
             msg = response.choices[0].message
             return msg.content or ""
         except (RateLimitError, APIStatusError, APIError) as e:
@@ -35,6 +56,21 @@ class OpenAIProvider:
             # The route handlers will check status_code and error messages
             raise
 
+    async def acomplete(self, prompt: str, **kwargs: Any) -> str:
+        """Async ``complete``, so callers can keep many requests in flight."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self._api_key)
+        response = await self._async_client.chat.completions.create(**self._request(prompt, kwargs))
+        return response.choices[0].message.content or ""
+
+    def stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        """Yield completion text as it is generated; closing the iterator cancels the request."""
+        response = self._client.chat.completions.create(**self._request(prompt, kwargs), stream=True)
+        with response:
+            for event in response:
+                if event.choices and event.choices[0].delta.content:
+                    yield event.choices[0].delta.content
+
     def complete_structured(self, prompt: str, schema: type[BaseModel], **kwargs: Any) -> BaseModel:
         instruction = (
             "Respond with a single JSON object only. No markdown, no code fence, no explanation."
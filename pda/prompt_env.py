@@ -0,0 +1,17 @@
+"""Shared Jinja environment for the prompt templates in ``prompts/``.
+
+Templates are static for the life of the process, so one environment with
+``auto_reload`` off compiles each template once, however many modules use it.
+"""
+
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+
+PROMPT_ENV = Environment(
+    loader=FileSystemLoader(str(PROMPTS_DIR)),
+    auto_reload=False,
+    cache_size=400,
+)
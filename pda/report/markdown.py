@@ -95,7 +95,8 @@ def render_markdown_report(
     for c in content_pack.get("constraints", []):
         sections.append(f"- {c}\n")
     sections.append("\n### Schema.org JSON-LD skeleton\n")
-    sections.append("```json\n" + content_pack.get("schema_org_json", "{}") + "\n```\n")
+    schema_org = json.dumps(content_pack.get("schema_org_skeleton", {}), indent=2)
+    sections.append("```json\n" + schema_org + "\n```\n")
     sections.append("\n---\n")
 
     # 5) Buyer-prompt simulator
@@ -34,6 +34,19 @@ class VectorStoreBackend(Protocol):
         """
         ...
 
+    def query_batch(
+        self,
+        query_texts: list[str],
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several queries at once (single embedding pass).
+
+        Returns one result list per query, in the same order as *query_texts*.
+        """
+        ...
+
     def get_by_ids(self, chunk_ids: list[str]) -> list[dict[str, Any]]:
         """Fetch chunks by their IDs."""
         ...
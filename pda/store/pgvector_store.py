@@ -142,27 +142,58 @@ class PgVectorStore:
         n_results: int = 10,
         where: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
-        emb = self._embed_fn([query_text])[0]
+        return self.query_batch([query_text], n_results=n_results, where=where)[0]
+
+    def query_batch(
+        self,
+        query_texts: list[str],
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Embed all queries in one pass and run every nearest-neighbour search in a
+        single round trip (one LATERAL top-k per query vector).
+        """
+        if not query_texts:
+            return []
+        embeddings = self._embed_fn(list(query_texts))
         result = self._conn.execute(
             f"""
-            SELECT chunk_id, text, metadata,
-                   embedding <=> %s::vector AS distance
-            FROM {self._table}
-            WHERE project_id = %s
-            ORDER BY distance ASC
-            LIMIT %s
+            SELECT q.ord, c.chunk_id, c.text, c.metadata, c.distance
+            FROM unnest(%s::text[]) WITH ORDINALITY AS q(qvec, ord)
+            CROSS JOIN LATERAL (
+                SELECT chunk_id, text, metadata,
+                       embedding <=> q.qvec::vector AS distance
+                FROM {self._table}
+                WHERE project_id = %s
+                ORDER BY distance ASC
+                LIMIT %s
+            ) AS c
+            ORDER BY q.ord, c.distance
             """,
-            (str(emb), self._project_id, n_results),
+            ([str(emb) for emb in embeddings], self._project_id, n_results),
         ).fetchall()
-        out: list[dict[str, Any]] = []
+        batches: list[list[dict[str, Any]]] = [[] for _ in embeddings]
         for row in result:
-            out.append({
-                "chunk_id": row[0],
-                "text": row[1],
-                "metadata": row[2] if isinstance(row[2], dict) else json.loads(row[2]),
-                "distance": float(row[3]),
+            batches[row[0] - 1].append({
+                "chunk_id": row[1],
+                "text": row[2],
+                "metadata": row[3] if isinstance(row[3], dict) else json.loads(row[3]),
+                "distance": float(row[4]),
             })
-        return out
+        return batches
+
+    def fingerprint(self) -> str:
+        """Content fingerprint (row count + hash of ids and texts) for retrieval caches."""
+        row = self._conn.execute(
+            f"""
+            SELECT count(*), coalesce(md5(string_agg(chunk_id || md5(text), ',' ORDER BY chunk_id)), '')
+            FROM {self._table}
+            WHERE project_id = %s
+            """,
+            (self._project_id,),
+        ).fetchone()
+        return f"pgvector:{self._table}:{self._project_id}:{row[0]}:{row[1][:16]}"
 
     def get_by_ids(self, chunk_ids: list[str]) -> list[dict[str, Any]]:
         if not chunk_ids:
@@ -1,5 +1,6 @@
 """ChromaDB wrapper for chunk storage and retrieval with configurable embeddings."""
 
+import hashlib
 from pathlib import Path
 from typing import Any
 
@@ -85,26 +86,57 @@ class VectorStore:
         """
         Return similar chunks. Each item has chunk_id, text, distance, metadata.
         """
+        return self.query_batch([query_text], n_results=n_results, where=where)[0]
+
+    def query_batch(
+        self,
+        query_texts: list[str],
+        n_results: int = 10,
+        where: dict | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several similarity queries in one Chroma call (one embedding pass).
+
+        Returns one result list per query, in the same order as ``query_texts``.
+        """
+        if not query_texts:
+            return []
         result = self._collection.query(
-            query_texts=[query_text],
+            query_texts=list(query_texts),
             n_results=n_results,
             where=where,
             include=["documents", "metadatas", "distances"],
         )
-        out: list[dict[str, Any]] = []
-        if not result["ids"] or not result["ids"][0]:
-            return out
-        for i, chunk_id in enumerate(result["ids"][0]):
-            doc = (result["documents"][0][i]) if result["documents"] else ""
-            meta = (result["metadatas"][0][i]) if result["metadatas"] else {}
-            dist = (result["distances"][0][i]) if result.get("distances") else None
-            out.append({
-                "chunk_id": chunk_id,
-                "text": doc,
-                "distance": dist,
-                "metadata": meta,
-            })
-        return out
+        batches: list[list[dict[str, Any]]] = []
+        for q_idx in range(len(query_texts)):
+            out: list[dict[str, Any]] = []
+            ids = result["ids"][q_idx] if result["ids"] and q_idx < len(result["ids"]) else []
+            for i, chunk_id in enumerate(ids):
+                doc = (result["documents"][q_idx][i]) if result["documents"] else ""
+                meta = (result["metadatas"][q_idx][i]) if result["metadatas"] else {}
+                dist = (result["distances"][q_idx][i]) if result.get("distances") else None
+                out.append({
+                    "chunk_id": chunk_id,
+                    "text": doc,
+                    "distance": dist,
+                    "metadata": meta,
+                })
+            batches.append(out)
+        return batches
+
+    def fingerprint(self) -> str:
+        """Content fingerprint (chunk count + hash of ids and texts) for retrieval caches.
+
+        Chunk ids are positional and ``add_chunks`` upserts, so a revised document
+        with the same layout keeps its ids; hashing the texts catches that.
+        """
+        result = self._collection.get(include=["documents"])
+        documents = result["documents"] or [""] * len(result["ids"])
+        hasher = hashlib.sha256()
+        for chunk_id, doc in sorted(zip(result["ids"], documents)):
+            hasher.update(chunk_id.encode("utf-8"))
+            hasher.update(hashlib.sha256((doc or "").encode("utf-8")).digest())
+        return f"chroma:{self._collection_name}:{len(result['ids'])}:{hasher.hexdigest()[:16]}"
 
     def get_by_ids(self, chunk_ids: list[str]) -> list[dict[str, Any]]:
         """Fetch chunks by id."""
@@ -12,7 +12,7 @@ def test_generate_content_pack_empty_sheet():
     assert "comparison_bullets" in pack
     assert "constraints" in pack
     assert "schema_org_skeleton" in pack
-    assert "schema_org_json" in pack
+    assert "schema_org_json" not in pack
     assert len(pack["page_outline"]) >= 5
 
 
@@ -0,0 +1,82 @@
+"""Tests for the drafts stores."""
+
+import json
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pda.drafts.store import FileDraftsStore, PostgresDraftsStore, _atomic_write_bytes
+
+
+def _index(tmp_path) -> dict:
+    path = tmp_path / "drafts" / "index.json"
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def test_save_and_get_latest(tmp_path):
+    store = FileDraftsStore(tmp_path)
+    draft_id = store.save("p1", "h", "neutral", "medium", "engineer", {"faq": ["é"]})
+    assert store.get_latest("p1") == {"faq": ["é"]}
+    assert _index(tmp_path) == {"p1": draft_id}
+    assert store.get_latest("missing") is None
+
+
+def test_index_flush_is_deferred(tmp_path):
+    store = FileDraftsStore(tmp_path, flush_every=3)
+    store.save("p1", "h", "neutral", "medium", "engineer", {})
+    store.save("p2", "h", "neutral", "medium", "engineer", {})
+    assert _index(tmp_path) == {}
+    store.save("p3", "h", "neutral", "medium", "engineer", {})
+    assert set(_index(tmp_path)) == {"p1", "p2", "p3"}
+
+    store.save("p4", "h", "neutral", "medium", "engineer", {})
+    store.flush()
+    assert "p4" in _index(tmp_path)
+    assert not list((tmp_path / "drafts").glob("*.tmp"))
+
+
+def test_save_many_writes_index_once(tmp_path):
+    store = FileDraftsStore(tmp_path, flush_every=100)
+    ids = store.save_many([
+        ("p1", "h", "neutral", "medium", "engineer", {"a": 1}),
+        ("p2", "h", "neutral", "medium", "engineer", {"b": 2}),
+    ])
+    assert _index(tmp_path) == {"p1": ids[0], "p2": ids[1]}
+    assert FileDraftsStore(tmp_path).get_latest("p2") == {"b": 2}
+
+
+def test_concurrent_atomic_writes_never_tear(tmp_path):
+    path = tmp_path / "index.json"
+    payloads = [json.dumps({"writer": i, "pad": "x" * 50_000}).encode() for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda data: [_atomic_write_bytes(path, data) for _ in range(20)], payloads))
+    assert path.read_bytes() in payloads
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_postgres_store_closes_pool_when_database_unreachable(monkeypatch):
+    class _Pool:
+        instances = []
+
+        def __init__(self, conninfo, **kwargs):
+            self.kwargs = kwargs
+            self.open_timeout = None
+            self.closed = False
+            self.instances.append(self)
+
+        def open(self, wait=False, timeout=30.0):
+            self.open_timeout = timeout
+            raise TimeoutError("pool initialization incomplete")
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setitem(sys.modules, "psycopg_pool", types.SimpleNamespace(ConnectionPool=_Pool))
+    with pytest.raises(TimeoutError):
+        PostgresDraftsStore("postgresql://unreachable/db")
+    pool = _Pool.instances[0]
+    assert pool.kwargs["open"] is False
+    assert pool.open_timeout < 30.0
+    assert pool.closed
@@ -9,11 +9,13 @@ import yaml
 from pda.eval.harness import (
     EvalPrompt,
     EvalResult,
+    _analyze_citations,
     _deterministic_citation_coverage,
     _write_csv,
     _write_dashboard,
     _write_json,
     load_prompts,
+    run_eval_harness,
 )
 
 
@@ -72,6 +74,13 @@ class TestCitationCoverage:
     def test_empty_answer(self):
         assert _deterministic_citation_coverage("", []) == 0.0
 
+    def test_analyze_citations_returns_ids_and_coverage(self):
+        answer = "Weight is 2.5 kg [pdf-p1-c0]. Range is wide [url-a] [pdf-p1-c0]. No cite here."
+        ids, coverage = _analyze_citations(answer)
+        assert ids == ["pdf-p1-c0", "url-a"]
+        assert coverage == 2 / 3
+        assert _analyze_citations("No citations at all.") == ([], 0.0)
+
 
 class TestOutputWriters:
 
@@ -132,3 +141,64 @@ class TestOutputWriters:
         _write_dashboard([], path)
         assert path.exists()
         assert "No results" in path.read_text(encoding="utf-8")
+
+
+class _FakeStore:
+    def query(self, query_text, n_results=10):
+        return [{"chunk_id": "pdf-p1-c0", "text": "Weight 2.5 kg."}]
+
+
+class _FakeLLM:
+    def complete(self, prompt):
+        if "evaluation judge" in prompt:
+            return '{"completeness": 7, "correctness": 8, "citation_coverage": 10, "rationale": "ok"}'
+        return "It weighs 2.5 kg [pdf-p1-c0]."
+
+
+class TestRunEvalHarness:
+
+    def test_results_keep_prompt_order(self, tmp_path):
+        data = [{"id": f"q{i}", "category": "specs", "prompt": f"Question {i}?"} for i in range(6)]
+        yaml_path = tmp_path / "prompts.yaml"
+        yaml_path.write_text(yaml.dump(data), encoding="utf-8")
+
+        results = run_eval_harness(yaml_path, _FakeStore(), _FakeLLM(), tmp_path / "out", max_workers=3)
+
+        assert [r.prompt_id for r in results] == [f"q{i}" for i in range(6)]
+        assert results[0].cited_chunk_ids == ["pdf-p1-c0"]
+        assert results[0].citation_coverage == 10
+        assert (tmp_path / "out" / "dashboard.html").exists()
+
+    def test_llm_cache_skips_repeated_prompts(self, tmp_path):
+        class _CountingLLM(_FakeLLM):
+            calls = 0
+
+            def complete(self, prompt):
+                type(self).calls += 1
+                return super().complete(prompt)
+
+        data = [{"id": f"q{i}", "prompt": "Same question?"} for i in range(3)]
+        yaml_path = tmp_path / "prompts.yaml"
+        yaml_path.write_text(yaml.dump(data), encoding="utf-8")
+
+        def _run(**kwargs):
+            return run_eval_harness(yaml_path, _FakeStore(), _CountingLLM(), tmp_path / "out", **kwargs)
+
+        _run(max_workers=1, use_llm_cache=True, llm_model="fake:v1")
+        assert _CountingLLM.calls == 2  # one answer + one judge call, reused for q1 and q2
+
+        results = _run(use_llm_cache=True, llm_model="fake:v1")
+        assert _CountingLLM.calls == 2  # re-run served from out/.llm_cache
+        assert results[2].correctness == 8
+
+        _run(use_llm_cache=True, llm_model="fake:v2")
+        assert _CountingLLM.calls == 4  # another model gets its own entries
+
+        _run()  # caching is opt-in
+        assert _CountingLLM.calls == 10
+
+    def test_llm_cache_requires_model(self, tmp_path):
+        with pytest.raises(ValueError):
+            run_eval_harness(
+                tmp_path / "prompts.yaml", _FakeStore(), _FakeLLM(), tmp_path / "out", use_llm_cache=True,
+            )
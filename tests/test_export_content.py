@@ -0,0 +1,56 @@
+"""Tests for the web content zip export."""
+
+import io
+import zipfile
+
+from pda.content_pack.export_content import build_content_zip, iter_content_files
+from pda.schemas.web_content_schemas import (
+    ComparisonDraft,
+    ComparisonDimension,
+    EvidenceRef,
+    FAQItem,
+    LandingPageDraft,
+    UseCasePageDraft,
+    WebContentDrafts,
+)
+
+
+def _drafts() -> WebContentDrafts:
+    ev = EvidenceRef(chunk_ids=["c1"], source_file="brochure.pdf", page_numbers=[2])
+    return WebContentDrafts(
+        landing_page=LandingPageDraft(problem_statement="Humidity drift costs money."),
+        faq=[FAQItem(question="What is it?", answer="A transmitter.", evidence=[ev])],
+        use_case_pages=[UseCasePageDraft(title="Clean Rooms", evidence=[ev])],
+        comparisons=[
+            ComparisonDraft(
+                title="Vs Handheld Meters",
+                dimensions=[ComparisonDimension(dimension="Accuracy", evidence=[ev])],
+            )
+        ],
+    )
+
+
+def test_iter_content_files_paths():
+    paths = [path for path, _ in iter_content_files(_drafts())]
+    assert paths == [
+        "drafts.json",
+        "landing-page.md",
+        "faq.md",
+        "use-cases/clean-rooms.md",
+        "comparisons/vs-handheld-meters.md",
+        "seo.json",
+    ]
+
+
+def test_build_content_zip_matches_iterator():
+    drafts = _drafts()
+    zf = zipfile.ZipFile(io.BytesIO(build_content_zip(drafts)))
+    assert {n: zf.read(n) for n in zf.namelist()} == dict(iter_content_files(drafts))
+    faq = zf.read("faq.md").decode("utf-8")
+    assert "brochure.pdf | p. 2 | [c1]" in faq
+    assert "## What is it?" in faq
+
+
+def test_build_content_zip_uncompressed():
+    zf = zipfile.ZipFile(io.BytesIO(build_content_zip(_drafts(), compress=False)))
+    assert all(info.compress_type == zipfile.ZIP_STORED for info in zf.infolist())
@@ -1 +1,41 @@
-"""Tests for fact extractor. Implemented in step 6."""
+"""Tests for fact extractor."""
+
+import json
+
+from pda.extract.fact_extractor import extract_fact_sheet
+from pda.schemas.models import ChunkSource, ContentRole, DocumentChunk
+
+
+def _chunk(cid: str, text: str, role: ContentRole) -> DocumentChunk:
+    return DocumentChunk(
+        chunk_id=cid, source_type=ChunkSource.PDF, source_file="spec.pdf",
+        page_number=1, text=text, content_role=role,
+    )
+
+
+class _RecordingLLM:
+    def __init__(self):
+        self.prompt = ""
+
+    def complete(self, prompt):
+        self.prompt = prompt
+        return "```json\n" + json.dumps({
+            "product_name": {"value": "HMT330", "confidence": "HIGH",
+                             "chunk_ids": ["pdf-p1-c1"], "verbatim_excerpt": "HMT330"},
+        }) + "\n```"
+
+
+def test_buyer_chunks_packed_first_within_budget():
+    chunks = [
+        _chunk("pdf-p1-c0", "o" * 40, ContentRole.OPERATIONAL),
+        _chunk("pdf-p1-c1", "b" * 40, ContentRole.BUYER),
+        _chunk("pdf-p1-c2", "b" * 40, ContentRole.BUYER),
+    ]
+    llm = _RecordingLLM()
+    sheet = extract_fact_sheet(chunks, llm, max_chars=100)
+
+    assert llm.prompt.index("[pdf-p1-c1]") < llm.prompt.index("[pdf-p1-c2]")
+    assert "[pdf-p1-c0]" not in llm.prompt  # operational chunk no longer fits
+    assert sheet.product_name.value == "HMT330"
+    assert sheet.product_name.evidence[0].source_file == "spec.pdf"
+    assert sheet.manufacturer.value == "NOT_FOUND"
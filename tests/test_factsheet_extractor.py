@@ -1,6 +1,8 @@
 """Tests for Product Fact Sheet extraction: schema, evidence validation, extraction flow."""
 
+import asyncio
 import json
+import re
 from pathlib import Path
 
 import pytest
@@ -12,14 +14,28 @@ from pda.schemas.factsheet_schema import (
     Differentiator,
 )
 from pda.extract.factsheet_extractor import (
+    SECTION_QUERIES,
+    clear_sheet_cache,
     extract_product_fact_sheet,
+    extract_product_fact_sheet_async,
+    extract_product_fact_sheets_async,
+    extract_product_fact_sheets_batch,
     require_evidence_for_non_not_found,
+    _decode_fact_sheet,
     _parse_json,
     _validate_fact_sheet,
     _build_provenance,
+    _chunks_from_store,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_sheet_cache():
+    clear_sheet_cache()
+    yield
+    clear_sheet_cache()
+
+
 # --- Schema and validation ---
 
 
@@ -167,6 +183,19 @@ def test_validate_fact_sheet_normalizes():
     assert len(sheet.constraints) == 1 and sheet.constraints[0].evidence_chunk_ids == ["id2"]
 
 
+def test_decode_fact_sheet_matches_lenient_validation():
+    well_formed = {
+        "product_name": "Test",
+        "key_specs": [{"name": "N", "value": "V", "evidence_chunk_ids": ["id1", "id1"]}],
+        "constraints": [{"statement": "S", "evidence_chunk_ids": ["id2"]}],
+    }
+    loose = {"product_name": None, "key_specs": [{"name": 3, "evidence_chunk_ids": None}], "differentiators": "x"}
+    for data in (well_formed, loose):
+        sheet, provenance = _decode_fact_sheet("```json\n" + json.dumps(data) + "\n```")
+        assert sheet == _validate_fact_sheet(data)
+        assert provenance == _build_provenance(sheet)
+
+
 def test_build_provenance():
     sheet = ProductFactSheet(
         product_name="X",
@@ -195,6 +224,64 @@ class MockStore:
         return list(self._chunks.values())
 
 
+class MockBatchStore(MockStore):
+    def __init__(self, chunks):
+        super().__init__(chunks)
+        self.batches: list[list[str]] = []
+
+    def query(self, query_text: str, n_results: int = 10, where=None):
+        raise AssertionError("query_batch should be used")
+
+    def query_batch(self, query_texts, n_results: int = 10, where=None):
+        self.batches.append(list(query_texts))
+        return [list(self._chunks.values()) for _ in query_texts]
+
+
+def test_chunks_from_store_uses_query_batch():
+    store = MockBatchStore([{"chunk_id": "c1", "text": "a"}, {"chunk_id": "c2", "text": "b"}])
+    chunks = _chunks_from_store(store, SECTION_QUERIES)
+    assert store.batches == [SECTION_QUERIES]
+    assert chunks == [{"chunk_id": "c1", "text": "a"}, {"chunk_id": "c2", "text": "b"}]
+
+
+def test_chunks_from_store_drops_near_duplicate_texts():
+    boilerplate = "Operating temperature range is -40 to +60 C for all transmitter models in this series"
+    store = MockStore([
+        {"chunk_id": "pdf-p1-c0", "text": boilerplate},
+        {"chunk_id": "pdf-p2-c0", "text": "Supply voltage 24 VDC."},
+        {"chunk_id": "pdf-p3-c0", "text": boilerplate.upper() + "."},
+        {"chunk_id": "pdf-p4-c0", "text": boilerplate + " except HMT338"},
+    ])
+    chunks = _chunks_from_store(store, SECTION_QUERIES[:1])
+    assert [c["chunk_id"] for c in chunks] == ["pdf-p1-c0", "pdf-p2-c0", "pdf-p4-c0"]
+
+
+def test_chunks_from_store_keeps_variant_spec_tables():
+    table = (
+        "Specifications: Max flow {} l/min, Operating pressure 10 bar, Wetted parts stainless steel 316L, "
+        "Process connection G 1/2, Output 4-20 mA, Supply voltage 24 VDC, Enclosure IP67, "
+        "Display optional, Mounting wall or pipe, Weight 1.2 kg"
+    )
+    store = MockStore([
+        {"chunk_id": "pdf-p1-c0", "text": "Model FX-12 " + table.format(12)},
+        {"chunk_id": "pdf-p2-c0", "text": "Model FX-18 " + table.format(18)},
+        {"chunk_id": "pdf-p3-c0", "text": "model fx-12 " + table.format(12) + "."},
+    ])
+    chunks = _chunks_from_store(store, SECTION_QUERIES[:1])
+    assert [c["chunk_id"] for c in chunks] == ["pdf-p1-c0", "pdf-p2-c0"]
+
+
+def test_chunks_from_store_drops_identical_texts_under_other_ids():
+    store = MockStore([
+        {"chunk_id": "pdf-p1-c0", "text": "Weight: 2.5 kg"},
+        {"chunk_id": "pdf-p1-c1", "text": "---"},
+        {"chunk_id": "pdf-p2-c0", "text": "Weight:  2.5 kg\n"},
+        {"chunk_id": "pdf-p2-c1", "text": "---"},
+    ])
+    chunks = _chunks_from_store(store, SECTION_QUERIES[:1])
+    assert [c["chunk_id"] for c in chunks] == ["pdf-p1-c0", "pdf-p1-c1"]
+
+
 def test_extract_product_fact_sheet_valid_json():
     """Extraction returns valid ProductFactSheet and provenance when LLM returns valid JSON."""
     chunks = [
@@ -257,6 +344,48 @@ def test_extract_product_fact_sheet_retry_on_invalid_json():
     assert call_count[0] == 2
 
 
+def test_extract_product_fact_sheet_requests_schema_when_supported():
+    """Providers advertising response_format support get the fact-sheet JSON schema."""
+    store = MockStore([{"chunk_id": "pdf-p1-c0", "text": "Product Delta."}])
+
+    class StructuredLLM:
+        supports_response_format = True
+
+        def __init__(self):
+            self.kwargs = []
+
+        def complete(self, prompt: str, **kwargs) -> str:
+            self.kwargs.append(kwargs)
+            return json.dumps({"product_name": "Product Delta"})
+
+    llm = StructuredLLM()
+    sheet, _ = extract_product_fact_sheet(store, llm)
+    assert sheet.product_name == "Product Delta"
+    assert len(llm.kwargs) == 1
+    schema = llm.kwargs[0]["response_format"]["json_schema"]["schema"]
+    assert "key_specs" in schema["properties"]
+
+
+def test_extract_product_fact_sheet_marks_cacheable_chunk_prefix():
+    store = MockStore([{"chunk_id": "pdf-p1-c0", "text": "Product Theta."}])
+    calls = []
+
+    class CachingLLM:
+        supports_prompt_cache = True
+
+        def complete(self, prompt: str, **kwargs) -> str:
+            calls.append((prompt, kwargs))
+            if len(calls) == 1:
+                return "not json"
+            return json.dumps({"product_name": "Product Theta"})
+
+    extract_product_fact_sheet(store, CachingLLM())
+    prompt, kwargs = calls[0]
+    prefix = kwargs["prompt_cache_prefix"]
+    assert prompt.startswith(prefix) and prefix.rstrip().endswith("Product Theta.")
+    assert "prompt_cache_prefix" not in calls[1][1]  # the fix-JSON prompt does not share it
+
+
 def test_extract_product_fact_sheet_raises_after_max_retries():
     """Raises after max retries if JSON never valid."""
     chunks = [{"chunk_id": "pdf-p1-c0", "text": "x"}]
@@ -268,3 +397,156 @@ def test_extract_product_fact_sheet_raises_after_max_retries():
 
     with pytest.raises(ValueError, match="Could not produce valid"):
         extract_product_fact_sheet(store, MockLLM(), max_retries=1)
+
+
+def test_extract_product_fact_sheet_reuses_cached_sheet():
+    store = MockStore([{"chunk_id": "pdf-p1-c0", "text": "Product Epsilon."}])
+    calls = [0]
+
+    class MockLLM:
+        def complete(self, prompt: str) -> str:
+            calls[0] += 1
+            return json.dumps({"product_name": "Product Epsilon", "key_specs": []})
+
+    first, _ = extract_product_fact_sheet(store, MockLLM(), cache_ttl=300, llm_model="mock-1")
+    second, provenance = extract_product_fact_sheet(store, MockLLM(), cache_ttl=300, llm_model="mock-1")
+    assert calls[0] == 1
+    assert second == first
+    assert "key_specs" in provenance
+    extract_product_fact_sheet(store, MockLLM(), cache_ttl=300, llm_model="mock-2")
+    assert calls[0] == 2  # another model does not share entries
+    extract_product_fact_sheet(store, MockLLM())
+    assert calls[0] == 3  # caching is opt-in
+    clear_sheet_cache()
+    extract_product_fact_sheet(store, MockLLM(), cache_ttl=300, llm_model="mock-1")
+    assert calls[0] == 4
+
+
+def test_extract_product_fact_sheet_cache_requires_model():
+    store = MockStore([{"chunk_id": "pdf-p1-c0", "text": "Product Epsilon."}])
+    with pytest.raises(ValueError, match="llm_model"):
+        extract_product_fact_sheet(store, object(), cache_ttl=300)
+
+
+class StreamingLLM:
+    """Streams each response in small pieces and records how far it was read."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.read: list[str] = []
+
+    def complete(self, prompt: str) -> str:
+        raise AssertionError("stream should be used")
+
+    def stream(self, prompt: str):
+        text = self.responses.pop(0)
+        self.read.append("")
+        for i in range(0, len(text), 4):
+            self.read[-1] += text[i:i + 4]
+            yield text[i:i + 4]
+
+
+def test_extract_product_fact_sheet_stops_stream_when_json_closes():
+    store = MockStore([{"chunk_id": "pdf-p1-c0", "text": "Product Zeta."}])
+    body = json.dumps({"product_name": "Product Zeta", "key_specs": []})
+    llm = StreamingLLM(["```json\n" + body + "\n```\n" + "trailing commentary " * 20])
+    sheet, _ = extract_product_fact_sheet(store, llm)
+    assert sheet.product_name == "Product Zeta"
+    assert len(llm.read[0]) < len(body) + 20
+
+
+def test_extract_product_fact_sheet_abandons_non_json_stream():
+    store = MockStore([{"chunk_id": "pdf-p1-c0", "text": "Product Eta."}])
+    llm = StreamingLLM([
+        "I am sorry, " * 50,
+        json.dumps({"product_name": "Product Eta"}),
+    ])
+    sheet, _ = extract_product_fact_sheet(store, llm)
+    assert sheet.product_name == "Product Eta"
+    assert len(llm.read[0]) == 4
+
+
+class BatchLLM:
+    """Answers packed prompts for every document except ``skip``; single prompts by chunk text."""
+
+    def __init__(self, skip=()):
+        self.skip = set(skip)
+        self.prompts: list[str] = []
+
+    def complete(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        names = re.findall(r"\] *\n(Product \w+)\.", prompt)
+        if "one entry per document" in prompt:
+            doc_ids = re.findall(r"## Document (doc-\d+)", prompt)
+            return json.dumps([
+                {"doc_id": doc_id, "fact_sheet": {"product_name": name}}
+                for doc_id, name in zip(doc_ids, names) if doc_id not in self.skip
+            ])
+        return json.dumps({"product_name": names[0] + " (single)"})
+
+
+def test_extract_product_fact_sheets_batch_packs_documents():
+    stores = [MockStore([{"chunk_id": "pdf-p1-c0", "text": f"Product B{i}."}]) for i in range(3)]
+    llm = BatchLLM()
+    results = extract_product_fact_sheets_batch(stores, llm, batch_size=2)
+    assert [sheet.product_name for sheet, _ in results] == ["Product B0", "Product B1", "Product B2 (single)"]
+    assert "key_specs" in results[0][1]
+    assert len(llm.prompts) == 2  # one packed call for B0+B1, one single call for B2
+
+
+def test_extract_product_fact_sheets_batch_falls_back_for_missing_document():
+    stores = [MockStore([{"chunk_id": "pdf-p1-c0", "text": f"Product C{i}."}]) for i in range(2)]
+    results = extract_product_fact_sheets_batch(stores, BatchLLM(skip={"doc-2"}))
+    assert [sheet.product_name for sheet, _ in results] == ["Product C0", "Product C1 (single)"]
+
+
+def test_extract_product_fact_sheet_async_matches_sync():
+    store = MockStore([{"chunk_id": "pdf-p1-c0", "text": "Product Gamma."}])
+
+    prompts = []
+
+    class MockLLM:
+        def complete(self, prompt: str) -> str:
+            prompts.append(prompt)
+            return json.dumps({"product_name": "Product Gamma", "key_specs": []})
+
+    async def run_two():
+        return await asyncio.gather(
+            extract_product_fact_sheet_async(store, MockLLM(), cache_ttl=0),
+            extract_product_fact_sheet_async(store, MockLLM(), cache_ttl=0),
+        )
+
+    (sheet_a, prov_a), (sheet_b, _) = asyncio.run(run_two())
+    assert len(prompts) == 2
+    sync_sheet, sync_prov = extract_product_fact_sheet(store, MockLLM(), cache_ttl=0)
+    assert len(prompts) == 3  # every path reached the LLM; nothing came from the sheet cache
+    assert prompts[0] == prompts[1] == prompts[2]
+    assert sheet_a == sheet_b == sync_sheet
+    assert prov_a == sync_prov
+    assert sheet_a.product_name == "Product Gamma"
+    assert "key_specs" in prov_a
+
+
+def test_extract_product_fact_sheets_async_bounds_concurrency():
+    stores = [MockStore([{"chunk_id": "pdf-p1-c0", "text": f"Product A{i}."}]) for i in range(6)]
+
+    class AsyncLLM:
+        def __init__(self):
+            self.in_flight = 0
+            self.peak = 0
+
+        def complete(self, prompt: str) -> str:
+            raise AssertionError("acomplete should be used")
+
+        async def acomplete(self, prompt: str) -> str:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            name = re.search(r"(Product A\d)\.", prompt).group(1)
+            return json.dumps({"product_name": name})
+
+    llm = AsyncLLM()
+    results = asyncio.run(extract_product_fact_sheets_async(stores, llm, concurrency=2))
+    assert [sheet.product_name for sheet, _ in results] == [f"Product A{i}" for i in range(6)]
+    assert llm.peak == 2
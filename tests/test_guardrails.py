@@ -0,0 +1,42 @@
+"""Tests for the draft guardrail text scanner."""
+
+import pytest
+
+from pda.guardrails import _clean_text_field
+
+
+# Input, then the cleaned text and warning snippets the sequential
+# numeric / IP / certification / pricing passes produced before they were
+# fused into one scan.
+SEQUENTIAL_PASS_CASES = [
+    ("Rated UL 100 W max", "Rated [certification not verified] [refer to datasheet] max", ["100 W", "UL"]),
+    ("Meets EN 50 mm flange spec", "Meets EN [refer to datasheet] flange spec", ["50 mm"]),
+    ("API 5 bar rating", "API [refer to datasheet] rating", ["5 bar"]),
+    ("Certified to IEC 61010-1 230 V", "Certified to [certification not verified] [refer to datasheet]",
+     ["230 V", "IEC 61010-1"]),
+    ("Functional safety SIL 2 W", "Functional safety SIL [refer to datasheet]", ["2 W"]),
+    ("MIL-STD-810 5 g shock", "[certification not verified] [refer to datasheet] shock", ["5 g", "MIL-STD-810"]),
+    ("IEC 61508 IP65 enclosure", "[certification not verified] [refer to datasheet] enclosure", ["IP65", "IEC 61508"]),
+    ("ISO 9001 -40 to 60 °C", "[certification not verified] -[refer to datasheet]", ["40 to 60 °C", "ISO 9001"]),
+    ("Costs 5 W at idle", "Costs [refer to datasheet] at idle", ["5 W"]),
+    ("Priced at $5 per unit", "[pricing not verified] per unit", ["Priced at $5"]),
+    ("IP67 % humidity", "IP[refer to datasheet] humidity", ["67 %"]),
+    ("UL5 mA", "[certification not verified][refer to datasheet]", ["5 mA", "UL"]),
+]
+
+
+@pytest.mark.parametrize("text, cleaned, snippets", SEQUENTIAL_PASS_CASES)
+def test_fused_scan_matches_sequential_passes(text, cleaned, snippets):
+    warnings = []
+    assert _clean_text_field(text, "f", {}, set(), "acme", "", warnings) == cleaned
+    assert [w.original_snippet for w in warnings] == snippets
+
+
+def test_grounded_values_are_kept():
+    warnings = []
+    text = "Rated UL 100 W max, certified to ISO 9001, priced at $5"
+    cleaned = _clean_text_field(
+        text, "f", {"100 w": "100w"}, {"ul", "iso 9001"}, "acme", "priced at $5", warnings,
+    )
+    assert cleaned == text
+    assert warnings == []
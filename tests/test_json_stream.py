@@ -0,0 +1,57 @@
+"""Tests for incremental / truncated JSON parsing of LLM output."""
+
+import json
+
+from pda.content_pack._json_stream import IncrementalJsonParser, parse_partial
+from pda.content_pack.rag_generator import _parse_items
+
+
+DOC = [
+    {"question": "Is it \"rated\" [IP65]?", "answer": "Yes {sealed}.", "n": [1, 2.5e3, True, None]},
+    "plain",
+    -3,
+    {"nested": {}},
+    [],
+]
+
+
+def test_feed_yields_array_items_as_they_close():
+    text = json.dumps(DOC)
+    parser = IncrementalJsonParser()
+    items = []
+    for i in range(0, len(text), 5):
+        items.extend(parser.feed(text[i:i + 5]))
+    assert items == DOC
+    assert parser.complete
+    assert parser.end == len(text)
+    assert parser.value() == DOC
+
+
+def test_end_marks_close_of_top_level_value():
+    parser = IncrementalJsonParser()
+    parser.feed('{"a": [1, 2]')
+    assert parser.end is None
+    parser.feed('}\n```')
+    assert parser.complete
+    assert parser.end == len('{"a": [1, 2]}')
+
+
+def test_parse_partial_keeps_complete_leading_items():
+    assert parse_partial('[{"a": 1}, {"b": "trunc') == [{"a": 1}]
+    assert parse_partial('[1, 2, 3') == [1, 2]
+    assert parse_partial('{"landing": {"x": "y"}, "seo": {"t') == {"landing": {"x": "y"}}
+    assert parse_partial('[{"a": 1}, {"b": [{"c": 1}, {"d') == [{"a": 1}]
+
+
+def test_parse_partial_every_prefix_is_valid_or_none():
+    text = json.dumps(DOC)
+    for cut in range(len(text)):
+        value = parse_partial(text[:cut])
+        assert value is None or isinstance(value, list)
+    assert parse_partial(text) == DOC
+
+
+def test_parse_items_recovers_truncated_response():
+    raw = '```json\n[{"item_id": "faq-1", "body": "ok"}, {"item_id": "faq-2", "bo'
+    assert _parse_items(raw) == [{"item_id": "faq-1", "body": "ok"}]
+    assert _parse_items("not json") == []
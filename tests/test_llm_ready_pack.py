@@ -20,6 +20,8 @@ from pda.schemas.llm_ready_pack import (
     UseCasePage,
 )
 from pda.content_pack.llm_ready_pack import (
+    _strip_code_fence,
+    generate_content_pack,
     run_preflight,
     write_content_pack_bundle,
 )
@@ -190,6 +192,13 @@ class TestPreflight:
         assert "key_specs" in result.missing_fields
         assert "primary_use_cases" in result.missing_fields
 
+    def test_missing_fields_ordered_critical_first(self, minimal_factsheet):
+        result = run_preflight(minimal_factsheet)
+        assert result.missing_fields[:4] == [
+            "product_name", "product_category", "key_specs", "primary_use_cases",
+        ]
+        assert [q.field for q in result.questions] == result.missing_fields[:7]
+
 
 # ---------------------------------------------------------------------------
 # Schema tests
@@ -306,6 +315,13 @@ class TestExportBundle:
         assert "pdf-p1-c0" in cab_md
         assert "**Sources:**" in cab_md
 
+    def test_markdown_files_end_after_last_line(self, sample_bundle, tmp_path):
+        written = write_content_pack_bundle(sample_bundle, tmp_path / "output")
+        sg_md = Path(written["selection_guidance.md"]).read_text(encoding="utf-8")
+        assert sg_md.endswith("## Missing Information\n\n- Pricing comparison not available\n")
+        uc_md = Path(written["usecase_uc-0.md"]).read_text(encoding="utf-8")
+        assert uc_md.endswith("\n\n**Page sources:** pdf-p1-c0, test.pdf, p.1\n")
+
     def test_faq_grouped_by_theme(self, sample_bundle, tmp_path):
         written = write_content_pack_bundle(sample_bundle, tmp_path / "output")
         faq_md = Path(written["faq.md"]).read_text(encoding="utf-8")
@@ -347,6 +363,140 @@ class TestExportBundle:
         assert "FAQs" in uc_md
 
 
+# ---------------------------------------------------------------------------
+# Generation tests (fake store + fake LLM)
+# ---------------------------------------------------------------------------
+
+class _FakeStore:
+    def __init__(self):
+        self.queries: list[str] = []
+        self.batch_calls = 0
+
+    def query(self, query_text, n_results=10, where=None):
+        self.queries.append(query_text)
+        return [
+            {
+                "chunk_id": "pdf-p1-c0",
+                "text": "HMT330 measures humidity with ±1 %RH accuracy.",
+                "metadata": {"source_file": "hmt330.pdf", "page_number": 1},
+            },
+            {
+                "chunk_id": "pdf-p2-c0",
+                "text": "Mount on a wall or duct.",
+                "metadata": {"source_file": "hmt330.pdf", "page_number": -1},
+            },
+        ]
+
+    def query_batch(self, query_texts, n_results=10, where=None):
+        self.batch_calls += 1
+        return [self.query(q, n_results=n_results) for q in query_texts]
+
+
+class _FakeLLM:
+    _RESPONSES = {
+        "Canonical Answer Blocks": [
+            {"block_id": "cab-0", "question": "What is it?", "answer": "A transmitter [pdf-p1-c0].",
+             "best_for": "Industry", "not_suitable_when": "Consumer", "cited_chunk_ids": ["pdf-p1-c0"]},
+        ],
+        "Product-page FAQ": [
+            {"faq_id": "faq-0", "theme": "installation", "question": "How do I mount it?",
+             "answer": "On a wall [pdf-p2-c0].", "cited_chunk_ids": []},
+        ],
+        "Selection Guidance": {
+            "decision_criteria": [{"criterion_id": "dc-0", "statement": "Needs accuracy [pdf-p1-c0]."}],
+            "comparison_table": [{"variant": "HMT331", "attributes": {"range_rh": 100, "probe": None}}],
+            "decision_tree_md": "",
+            "missing_info": ["Pricing"],
+            "cited_chunk_ids": ["pdf-p1-c0"],
+        },
+        "Use-case Pages": [
+            {"page_id": "uc-0", "title": "Pharma", "problem_context": "Tight control [pdf-p1-c0].",
+             "requirements": "", "why_this_product_fits": "Accuracy [pdf-p1-c0].",
+             "implementation_notes": "Duct [pdf-p2-c0].", "faqs": [], "cited_chunk_ids": []},
+        ],
+    }
+
+    def complete(self, prompt, **kwargs):
+        for marker, payload in self._RESPONSES.items():
+            if f"Generate {marker}" in prompt or f"Generate a comprehensive {marker}" in prompt:
+                return "```json\n" + json.dumps(payload) + "\n```"
+        return ""
+
+
+class TestGenerateContentPack:
+
+    def test_generates_all_sections_with_citations(self, complete_factsheet):
+        store = _FakeStore()
+        bundle = generate_content_pack(store, _FakeLLM(), complete_factsheet, tone="technical")
+
+        assert store.queries
+        assert [b.block_id for b in bundle.canonical_answers] == ["cab-0"]
+        assert bundle.faq[0].citations[0].chunk_id == "pdf-p2-c0"
+        assert bundle.faq[0].citations[0].page_num is None
+        assert bundle.selection_guidance.decision_criteria[0].citations[0].page_num == 1
+        assert bundle.selection_guidance.missing_info == ["Pricing"]
+        row = bundle.selection_guidance.comparison_table[0]
+        assert row.attributes == {"range_rh": "100", "probe": ""}
+        page = bundle.use_case_pages[0]
+        assert [c.chunk_id for c in page.citations] == ["pdf-p1-c0", "pdf-p2-c0"]
+        assert page.citations[0].source_ref == "hmt330.pdf"
+
+    def test_sections_share_one_batched_query(self, complete_factsheet):
+        store = _FakeStore()
+        bundle = generate_content_pack(store, _FakeLLM(), complete_factsheet)
+        assert store.batch_calls == 1  # all sections share one retrieval pass
+        assert len(store.queries) == len(set(store.queries))
+        assert bundle.faq[0].citations[0].chunk_id == "pdf-p2-c0"
+
+    def test_retrieval_cache_reused_until_store_changes(self, complete_factsheet, tmp_path):
+        class _FingerprintStore(_FakeStore):
+            version = "v1"
+
+            def fingerprint(self):
+                return self.version
+
+        cache_path = tmp_path / "retrieval_cache.json"
+        store = _FingerprintStore()
+        generate_content_pack(store, _FakeLLM(), complete_factsheet, retrieval_cache_path=cache_path)
+        assert cache_path.exists()
+        first_run = len(store.queries)
+
+        bundle = generate_content_pack(store, _FakeLLM(), complete_factsheet, retrieval_cache_path=cache_path)
+        assert len(store.queries) == first_run  # served from cache
+        assert bundle.faq[0].citations[0].chunk_id == "pdf-p2-c0"
+
+        store.version = "v2"
+        generate_content_pack(store, _FakeLLM(), complete_factsheet, retrieval_cache_path=cache_path)
+        assert len(store.queries) == 2 * first_run
+
+    def test_chroma_fingerprint_changes_with_chunk_text(self):
+        from pda.store.vectorstore import VectorStore
+
+        class _Collection:
+            documents = ["Range 0-100 %RH", "Mount on a wall."]
+
+            def get(self, include):
+                return {"ids": ["pdf-p1-c0", "pdf-p2-c0"], "documents": list(self.documents)}
+
+        store = VectorStore.__new__(VectorStore)
+        store._collection_name = "pda_chunks"
+        store._collection = _Collection()
+        before = store.fingerprint()
+        store._collection.documents = ["Range 0-98 %RH", "Mount on a wall."]
+        assert store.fingerprint() != before  # same positional ids, revised text
+
+    def test_blocked_preflight_skips_generation(self, minimal_factsheet):
+        store = _FakeStore()
+        bundle = generate_content_pack(store, _FakeLLM(), minimal_factsheet)
+        assert bundle.preflight.can_generate is False
+        assert store.queries == []
+        assert bundle.canonical_answers == []
+
+    def test_strip_code_fence(self):
+        assert _strip_code_fence('  {"a": 1}\n') == '{"a": 1}'
+        assert _strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+
+
 # ---------------------------------------------------------------------------
 # Synthetic PDF generation test (ensure conftest generates them)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,202 @@
+"""Tests for the web-content generator: retrieval, section generation, and grounding."""
+
+import json
+import re
+
+import pytest
+
+from pda.schemas.factsheet_schema import KeySpec, ProductFactSheet
+from pda.content_pack.web_content_generator import (
+    _extract_inline_cites,
+    _inline_cite_extractor,
+    _SECTION_QUERIES,
+    generate_web_content,
+    generate_web_content_batch,
+    load_factsheet,
+)
+
+
+class _FakeStore:
+    def __init__(self):
+        self.queries: list[str] = []
+        self.batch_calls = 0
+
+    def query(self, query_text, n_results=10, where=None):
+        self.queries.append(query_text)
+        return [
+            {
+                "chunk_id": "pdf-p1-c0",
+                "text": "HMT330 measures humidity with ±1 %RH accuracy.",
+                "metadata": {"source_file": "hmt330.pdf", "page_number": 1},
+            },
+            {
+                "chunk_id": "pdf-p2-c0",
+                "text": "Mount on a wall or duct.",
+                "metadata": {"source_file": "hmt330.pdf", "page_number": -1},
+            },
+        ]
+
+    def query_batch(self, query_texts, n_results=10, where=None):
+        self.batch_calls += 1
+        return [self.query(q, n_results=n_results) for q in query_texts]
+
+
+class _FakeLLM:
+    _RESPONSES = {
+        "landing page draft and the SEO assets": {
+            "landing": {
+                "problem_statement": "Humidity drifts.",
+                "solution_overview": "A stable transmitter.",
+                "benefits": [
+                    {"headline": "Accurate", "description": "±1 %RH [pdf-p1-c0].", "cited_chunk_ids": ["pdf-p1-c0"]},
+                ],
+                "how_it_works": "Capacitive sensing.",
+                "specs_explained": [
+                    {"spec_name": "Accuracy", "spec_value": "±1", "unit": "%RH", "plain_language": "Tight."},
+                    {"spec_name": "Range", "spec_value": "999", "unit": "%RH", "plain_language": "Invented."},
+                ],
+                "call_to_action": "Contact sales.",
+            },
+            "seo": {
+                "title_tag": "HMT330 Humidity Transmitter",
+                "meta_description": "Industrial humidity transmitter.",
+                "headings": [{"tag": "h1", "text": "HMT330"}, {"tag": "h4", "text": "Specs"}],
+                "product_jsonld": {"@type": "Product", "name": "HMT330"},
+            },
+        },
+        "FAQ as a JSON array": [
+            {"question": "How do I mount it?", "answer": "On a wall [pdf-p2-c0].", "cited_chunk_ids": []},
+        ],
+        "use-case pages as a JSON array": [
+            {"title": "Pharma", "slug": "pharma", "problem_context": "Tight control [pdf-p1-c0].",
+             "solution_fit": "Fits.", "benefits": ["Stable [pdf-p2-c0]"], "implementation_notes": ""},
+        ],
+        "generic comparison sections": [
+            {"title": "vs. manual measurement", "best_for": ["Continuous logging"], "not_ideal_for": [],
+             "dimensions": [{"dimension": "Accuracy", "this_product": "±1 %RH [pdf-p1-c0]",
+                             "generic_alternative": "manual readings"}]},
+        ],
+    }
+
+    def complete(self, prompt, **kwargs):
+        for marker, payload in self._RESPONSES.items():
+            if marker in prompt:
+                return "```json\n" + json.dumps(payload) + "\n```"
+        return ""
+
+
+@pytest.fixture
+def factsheet() -> ProductFactSheet:
+    return ProductFactSheet(
+        product_name="HMT330",
+        product_category="Humidity Transmitter",
+        primary_use_cases=["Industrial process monitoring"],
+        key_specs=[KeySpec(name="Accuracy", value="±1", unit="%RH")],
+    )
+
+
+class TestGenerateWebContent:
+
+    def test_generates_all_sections(self, factsheet):
+        drafts, metadata = generate_web_content(
+            store=_FakeStore(), llm=_FakeLLM(), sheet=factsheet, product_id="p1",
+        )
+
+        landing = drafts.landing_page
+        assert landing.benefits[0].evidence[0].chunk_ids == ["pdf-p1-c0"]
+        assert landing.benefits[0].evidence[0].page_numbers == [1]
+        # Specs not present in the fact sheet are dropped.
+        assert [s.spec_name for s in landing.specs_explained] == ["Accuracy"]
+        assert drafts.faq[0].evidence[0].chunk_ids == ["pdf-p2-c0"]
+        assert drafts.faq[0].evidence[0].page_numbers == []
+        assert [e.chunk_ids[0] for e in drafts.use_case_pages[0].evidence] == ["pdf-p1-c0", "pdf-p2-c0"]
+        assert drafts.comparisons[0].dimensions[0].evidence[0].chunk_ids == ["pdf-p1-c0"]
+        assert [h.tag for h in drafts.seo.headings] == ["h1", "h2"]
+        assert metadata.product_id == "p1"
+
+    def test_section_queries_retrieved_once(self, factsheet):
+        store = _FakeStore()
+        generate_web_content(store=store, llm=_FakeLLM(), sheet=factsheet, product_id="p1")
+
+        section_queries = [q for queries in _SECTION_QUERIES.values() for q in queries]
+        issued = [q for q in store.queries if q in section_queries]
+        assert len(issued) == len(set(issued))
+        assert set(issued) == set(section_queries)
+
+    def test_retrieval_uses_batched_queries(self, factsheet):
+        store = _FakeStore()
+        drafts, _ = generate_web_content(store=store, llm=_FakeLLM(), sheet=factsheet, product_id="p1")
+        assert store.batch_calls == 2  # section retrieval + guardrail source sample
+        assert drafts.faq[0].evidence[0].chunk_ids == ["pdf-p2-c0"]
+
+    def test_landing_and_seo_share_one_llm_call(self, factsheet):
+        class _CountingLLM(_FakeLLM):
+            calls = 0
+
+            def complete(self, prompt, **kwargs):
+                type(self).calls += 1
+                return super().complete(prompt, **kwargs)
+
+        generate_web_content(store=_FakeStore(), llm=_CountingLLM(), sheet=factsheet, product_id="p1")
+        assert _CountingLLM.calls == 4
+
+
+class _BatchLLM(_FakeLLM):
+    """Answers batched FAQ prompts for every listed product except ``skip``."""
+
+    def __init__(self, skip=()):
+        self.skip = set(skip)
+        self.prompts: list[str] = []
+
+    def complete(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        if "one FAQ per product" in prompt:
+            product_ids = re.findall(r"\(product_id: ([^)]+)\)", prompt)
+            return json.dumps([
+                {"product_id": pid, "faq": [{"question": f"What is {pid}?", "answer": "A transmitter [pdf-p1-c0]."}]}
+                for pid in product_ids if pid not in self.skip
+            ])
+        return super().complete(prompt, **kwargs)
+
+
+class TestGenerateWebContentBatch:
+
+    def test_faq_prompts_batched_across_products(self, factsheet):
+        llm = _BatchLLM()
+        items = [(_FakeStore(), factsheet, pid) for pid in ("p1", "p2", "p3")]
+        results = generate_web_content_batch(items, llm=llm, batch_size=2)
+
+        assert list(results) == ["p1", "p2", "p3"]
+        assert results["p2"][0].faq[0].question == "What is p2?"
+        assert results["p2"][0].faq[0].evidence[0].chunk_ids == ["pdf-p1-c0"]
+        assert results["p3"][0].faq[0].question == "How do I mount it?"  # batch of one
+        assert results["p1"][1].product_id == "p1"
+        # One batched FAQ call for p1+p2, one solo FAQ call for p3, three other calls each.
+        assert len(llm.prompts) == 1 + 1 + 3 * 3
+
+    def test_missing_product_falls_back_to_single_call(self, factsheet):
+        llm = _BatchLLM(skip={"p2"})
+        items = [(_FakeStore(), factsheet, pid) for pid in ("p1", "p2")]
+        results = generate_web_content_batch(items, llm=llm, batch_size=2)
+
+        assert results["p1"][0].faq[0].question == "What is p1?"
+        assert results["p2"][0].faq[0].question == "How do I mount it?"
+
+    def test_rejects_duplicate_product_ids(self, factsheet):
+        with pytest.raises(ValueError):
+            generate_web_content_batch(
+                [(_FakeStore(), factsheet, "p1"), (_FakeStore(), factsheet, "p1")], llm=_FakeLLM(),
+            )
+
+
+def test_load_factsheet_round_trip(factsheet, tmp_path):
+    path = tmp_path / "factsheet.json"
+    path.write_text(factsheet.model_dump_json(indent=2), encoding="utf-8")
+    assert load_factsheet(path) == factsheet
+
+
+def test_inline_cite_scan_skipped_when_response_has_no_cites():
+    assert _inline_cite_extractor('[{"answer": "plain"}]')("[pdf-p1-c0]") == []
+    extract = _inline_cite_extractor('[{"answer": "see [pdf-p1-c0]"}]')
+    assert extract is _extract_inline_cites
+    assert extract("see [pdf-p1-c0]") == ["pdf-p1-c0"]